@@ -0,0 +1,58 @@
+"""
+Pure-Python helpers: date ranges, description cleanup, tax brackets, locations
+and the co-worker overlap sweep.
+"""
+from .fixtures import (
+    DATE_RANGES, DESCRIPTIONS, FEDERAL_TAX_CSV, LOCATIONS, TAX_SALARIES, TAX_YEAR, StubGeocoder,
+    company_periods
+)
+from .harness import Case, benchmark
+
+@benchmark("calculators")
+def parse_date_range() -> Case:
+    from scrapers.src.bots.linkedin.utils.experience_text.experience_text import parse_date_range as parse  # pylint: disable=import-outside-toplevel
+
+    return Case(lambda: [parse(text) for text in DATE_RANGES])
+
+@benchmark("calculators")
+def remove_emojis_and_blank_lines() -> Case:
+    from scrapers.src.bots.linkedin.utils.experience_text.experience_text import remove_emojis_and_blank_lines as clean  # pylint: disable=import-outside-toplevel
+
+    return Case(lambda: [clean(text) for text in DESCRIPTIONS])
+
+def _federal_tax_calculator():
+    from scrapers.src.bots.linkedin.utils.salary_calculator.get_salary_estimate import FederalTaxCalculator  # pylint: disable=import-outside-toplevel
+
+    return FederalTaxCalculator(100_000, "2015-01-01", f"{TAX_YEAR}-01-01")
+
+@benchmark("calculators")
+def clean_federal_tax_table() -> Case:
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
+    calculator = _federal_tax_calculator()
+    raw_table = pd.read_csv(FEDERAL_TAX_CSV)
+    return Case(lambda: calculator.clean_federal_tax_csv(raw_table))
+
+@benchmark("calculators")
+def federal_tax_bracket_lookup() -> Case:
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
+    calculator = _federal_tax_calculator()
+    year_table = calculator.filter_by_year(
+        calculator.clean_federal_tax_csv(pd.read_csv(FEDERAL_TAX_CSV)), TAX_YEAR
+    )
+    return Case(lambda: [calculator.locate_tax_bracket(year_table, salary) for salary in TAX_SALARIES])
+
+@benchmark("calculators")
+def reformat_location() -> Case:
+    from scrapers.src.bots.linkedin.utils.location_formatter.location_formatter import LocationFormatter  # pylint: disable=import-outside-toplevel
+
+    formatter = LocationFormatter(geolocator=StubGeocoder())
+    return Case(lambda: [formatter.reformat_location(location) for location in LOCATIONS])
+
+@benchmark("calculators")
+def coworker_sweep() -> Case:
+    from scrapers.src.database.scripts.coworker_graph import company_edges  # pylint: disable=import-outside-toplevel
+
+    periods = list(company_periods())
+    return Case(lambda: company_edges(1, periods))
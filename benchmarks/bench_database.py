@@ -0,0 +1,139 @@
+"""
+Per-profile write cost and the profile exports against the configured PostgreSQL.
+
+These benchmarks only run with --with-db. They write a single benchmark user
+(BENCHMARK_PROFILE_URL) and delete it again afterwards, so run them against
+a local database: the [bench] profile of database.ini, selected with
+--profile bench (or PPDB_DB_PROFILE=bench). The
+exports read whatever the database holds and log how many rows they wrote,
+so only compare export timings measured on the same data.
+"""
+import logging
+import os
+import shutil
+import tempfile
+
+from .fixtures import (
+    BENCHMARK_PROFILE_URL, PROFILE_EDUCATION, PROFILE_EXPERIENCES, PROFILE_SKILLS, detached_manager
+)
+from .harness import BenchmarkSkipped, Case, benchmark
+
+PROFILE_CONTACT_INFO = ("(410) 555-0147", "ppdb.benchmark@example.com",
+                        "100 Light St, Baltimore, MD 21202", "https://example.com/ppdb-benchmark")
+
+def _connected(manager_class):
+    """Instantiate a DatabaseManager subclass, skipping the benchmark when there is no database."""
+    from scrapers.src.database.scripts.config.config import ConfigError  # pylint: disable=import-outside-toplevel
+
+    try:
+        database_manager = manager_class()
+    except (RuntimeError, ConfigError) as error:
+        raise BenchmarkSkipped(f"No database connection: {error}") from error
+    if database_manager.conn is None:
+        raise BenchmarkSkipped("No database connection, check database.ini")
+    return database_manager
+
+def _benchmark_user_id(database_manager) -> int:
+    row = database_manager.execute_query(
+        "SELECT user_id FROM users WHERE profile_url = %s", (BENCHMARK_PROFILE_URL,), fetch="ONE"
+    )
+    if row:
+        return row[0]
+    return database_manager.execute_query(
+        "INSERT INTO users (profile_url, sources) VALUES (%s, ARRAY['benchmark']) RETURNING user_id",
+        (BENCHMARK_PROFILE_URL,), fetch="ONE"
+    )[0]
+
+def _clear_profile(database_manager, user_id: int) -> None:
+    for table in ("work_experience", "education", "skills"):
+        database_manager.execute_query(f"DELETE FROM {table} WHERE user_id = %s", (user_id,))
+    database_manager.execute_query(
+        "UPDATE users SET phone_number = NULL, email = NULL, address = NULL, website = NULL "
+        "WHERE user_id = %s", (user_id,)
+    )
+
+def _profile_write_case(rewrite: bool) -> Case:
+    from scrapers.src.bots.linkedin.scripts.linkedinbot import SkillsManager  # pylint: disable=import-outside-toplevel
+    from scrapers.src.database.scripts.database_manager import ContactInfo, LinkedInDatabaseManager  # pylint: disable=import-outside-toplevel
+
+    database_manager = _connected(LinkedInDatabaseManager)
+    user_id = _benchmark_user_id(database_manager)
+    skills_manager = detached_manager(SkillsManager, database_manager=database_manager)
+    contact_info = ContactInfo(*PROFILE_CONTACT_INFO)
+
+    def write_profile():
+        database_manager.update_experiences_in_database(user_id=user_id, zipped_list=PROFILE_EXPERIENCES)
+        database_manager.update_education_in_database(PROFILE_EDUCATION, user_id)
+        database_manager.update_contact_info(contact_info, user_id)
+        skills_manager.update_skills_database(PROFILE_SKILLS, user_id)
+
+    def teardown():
+        _clear_profile(database_manager, user_id)
+        database_manager.execute_query("DELETE FROM users WHERE user_id = %s", (user_id,))
+
+    _clear_profile(database_manager, user_id)
+    if rewrite:
+        # Every section is already stored, as when an unchanged profile is scraped again
+        write_profile()
+        return Case(write_profile, teardown=teardown)
+    return Case(write_profile, before_each=lambda: _clear_profile(database_manager, user_id),
+                teardown=teardown)
+
+@benchmark("db", requires_db=True)
+def profile_write() -> Case:
+    """Write a profile that is not stored yet."""
+    return _profile_write_case(rewrite=False)
+
+@benchmark("db", requires_db=True)
+def profile_rewrite() -> Case:
+    """Write a profile whose sections are all stored already."""
+    return _profile_write_case(rewrite=True)
+
+def _export_case(extension: str) -> Case:
+    from scrapers.src.database.scripts.database_manager import ExportDatabaseManager  # pylint: disable=import-outside-toplevel
+
+    export_manager = _connected(ExportDatabaseManager)
+
+    row_count = export_manager.execute_query("SELECT COUNT(*) FROM user_profiles", fetch="ONE")[0]
+    logging.info("Benchmarking the %s export of %s user profiles", extension, row_count)
+    output_dir = tempfile.mkdtemp(prefix="ppdb-export-")
+    output_path = os.path.join(output_dir, f"user_profiles{extension}")
+
+    return Case(
+        lambda: export_manager.export_user_profiles(output_path=output_path),
+        teardown=lambda: shutil.rmtree(output_dir, ignore_errors=True)
+    )
+
+@benchmark("exports", requires_db=True)
+def profiles_csv() -> Case:
+    return _export_case(".csv")
+
+@benchmark("exports", requires_db=True)
+def profiles_xlsx() -> Case:
+    return _export_case(".xlsx")
+
+def _stream_case(consume) -> Case:
+    from scrapers.src.database.scripts.database_manager import DatabaseManager  # pylint: disable=import-outside-toplevel
+
+    database_manager = _connected(DatabaseManager)
+    query = "SELECT user_id, job_title, company, start_date, end_date FROM work_experience"
+    return Case(lambda: consume(database_manager, query))
+
+@benchmark("exports", requires_db=True)
+def work_experience_fetchall() -> Case:
+    """Every work experience row at once, for comparison with the streamed reads."""
+    return _stream_case(lambda database_manager, query: len(database_manager.execute_query(query, fetch="ALL")))
+
+@benchmark("exports", requires_db=True)
+def work_experience_iter_query() -> Case:
+    """Every work experience row, streamed through a server-side cursor."""
+    return _stream_case(
+        lambda database_manager, query: sum(len(rows) for _, rows in database_manager.iter_query(query))
+    )
+
+@benchmark("exports", requires_db=True)
+def work_experience_dataframes() -> Case:
+    """Every work experience row, streamed as pandas DataFrames."""
+    return _stream_case(
+        lambda database_manager, query: sum(len(frame) for frame in database_manager.iter_dataframes(query))
+    )
@@ -0,0 +1,65 @@
+"""
+Experience, education and skills parsers on the saved pages in benchmarks/pages.
+
+Each benchmark loads its page once into a FakeWebDriver and times the
+parsing only: locating the list elements and building the lists the
+wrappers hand to the database. Nothing is written.
+"""
+from .fixtures import detached_manager, saved_page_browser
+from .harness import Case, benchmark
+
+@benchmark("parsers")
+def experience() -> Case:
+    from scrapers.src.bots.linkedin.scripts.linkedinbot import ExperienceManager  # pylint: disable=import-outside-toplevel
+
+    browser = saved_page_browser("experience.html")
+    manager = detached_manager(ExperienceManager, browser)
+    page = "New"
+
+    def parse():
+        list_elements = manager._locate_list_element_wrappers(page=page)  # pylint: disable=protected-access
+        return list(manager._zip_all_experience_information(  # pylint: disable=protected-access
+            company_names_list=manager._create_company_name_list(list_elements=list_elements, page=page),  # pylint: disable=protected-access
+            job_positions_list=manager._create_positions_list(list_elements=list_elements, page=page, user_id=None),  # pylint: disable=protected-access
+            position_descriptions=manager._create_positions_descriptions_list(list_elements=list_elements, page=page),  # pylint: disable=protected-access
+            dates_worked_list=manager._create_dates_worked_list(list_elements=list_elements, page=page),  # pylint: disable=protected-access
+            locations_of_work=manager._create_location_worked_list(list_elements=list_elements, page=page)  # pylint: disable=protected-access
+        ))
+
+    return Case(parse)
+
+@benchmark("parsers")
+def education() -> Case:
+    from scrapers.src.bots.linkedin.scripts.linkedinbot import EducationManager  # pylint: disable=import-outside-toplevel
+
+    browser = saved_page_browser("education.html")
+    manager = detached_manager(EducationManager, browser)
+
+    def parse():
+        list_elements = manager._locate_list_element_wrappers(page="New")  # pylint: disable=protected-access
+        return list(manager.zip_all_education_information(
+            school_names_list=manager._get_school_names(list_elements=list_elements),  # pylint: disable=protected-access
+            degree_names=manager._get_degrees(list_elements=list_elements),  # pylint: disable=protected-access
+            dates_attended_list=manager._nullify_empty_dates(  # pylint: disable=protected-access
+                manager._get_dates_attended(list_elements=list_elements)  # pylint: disable=protected-access
+            ),
+            grades=manager._get_grades(list_elements=list_elements),  # pylint: disable=protected-access
+            activities_and_clubs_list=manager._get_activities_and_clubs(list_elements=list_elements),  # pylint: disable=protected-access
+            descriptions_of_education=manager._get_description_of_education(list_elements=list_elements)  # pylint: disable=protected-access
+        ))
+
+    return Case(parse)
+
+@benchmark("parsers")
+def skills() -> Case:
+    from scrapers.src.bots.linkedin.scripts.linkedinbot import SkillsManager  # pylint: disable=import-outside-toplevel
+
+    browser = saved_page_browser("skills.html")
+    manager = detached_manager(SkillsManager, browser)
+
+    def parse():
+        # Measure the script call, not a cache hit from the previous call
+        browser.page_cache.clear()
+        return manager.create_skills_set(manager.locate_skill_names_in_new_page())
+
+    return Case(parse)
@@ -0,0 +1,49 @@
+"""
+One full profile scrape against the saved pages, database writes included.
+
+The LinkedInBot drives a FakeWebDriver over benchmarks/pages instead of
+Chrome (see fixtures.saved_page_bot), so these benchmarks time the
+orchestration of scrape_profile: every stage, the page lookups and waits,
+the parsing and the database side. They only run with --with-db and write
+the benchmark user (BENCHMARK_PROFILE_URL), deleted again afterwards.
+"""
+from .bench_database import _benchmark_user_id, _clear_profile, _connected
+from .fixtures import BENCHMARK_PROFILE_URL, saved_page_bot
+from .harness import Case, benchmark
+
+def _scrape_case(rescrape: bool) -> Case:
+    from scrapers.src.database.scripts.database_manager import LinkedInDatabaseManager  # pylint: disable=import-outside-toplevel
+    from scrapers.src.bots.webdriver.wait_accounting import wait_accountant  # pylint: disable=import-outside-toplevel
+
+    database_manager = _connected(LinkedInDatabaseManager)
+    user_id = _benchmark_user_id(database_manager)
+    bot = saved_page_bot()
+
+    def clear_profile():
+        _clear_profile(database_manager, user_id)
+        database_manager.execute_query("DELETE FROM profile_section_hashes WHERE user_id = %s", (user_id,))
+
+    def scrape():
+        bot.scrape_profile(user_id=user_id, profile_url=BENCHMARK_PROFILE_URL)
+
+    def teardown():
+        clear_profile()
+        database_manager.execute_query("DELETE FROM users WHERE user_id = %s", (user_id,))
+        wait_accountant.pacing_sleeps = True
+
+    clear_profile()
+    if rescrape:
+        # The stored sections are identical, so only the hashes are written
+        scrape()
+        return Case(scrape, teardown=teardown)
+    return Case(scrape, before_each=clear_profile, teardown=teardown)
+
+@benchmark("scrape", requires_db=True)
+def profile() -> Case:
+    """Scrape a profile seen for the first time."""
+    return _scrape_case(rescrape=False)
+
+@benchmark("scrape", requires_db=True)
+def profile_unchanged() -> Case:
+    """Scrape a profile whose sections did not change since the previous scrape."""
+    return _scrape_case(rescrape=True)
@@ -0,0 +1,127 @@
+"""
+Compare two benchmark result files and flag regressions.
+
+A benchmark regresses when its median time grew by more than the threshold
+(10% by default) over the baseline. A benchmark that ran in the baseline and
+raised an error in the current run counts as failed. The command exits with
+status 1 when anything regressed or failed, so it can gate a CI job.
+
+Usage:
+    $ python -m benchmarks.compare benchmarks/results/baseline.json
+    $ python -m benchmarks.compare baseline.json current.json --threshold 0.2
+"""
+import argparse
+import os
+import sys
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from .harness import latest_results_file, load_results
+
+DEFAULT_THRESHOLD = 0.10
+
+class Comparison(NamedTuple):
+    name: str
+    baseline: Optional[float]
+    current: Optional[float]
+    status: str  # "regressed", "failed", "improved", "unchanged", "new", "missing" or "skipped"
+
+    @property
+    def change(self) -> Optional[float]:
+        if not self.baseline or self.current is None:
+            return None
+        return self.current / self.baseline - 1
+
+FAILING_STATUSES = ("regressed", "failed")
+
+def _median(entry: Optional[Dict[str, Any]]) -> Optional[float]:
+    if entry is None or "median" not in entry:
+        return None
+    return entry["median"]
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any],
+                    threshold: float = DEFAULT_THRESHOLD) -> List[Comparison]:
+    """
+    Compare the median of every benchmark of two result documents.
+
+    Args:
+        baseline (dict): Results the current run is measured against.
+        current (dict): Results of the current run.
+        threshold (float): Relative slowdown above which a benchmark regressed.
+
+    Returns:
+        list: One comparison per benchmark of either document, sorted by name.
+    """
+    baseline_benchmarks = baseline["benchmarks"]
+    current_benchmarks = current["benchmarks"]
+    comparisons = []
+    for name in sorted(set(baseline_benchmarks) | set(current_benchmarks)):
+        baseline_median = _median(baseline_benchmarks.get(name))
+        current_median = _median(current_benchmarks.get(name))
+        if name not in current_benchmarks:
+            status = "missing"
+        elif name not in baseline_benchmarks:
+            status = "new"
+        elif baseline_median is not None and "error" in current_benchmarks[name]:
+            status = "failed"
+        elif baseline_median is None or current_median is None:
+            status = "skipped"
+        elif current_median > baseline_median * (1 + threshold):
+            status = "regressed"
+        elif current_median < baseline_median * (1 - threshold):
+            status = "improved"
+        else:
+            status = "unchanged"
+        comparisons.append(Comparison(name, baseline_median, current_median, status))
+    return comparisons
+
+def _format_seconds(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.2f} s"
+
+def format_comparison(comparisons: List[Comparison]) -> str:
+    """Return a table of the comparisons."""
+    lines = [f"{'benchmark':<45} {'baseline':>12} {'current':>12} {'change':>9}  status"]
+    for comparison in comparisons:
+        change = comparison.change
+        lines.append(
+            f"{comparison.name:<45} {_format_seconds(comparison.baseline):>12} "
+            f"{_format_seconds(comparison.current):>12} "
+            f"{(f'{change:+.1%}' if change is not None else '-'):>9}  {comparison.status}"
+        )
+    regressions = sum(comparison.status == "regressed" for comparison in comparisons)
+    failures = sum(comparison.status == "failed" for comparison in comparisons)
+    lines.append("")
+    lines.append(f"{regressions} regression(s), {failures} failure(s)")
+    return "\n".join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description="Flag benchmark regressions against a baseline.")
+    parser.add_argument("baseline", help="Results file to compare against.")
+    parser.add_argument(
+        "current", nargs="?", default=None,
+        help="Results file of the current run. Defaults to the most recently written other "
+             "file in benchmarks/results."
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help="Relative slowdown of the median that counts as a regression (default 0.10)."
+    )
+    args = parser.parse_args()
+
+    current_path = args.current or latest_results_file(exclude=args.baseline)
+    if current_path is None:
+        parser.error("No current results file given and none found in benchmarks/results.")
+    if os.path.abspath(current_path) == os.path.abspath(args.baseline):
+        parser.error("The current results file is the baseline itself.")
+
+    comparisons = compare_results(load_results(args.baseline), load_results(current_path), args.threshold)
+    print(format_comparison(comparisons))
+    sys.exit(1 if any(comparison.status in FAILING_STATUSES for comparison in comparisons) else 0)
+
+if __name__ == "__main__":
+    main()
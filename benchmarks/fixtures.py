@@ -0,0 +1,210 @@
+"""
+Fixed inputs shared by the benchmarks.
+
+Everything here is deterministic so two runs measure the same work: the
+saved LinkedIn pages in benchmarks/pages, the date ranges and descriptions
+fed to the experience parsers' helpers, the locations resolved by a stub
+geocoder, the positions swept by the co-worker graph, and the profile written
+to the database.
+"""
+import functools
+import os
+import pathlib
+import random
+from datetime import date, timedelta
+from typing import Dict, NamedTuple, Optional, Tuple
+
+PAGES_DIR = pathlib.Path(__file__).resolve().parent / "pages"
+
+BENCHMARK_PROFILE_URL = "https://www.linkedin.com/in/ppdb-benchmark/"
+
+DATE_RANGES = [
+    "Jan 2021 - Present · 3 yrs 10 mos",
+    "Mar 2020 - Dec 2020 · 10 mos",
+    "Sep 2018 - Mar 2020 · 1 yr 7 mos",
+    "Aug 2015 - Sep 2018 · 3 yrs 2 mos",
+    "Jun 2016 - Aug 2018 · 2 yrs 3 mos",
+    "2013 - 2014 · 1 yr",
+    "2019",
+    "Aug 2010 - May 2014",
+    "Issued Feb 2022",
+    "",
+]
+
+DESCRIPTIONS = [
+    "• Built the claims ingestion pipeline on Spark and Airflow 🚀\n\n"
+    "• Cut nightly batch runtime from 6 hours to 40 minutes\n• Mentored four junior engineers",
+    "Reporting on program cost and schedule 📊\n\nTableau dashboards for the program office",
+    "Led a team of six on fraud analytics for a federal client 🔍\n\n• Python, SQL, Databricks",
+    "Tier 2 support for EC2 and RDS\n\n\n• On-call rotation",
+    "Thesis on entity resolution for alumni records 🎓\n\n• Advisor: Prof. Smith",
+    "Graded problem sets for Intro to Signals and Systems",
+    "✅ Shipped v2 of the reporting API\n• 99.9% uptime\n\n�",
+    "",
+]
+
+LOCATIONS = [
+    "Baltimore, Maryland, United States",
+    "Greater Baltimore Area",
+    "Washington DC-Baltimore Area",
+    "Washington, District of Columbia, United States",
+    "Durham, North Carolina, United States",
+    "Raleigh-Durham-Chapel Hill Area",
+    "New York City Metropolitan Area",
+    "San Francisco Bay Area",
+    "Arlington, Virginia, United States",
+    "London Area, United Kingdom",
+    "Toronto, Ontario, Canada",
+    "Remote",
+]
+
+# What Nominatim answers for the locations above, after LocationFormatter.clean_location()
+GEOCODED_ADDRESSES = {
+    "Baltimore, Maryland, United States": "Baltimore, Maryland, United States",
+    "Baltimore": "Baltimore, Maryland, United States",
+    "Washington DC": "Washington, District of Columbia, United States",
+    "Washington, District of Columbia, United States":
+        "Washington, District of Columbia, United States",
+    "Durham, North Carolina, United States": "Durham, Durham County, North Carolina, United States",
+    "Raleigh": "Raleigh, Wake County, North Carolina, United States",
+    "New York City": "City of New York, New York, United States",
+    "San Francisco Bay": "San Francisco Bay, California, United States",
+    "Arlington, Virginia, United States": "Arlington, Arlington County, Virginia, United States",
+    "London , United Kingdom": "London, Greater London, England, United Kingdom",
+    "Toronto, Ontario, Canada": "Toronto, Golden Horseshoe, Ontario, Canada",
+}
+
+TAX_YEAR = 2023
+TAX_SALARIES = [18_000, 42_500, 67_000, 95_000, 120_000, 185_000, 240_000, 410_000, 760_000]
+FEDERAL_TAX_CSV = os.path.join(
+    "scrapers", "src", "bots", "linkedin", "utils", "salary_calculator", "federal_income_tax_date.csv"
+)
+
+# One profile as the experience, education and skills parsers hand it to the database
+PROFILE_EXPERIENCES = [
+    ("RELI Group, Inc.", "Senior Data Engineer",
+     "Built the claims ingestion pipeline on Spark and Airflow Cut nightly batch runtime",
+     ["2021-01-01", "2024-10-01"], "Baltimore, Maryland, United States · Hybrid"),
+    ("Booz Allen Hamilton", ["Lead Data Scientist", "Data Scientist", "Associate"],
+     ["Led a team of six on fraud analytics for a federal client", "Forecasting models", None],
+     [["2020-03-01", "2020-12-01"], ["2018-09-01", "2020-03-01"], ["2015-08-01", "2018-09-01"]],
+     "Washington, District of Columbia, United States"),
+    ("Northrop Grumman", "Data Analyst", "Reporting on program cost and schedule",
+     ["2016-06-01", "2018-08-01"], "Linthicum Heights, Maryland, United States"),
+    ("Amazon Web Services (AWS)", ["Solutions Architect", "Cloud Support Engineer"],
+     ["Designed data lakes for public sector customers", "Tier 2 support for EC2 and RDS"],
+     [["2013-01-01", "2013-12-01"], ["2012-01-01", "2013-01-01"]], "Arlington, Virginia, United States"),
+    ("Capital One", "Software Engineering Intern", None, ["2015-06-01", "2015-08-01"],
+     "McLean, Virginia, United States"),
+]
+
+PROFILE_EDUCATION = [
+    ("Duke University", "Master of Science - MS, Computer Science", ["2014-01-01", "2016-01-01"], "3.9",
+     "Duke Data Science Club, Graduate Student Council", "Thesis on entity resolution for alumni records"),
+    ("University of Maryland", "Bachelor of Science - BS, Mathematics", ["2010-08-01", "2014-05-01"], "3.7",
+     None, None),
+    ("Coursera", None, [None, "2019-01-01"], None, None, "Deep Learning Specialization"),
+]
+
+PROFILE_SKILLS = {
+    "Python", "SQL", "PostgreSQL", "Apache Spark", "Apache Airflow", "Databricks", "Machine Learning",
+    "Tableau", "Docker", "Git", "Pandas", "Statistics", "ETL", "Leadership", "Forecasting",
+}
+
+@functools.lru_cache(maxsize=None)
+def company_periods(position_count: int = 2000, seed: int = 0) -> Tuple[Tuple[int, date, date], ...]:
+    """
+    (user_id, start, end) positions at one large employer over 20 years, as the
+    co-worker graph sweeps them: a fifth of the users hold a second position.
+    """
+    rng = random.Random(seed)
+    periods = []
+    for index in range(position_count):
+        start = date(2004, 1, 1) + timedelta(days=rng.randint(0, 20 * 365))
+        end = start + timedelta(days=rng.randint(90, 5 * 365))
+        user_id = index if rng.random() < 0.8 else rng.randint(0, max(0, index - 1))
+        periods.append((user_id, start, end))
+    return tuple(periods)
+
+class GeocodedLocation(NamedTuple):
+    address: str
+
+class StubGeocoder:
+    """Answers geocode() from GEOCODED_ADDRESSES instead of calling Nominatim."""
+    def __init__(self, addresses: Optional[Dict[str, str]] = None) -> None:
+        self.addresses = addresses if addresses is not None else GEOCODED_ADDRESSES
+
+    def geocode(self, query: str, timeout: Optional[float] = None) -> Optional[GeocodedLocation]:  # pylint: disable=unused-argument
+        address = self.addresses.get(query.strip())
+        return GeocodedLocation(address) if address else None
+
+# URL patterns of the saved pages a FakeWebDriver answers, specific patterns first
+SAVED_PAGES = {
+    "https://www.linkedin.com/": PAGES_DIR / "sign_in.html",
+    "https://www.linkedin.com/login*": PAGES_DIR / "sign_in.html",
+    "https://www.linkedin.com/in/*/details/experience/*": PAGES_DIR / "experience.html",
+    "https://www.linkedin.com/in/*/details/education/*": PAGES_DIR / "education.html",
+    "https://www.linkedin.com/in/*/details/skills/*": PAGES_DIR / "skills.html",
+    "https://www.linkedin.com/in/*": PAGES_DIR / "profile.html",
+}
+
+def page_url(page_name: str) -> str:
+    """Return the file:// URL of a saved page in benchmarks/pages."""
+    return (PAGES_DIR / page_name).as_uri()
+
+def saved_page_browser(page_name: str):
+    """
+    Return a FakeWebDriverManager showing one saved page of benchmarks/pages.
+
+    The page is read through lxml, so the parsers are measured without a
+    browser, on CI and headless machines alike.
+    """
+    from scrapers.src.bots.webdriver.fake_webdriver import FakeWebDriverManager  # pylint: disable=import-outside-toplevel
+
+    browser = FakeWebDriverManager({})
+    browser.driver.get(page_url(page_name))
+    return browser
+
+def detached_manager(manager_class, webdriver_manager=None, database_manager=None):
+    """
+    Build a scraper manager without running its __init__.
+
+    The managers open their own LinkedInDatabaseManager in __init__, which
+    the parsing methods never use, so the benchmarks set only the attributes
+    of BaseManager.
+
+    Args:
+        manager_class (type): A BaseManager subclass, e.g. ExperienceManager.
+        webdriver_manager: The browser the manager reads pages from, if any.
+        database_manager (DatabaseManager): The database the manager writes to, if any.
+    """
+    manager = manager_class.__new__(manager_class)
+    manager.webdriver_manager = webdriver_manager
+    manager.driver = getattr(webdriver_manager, "driver", None)
+    manager.wait = getattr(webdriver_manager, "wait", None)
+    manager.database_manager = database_manager
+    manager.freshness_tracker = None
+    return manager
+
+def saved_page_bot(bot_id: int = 1):
+    """
+    Build a LinkedInBot that reads the saved pages through a FakeWebDriver.
+
+    Every profile URL shows benchmarks/pages/profile.html, locations are
+    resolved by StubGeocoder and pacing delays are recorded without sleeping,
+    so a scrape touches neither a browser nor the network. The database is
+    the configured one.
+
+    Args:
+        bot_id (int): The bot ID, used by the sign-in and the batch selection.
+    """
+    from scrapers.src.bots.linkedin.scripts.linkedinbot import LinkedInBot  # pylint: disable=import-outside-toplevel
+    from scrapers.src.bots.linkedin.utils.location_formatter.location_formatter import LocationFormatter  # pylint: disable=import-outside-toplevel
+    from scrapers.src.bots.webdriver.fake_webdriver import FakeWebDriverManager  # pylint: disable=import-outside-toplevel
+    from scrapers.src.bots.webdriver.wait_accounting import wait_accountant  # pylint: disable=import-outside-toplevel
+
+    wait_accountant.pacing_sleeps = False
+    bot = LinkedInBot(bot_id=bot_id, webdriver_manager=FakeWebDriverManager(SAVED_PAGES, bot_id=bot_id))
+    bot.main_page_scraper.location_formatter = LocationFormatter(geolocator=StubGeocoder())
+    bot.experience_manager.location_formatter = LocationFormatter(geolocator=StubGeocoder())
+    return bot
@@ -0,0 +1,158 @@
+"""
+Registry, timing loop and result files of the benchmark suite.
+
+A benchmark is a setup function decorated with @benchmark. It builds its
+fixtures and returns a Case holding the callable to time, so setup cost never
+ends up in the measurement. Timing follows timeit: the number of calls per
+round is picked with autorange(), and both the fastest round and the median
+are kept, so one noisy round does not move the compared number. Cases that need
+fresh state for every call (e.g. database writes) pass before_each and are
+timed one call per round.
+
+Usage:
+    >>> @benchmark("calculators")
+    ... def parse_date_range():
+    ...     return Case(lambda: [ExperienceManager.parse_date_range(text) for text in DATE_RANGES])
+"""
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import time
+import timeit
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+DEFAULT_RESULTS_DIR = os.path.join("benchmarks", "results")
+
+class BenchmarkSkipped(Exception):
+    """Raised by a setup function when the benchmark cannot run here."""
+
+class Case(NamedTuple):
+    """The callable to time and its optional per-call setup and final teardown."""
+    run: Callable[[], Any]
+    before_each: Optional[Callable[[], Any]] = None
+    teardown: Optional[Callable[[], Any]] = None
+
+class Benchmark(NamedTuple):
+    name: str
+    group: str
+    setup: Callable[[], Case]
+    requires_db: bool
+
+_registry: List[Benchmark] = []
+
+def benchmark(group: str, name: Optional[str] = None, requires_db: bool = False) -> Callable:
+    """
+    Register a setup function as a benchmark.
+
+    Args:
+        group (str): The group of the benchmark, e.g. "parsers".
+        name (str): The benchmark name. Defaults to the function name.
+        requires_db (bool): Whether the benchmark reads or writes the configured database.
+    """
+    def decorator(setup: Callable[[], Case]) -> Callable[[], Case]:
+        _registry.append(Benchmark(f"{group}.{name or setup.__name__}", group, setup, requires_db))
+        return setup
+    return decorator
+
+def registered_benchmarks() -> List[Benchmark]:
+    return list(_registry)
+
+def _time_case(case: Case, rounds: int) -> Dict[str, Any]:
+    """Time a case and return per-call statistics in seconds."""
+    if case.before_each is None:
+        timer = timeit.Timer(case.run)
+        number, _ = timer.autorange()
+        timings = [total / number for total in timer.repeat(repeat=rounds, number=number)]
+    else:
+        number = 1
+        timings = []
+        for _ in range(rounds):
+            case.before_each()
+            start = time.perf_counter()
+            case.run()
+            timings.append(time.perf_counter() - start)
+
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.fmean(timings),
+        "stddev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "rounds": rounds,
+        "calls_per_round": number,
+    }
+
+def run_benchmark(bench: Benchmark, rounds: int) -> Dict[str, Any]:
+    """
+    Set up and time one benchmark.
+
+    Returns:
+        dict: The timing statistics, a "skipped" reason, or the "error" the benchmark raised.
+    """
+    try:
+        case = bench.setup()
+    except (BenchmarkSkipped, ImportError) as reason:
+        return {"group": bench.group, "skipped": str(reason)}
+    except Exception as error:  # pylint: disable=broad-except
+        logging.exception("Setup of benchmark %s failed", bench.name)
+        return {"group": bench.group, "error": f"{type(error).__name__}: {error}"}
+
+    try:
+        result = _time_case(case, rounds)
+    except Exception as error:  # pylint: disable=broad-except
+        logging.exception("Benchmark %s failed", bench.name)
+        result = {"error": f"{type(error).__name__}: {error}"}
+    finally:
+        if case.teardown is not None:
+            case.teardown()
+
+    result["group"] = bench.group
+    return result
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def write_results(results: Dict[str, Dict[str, Any]], path: str) -> None:
+    """Write benchmark results with the machine and commit they were measured on."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    document = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "benchmarks": results,
+    }
+    with open(path, mode="w", encoding="utf-8") as results_file:
+        json.dump(document, results_file, indent=2)
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path, mode="r", encoding="utf-8") as results_file:
+        return json.load(results_file)
+
+def latest_results_file(results_dir: str = DEFAULT_RESULTS_DIR, exclude: Optional[str] = None) -> Optional[str]:
+    """
+    Return the most recently written results file of a directory, or None if there is none.
+
+    Args:
+        results_dir (str): Directory of the results files.
+        exclude (str): A file never to return, typically the baseline being compared against.
+    """
+    if not os.path.isdir(results_dir):
+        return None
+    excluded = os.path.abspath(exclude) if exclude else None
+    paths = [
+        os.path.join(results_dir, name) for name in os.listdir(results_dir)
+        if name.endswith(".json") and os.path.abspath(os.path.join(results_dir, name)) != excluded
+    ]
+    # By modification time: names such as baseline.json sort after the timestamped ones
+    return max(paths, key=os.path.getmtime) if paths else None
@@ -0,0 +1,138 @@
+"""
+Import-time budget of the entry points.
+
+Every entry point is imported in a fresh interpreter with python -X importtime.
+A check fails when the cumulative import time of the module exceeds its budget,
+or when it imports one of the heavy modules it must only load once running
+(pandas, selenium, geopy, ...). The module check does not depend on the machine,
+so it is the one to rely on in CI; --scale loosens the time budgets on slow runners.
+
+Usage:
+    $ python -m benchmarks.import_budget
+    $ python -m benchmarks.import_budget --module sqlizer.main --scale 2
+"""
+import argparse
+import pathlib
+import re
+import subprocess
+import sys
+from typing import List, NamedTuple, Set, Tuple
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+# Modules that take a noticeable time to import, or need a display (pyautogui, mouse)
+HEAVY_MODULES = (
+    "pandas", "numpy", "openpyxl", "geopy", "pycountry", "pyautogui", "mouse", "spacy", "selenium",
+)
+
+class ImportBudget(NamedTuple):
+    module: str
+    seconds: float
+    forbidden: Tuple[str, ...] = HEAVY_MODULES
+
+class ImportMeasurement(NamedTuple):
+    module: str
+    seconds: float
+    imported: Set[str]  # Top-level packages imported along the way
+
+BUDGETS = [
+    # Entry points: the bots and the parser are only loaded once main() runs
+    ImportBudget("scrapers.src.bots.linkedin.main", 0.25),
+    ImportBudget("scrapers.src.bots.alumni_databases.duke.main", 0.25),
+    ImportBudget("sqlizer.main", 0.25),
+    ImportBudget("scrapers.src.cli.ppdb", 0.25),
+    # Short jobs: exports and database maintenance
+    ImportBudget("scrapers.src.bots.linkedin.utils.to_excel", 0.25),
+    ImportBudget("scrapers.src.database.scripts.refresh_summaries", 0.25),
+    ImportBudget("scrapers.src.database.scripts.entity_resolution", 0.25),
+    ImportBudget("scrapers.src.database.scripts.synthetic_data", 0.25),
+    ImportBudget("scrapers.src.database.scripts.coworker_graph", 0.25),
+    ImportBudget("scrapers.src.bots.linkedin.utils.salary_calculator.salary_calculator", 0.25),
+    ImportBudget("scrapers.src.bots.linkedin.utils.location_formatter.location_formatter", 0.25),
+    ImportBudget("scrapers.src.bots.linkedin.utils.title_normalizer.title_normalizer", 0.25),
+    ImportBudget("scrapers.src.bots.linkedin.utils.experience_text.experience_text", 0.25),
+    ImportBudget("scrapers.src.bots.linkedin.utils.company_canonicalizer.company_canonicalizer", 0.25),
+    ImportBudget("scrapers.src.monitoring.tracing", 0.25),
+    # The bot itself needs selenium, but nothing else heavy until it scrapes
+    ImportBudget(
+        "scrapers.src.bots.linkedin.scripts.linkedinbot", 0.75,
+        tuple(module for module in HEAVY_MODULES if module != "selenium")
+    ),
+]
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \|( *)(\S+)$")
+
+def measure_import(module: str) -> ImportMeasurement:
+    """
+    Import a module in a fresh interpreter and read its -X importtime report.
+
+    Raises:
+        ImportError: If the module cannot be imported.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=False
+    )
+    if process.returncode != 0:
+        last_line = process.stderr.strip().splitlines()[-1] if process.stderr.strip() else ""
+        raise ImportError(f"Importing {module} failed: {last_line}")
+
+    seconds = 0.0
+    imported = set()
+    for line in process.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match is None:
+            continue
+        cumulative_us, indent, name = match.groups()
+        imported.add(name.split(".")[0])
+        if name == module and len(indent) == 1:
+            seconds = int(cumulative_us) / 1e6
+    return ImportMeasurement(module, seconds, imported)
+
+def check_budget(budget: ImportBudget, scale: float = 1.0) -> Tuple[ImportMeasurement, List[str]]:
+    """
+    Measure one entry point against its budget.
+
+    Returns:
+        tuple: The measurement and the list of problems, empty when within budget.
+    """
+    measurement = measure_import(budget.module)
+    problems = []
+    if measurement.seconds > budget.seconds * scale:
+        problems.append(
+            f"{budget.module} took {measurement.seconds * 1e3:.0f} ms to import, "
+            f"budget {budget.seconds * scale * 1e3:.0f} ms"
+        )
+    heavy = sorted(measurement.imported.intersection(budget.forbidden))
+    if heavy:
+        problems.append(f"{budget.module} imports {', '.join(heavy)} at import time")
+    return measurement, problems
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the import time of the entry points.")
+    parser.add_argument("--module", action="append", help="Only check this module (repeatable).")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every time budget by this.")
+    args = parser.parse_args()
+
+    problems = []
+    print(f"{'module':<80} {'import':>9} {'budget':>9}")
+    for budget in BUDGETS:
+        if args.module and budget.module not in args.module:
+            continue
+        try:
+            measurement, budget_problems = check_budget(budget, args.scale)
+        except ImportError as error:
+            problems.append(str(error))
+            print(f"{budget.module:<80} {'error':>9}")
+            continue
+        problems.extend(budget_problems)
+        print(f"{budget.module:<80} {measurement.seconds * 1e3:>6.0f} ms "
+              f"{budget.seconds * args.scale * 1e3:>6.0f} ms{'  !' if budget_problems else ''}")
+
+    if problems:
+        print()
+        print("\n".join(problems))
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Profile a LinkedIn scrape against the saved pages, without a browser or network.
+
+By default one profile is scraped for the benchmark user (written to the
+configured database and deleted again). With --bot-id the whole
+scrape_linkedin_page() run of that bot is profiled instead: sign-in, the run
+journal and every profile of its batch, each of them answered by
+benchmarks/pages/profile.html.
+
+Usage:
+    $ python -m benchmarks.profile_scrape
+    $ python -m benchmarks.profile_scrape --sort tottime --limit 60
+    $ python -m benchmarks.profile_scrape --bot-id 1 --output scrape.pstats
+"""
+import argparse
+import cProfile
+import logging
+import pstats
+
+from .bench_database import _benchmark_user_id, _clear_profile, _connected
+from .fixtures import BENCHMARK_PROFILE_URL, saved_page_bot
+from .harness import BenchmarkSkipped
+
+logging.basicConfig(level=logging.INFO, filename="log.log", filemode="w",
+                    format="%(asctime)s - %(levelname)s - %(message)s")
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile a LinkedIn scrape against the saved pages.")
+    parser.add_argument("--bot-id", type=int, default=None,
+                        help="Profile the full scrape_linkedin_page() run of this bot.")
+    parser.add_argument("--sort", default="cumulative", help="pstats sort key (default cumulative).")
+    parser.add_argument("--limit", type=int, default=40, help="Number of functions to print.")
+    parser.add_argument("--output", default=None, help="Also write the raw stats to this file.")
+    args = parser.parse_args()
+
+    from scrapers.src.database.scripts.database_manager import LinkedInDatabaseManager  # pylint: disable=import-outside-toplevel
+    from scrapers.src.bots.webdriver.wait_accounting import wait_accountant  # pylint: disable=import-outside-toplevel
+
+    try:
+        database_manager = _connected(LinkedInDatabaseManager)
+    except BenchmarkSkipped as reason:
+        parser.error(str(reason))
+
+    profiler = cProfile.Profile()
+    if args.bot_id is not None:
+        bot = saved_page_bot(bot_id=args.bot_id)
+        profiler.runcall(bot.scrape_linkedin_page)
+    else:
+        user_id = _benchmark_user_id(database_manager)
+        bot = saved_page_bot()
+        try:
+            profiler.runcall(bot.scrape_profile, user_id=user_id, profile_url=BENCHMARK_PROFILE_URL)
+        finally:
+            _clear_profile(database_manager, user_id)
+            database_manager.execute_query("DELETE FROM users WHERE user_id = %s", (user_id,))
+
+    stats = pstats.Stats(profiler)
+    stats.strip_dirs().sort_stats(args.sort).print_stats(args.limit)
+    print(wait_accountant.report())
+    if args.output:
+        stats.dump_stats(args.output)
+        print(f"Stats written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Run the benchmark suite and store the results as JSON.
+
+Benchmarks that need the database are skipped unless --with-db is given.
+Results are written to benchmarks/results/<timestamp>.json, or --output, and
+can be checked against a baseline right away with --compare. The import time
+of the entry points is checked separately by benchmarks.import_budget.
+
+Usage:
+    $ python -m benchmarks.run
+    $ python -m benchmarks.run --with-db --group db --group exports
+    $ python -m benchmarks.run --with-db --profile bench
+    $ python -m benchmarks.run --output benchmarks/results/baseline.json
+    $ python -m benchmarks.run --compare benchmarks/results/baseline.json
+"""
+import argparse
+import contextlib
+import logging
+import os
+import sys
+from datetime import datetime
+
+from . import bench_calculators, bench_database, bench_parsers, bench_scrape  # pylint: disable=unused-import
+from .compare import DEFAULT_THRESHOLD, FAILING_STATUSES, compare_results, format_comparison
+from .harness import DEFAULT_RESULTS_DIR, load_results, registered_benchmarks, run_benchmark, write_results
+
+logging.basicConfig(level=logging.INFO, filename="log.log", filemode="w",
+                    format="%(asctime)s - %(levelname)s - %(message)s")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the benchmark suite.")
+    parser.add_argument("--group", action="append", help="Only run this group (repeatable).")
+    parser.add_argument("-k", "--filter", default=None, help="Only run benchmarks whose name contains this.")
+    parser.add_argument("--with-db", action="store_true", help="Also run the benchmarks that use the database.")
+    parser.add_argument("--profile", default=None,
+                        help="database.ini profile of the database benchmarks (default PPDB_DB_PROFILE, or postgresql).")
+    parser.add_argument("--rounds", type=int, default=7, help="Timed rounds per benchmark.")
+    parser.add_argument("--output", default=None, help="Results file. Defaults to benchmarks/results/<timestamp>.json.")
+    parser.add_argument("--compare", metavar="BASELINE", default=None,
+                        help="Compare the results with a baseline file and exit 1 on regressions or failures.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Relative slowdown of the median that counts as a regression.")
+    args = parser.parse_args(argv)
+    if args.profile:
+        os.environ["PPDB_DB_PROFILE"] = args.profile
+
+    results = {}
+    for bench in registered_benchmarks():
+        if args.group and bench.group not in args.group:
+            continue
+        if args.filter and args.filter not in bench.name:
+            continue
+        if bench.requires_db and not args.with_db:
+            results[bench.name] = {"group": bench.group, "skipped": "needs --with-db"}
+        else:
+            # The scrapers print as they parse; keep the report readable
+            with open(os.devnull, mode="w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+                results[bench.name] = run_benchmark(bench, args.rounds)
+
+        result = results[bench.name]
+        if "skipped" in result:
+            print(f"{bench.name:<45} skipped: {result['skipped']}")
+        elif "error" in result:
+            print(f"{bench.name:<45} error: {result['error']}")
+        else:
+            print(f"{bench.name:<45} median {result['median'] * 1e3:>10.3f} ms  "
+                  f"min {result['min'] * 1e3:>10.3f} ms  (x{result['calls_per_round']}, {result['rounds']} rounds)")
+
+    output_path = args.output or os.path.join(
+        DEFAULT_RESULTS_DIR, f"{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    write_results(results, output_path)
+    print(f"\nResults written to {output_path}")
+
+    if args.compare:
+        comparisons = compare_results(load_results(args.compare), load_results(output_path), args.threshold)
+        print()
+        print(format_comparison(comparisons))
+        if any(comparison.status in FAILING_STATUSES for comparison in comparisons):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
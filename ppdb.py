@@ -0,0 +1,10 @@
+"""
+Entry point of the ppdb command, see scrapers/src/cli/ppdb.py.
+
+Usage:
+    $ python ppdb.py --help
+"""
+from scrapers.src.cli.ppdb import main
+
+if __name__ == "__main__":
+    main()
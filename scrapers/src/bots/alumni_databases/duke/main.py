@@ -1,6 +1,6 @@
-from .scripts.dukebot import DukeBot
-
 def main():
+    from .scripts.dukebot import DukeBot  # pylint: disable=import-outside-toplevel
+
     dukebot = DukeBot()
     dukebot.run_bot()
 
@@ -1,6 +1,5 @@
 import logging
 import random
-import time
 from typing import Union, Tuple, Optional, Set, List
 import re
 from datetime import datetime
@@ -15,10 +14,10 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
-from geopy.geocoders import Nominatim
 
-from .....database.scripts.database_manager import DatabaseManager, DukeDatabaseManager
+from .....database.scripts.database_manager import DatabaseManager, DukeDatabaseManager, SharedDatabaseManager
 from ....webdriver.webdriver_manager import WebDriverManager
+from ....webdriver.wait_accounting import wait_stage, wait_accountant
 from ....linkedin.utils.location_formatter.location_formatter import LocationFormatter
 from ....linkedin.scripts.linkedinbot import BaseManager
 
@@ -37,7 +36,6 @@ class SignInManager(BaseManager):
             EC.element_to_be_clickable((By.CLASS_NAME, "alum-directory"))
         )
         register_or_log_in_button.click()
-        time.sleep(5)
 
     def open_one_link(self):
         one_link_button = self.wait.until(
@@ -69,7 +67,7 @@ class SignInManager(BaseManager):
 
     def send_creds(self):
         self.open_one_link()
-        time.sleep(3)
+        # send_username waits for the login form instead of a fixed pause
         self.send_username()
         self.send_password()
 
@@ -85,19 +83,19 @@ class Searcher(BaseManager):
         professional_div.click()
 
     def type_industry(self, industry: str):
-        industry_input = self.driver.find_element(
-            By.XPATH, "//input[@aria-label='Industry']"
+        industry_input = self.wait.until(
+            EC.element_to_be_clickable((By.XPATH, "//input[@aria-label='Industry']"))
         )
 
         industry_input.clear()
         industry_input.click()
         industry_input.send_keys(industry)
-        time.sleep(5)
+        wait_accountant.pace(5)
         industry_input.send_keys(Keys.ENTER)
 
     def type_current_employer(self, current_employer: str):
-        current_employer_input = self.driver.find_element(
-            By.XPATH, "//input[@aria-label='Current Employer']"
+        current_employer_input = self.wait.until(
+            EC.element_to_be_clickable((By.XPATH, "//input[@aria-label='Current Employer']"))
         )
 
         current_employer_input.clear()
@@ -112,9 +110,9 @@ class Searcher(BaseManager):
         for job_title in current_job_title_list:
             current_job_title_div.clear()
             current_job_title_div.send_keys(job_title)
-            time.sleep(5)
+            wait_accountant.pace(5)
             current_job_title_div.send_keys(Keys.ENTER)
-            time.sleep(3)
+            wait_accountant.pace(3)
 
     def click_search(self):
         try:
@@ -136,14 +134,11 @@ class Searcher(BaseManager):
             # Optionally, you can implement a retry mechanism here
 
     def professional_search_wrapper(self, industry, current_employer, current_job_title):
+        # Each step waits for its own input to be ready
         self.click_professional()
-        time.sleep(1)
         self.type_industry(industry=industry)
-        time.sleep(1)
         self.type_current_employer(current_employer=current_employer)
-        time.sleep(1)
         self.type_current_job_title(current_job_title_list=current_job_title)
-        time.sleep(1)
 
 class SearchResultScraper(BaseManager):
     def __init__(self, webdriver_manager: WebDriverManager, database_manager: DukeDatabaseManager) -> None:
@@ -152,15 +147,15 @@ class SearchResultScraper(BaseManager):
     def scrape_profile_urls(self) -> List[WebElement]:
         profile_urls = set()
         try:
-            a_tags: List[WebElement] = self.wait.until(
-                EC.presence_of_all_elements_located((By.TAG_NAME, "a"))
+            self.wait.until(
+                EC.presence_of_element_located((By.TAG_NAME, "a"))
             )
-            for a_tag in a_tags:
-                href = a_tag.get_attribute("href")
+            for anchor in self.webdriver_manager.page_cache.anchors():
+                href = anchor["href"]
                 if href and "https://alumni.duke.edu/people/" in href:
                     profile_urls.add(href)
 
-        except NoSuchElementException:
+        except (NoSuchElementException, TimeoutException):
             logging.info("No results for this search query.")
 
         return list(profile_urls)
@@ -192,6 +187,19 @@ class SearchResultScraper(BaseManager):
 
         
         
+    def count_profile_links(self) -> int:
+        """Count the profile links on the results page with one script call."""
+        return self.driver.execute_script(
+            "return document.querySelectorAll(\"a[href*='alumni.duke.edu/people/']\").length;"
+        )
+
+    def wait_for_profile_links(self, minimum: int = 1) -> None:
+        """Wait until the results page shows at least `minimum` profile links."""
+        try:
+            self.wait.until(lambda driver: self.count_profile_links() >= minimum)
+        except TimeoutException:
+            logging.info("Results page shows fewer than %s profile links", minimum)
+
     def scrape_main_page(self) -> List[str]:
         all_profile_urls = set()
         while True:  # Change to an infinite loop
@@ -201,9 +209,10 @@ class SearchResultScraper(BaseManager):
             if not self.show_more_button_exists():
                 break  # Exit the loop if either condition is met
             self.click_show_more()
-            time.sleep(random.uniform(25, 45))
-        # One last scrape to get the remaining URLs after the last click
-        time.sleep(4)
+            wait_accountant.pace(random.uniform(25, 45))
+        # One last scrape to get the remaining URLs after the last click,
+        # as soon as at least every URL seen so far is on the page
+        self.wait_for_profile_links(len(all_profile_urls))
         profile_urls = self.scrape_profile_urls()
         all_profile_urls.update(profile_urls)
         print(f"Final collection: {len(all_profile_urls)} URLs.")
@@ -215,6 +224,7 @@ class ProfileScraper(BaseManager):
 
     def access_profile(self, profile_url: str):
         self.driver.get(profile_url)
+        self.webdriver_manager.wait_for_page_load()
 
     def locate_emails(self):
         try:
@@ -260,12 +270,12 @@ class ProfileScraper(BaseManager):
 
     def locate_linkedin_url(self):
         try:
-            a_tags = self.wait.until(
-                EC.presence_of_all_elements_located((By.TAG_NAME, "a"))
+            self.wait.until(
+                EC.presence_of_element_located((By.TAG_NAME, "a"))
             )
-            for a_tag in a_tags:
-                href = a_tag.get_attribute("href")
-                if "linkedin" in href:
+            for anchor in self.webdriver_manager.page_cache.anchors():
+                href = anchor["href"]
+                if href and "linkedin" in href:
                     return href
         except:
             return None
@@ -285,7 +295,7 @@ class ProfileScraper(BaseManager):
 
 
 class DukeBot(BaseManager):
-    dukeDatabaseManager = DukeDatabaseManager()
+    dukeDatabaseManager = SharedDatabaseManager(DukeDatabaseManager)
 
     def __init__(self, webdriver_manager: Optional[WebDriverManager] = None, database_manager: DukeDatabaseManager = None) -> None:
         if webdriver_manager is None:
@@ -319,33 +329,33 @@ class DukeBot(BaseManager):
         linkedin_url_list = []
         names_list = []
 
-        self.sign_in_manager.access_duke_alumni_login()
-        self.sign_in_manager.click_alumni_network_button()
-        self.sign_in_manager.send_creds()
-        self.sign_in_manager.click_log_in_button()
-        time.sleep(5)
+        with wait_stage("sign_in"):
+            self.sign_in_manager.access_duke_alumni_login()
+            self.sign_in_manager.click_alumni_network_button()
+            self.sign_in_manager.send_creds()
+            self.sign_in_manager.click_log_in_button()
 
-        self.searcher.professional_search_wrapper("Information Technology", "", ["Chief Executive Officer", "CEO"])
-        if_correct = input("Press enter if the query is correct")
-        if if_correct:
-            pass
-        self.searcher.click_search()
-        time.sleep(6)
+        with wait_stage("search"):
+            self.searcher.professional_search_wrapper("Information Technology", "", ["Chief Executive Officer", "CEO"])
+            if_correct = input("Press enter if the query is correct")
+            if if_correct:
+                pass
+            self.searcher.click_search()
 
-        profile_urls = self.search_results_scraper.scrape_main_page()
+        with wait_stage("search_results"):
+            self.search_results_scraper.wait_for_profile_links()
+            profile_urls = self.search_results_scraper.scrape_main_page()
 
-        time.sleep(10)
+        wait_accountant.pace(10)
         
         for url in profile_urls:
-            self.profile_scraper.access_profile(url)
-            time.sleep(1)
-            email = self.profile_scraper.locate_emails()
-            time.sleep(1)
-            phone = self.profile_scraper.locate_phone_numbers()
-            time.sleep(1)
-            linkedin_url = self.profile_scraper.locate_linkedin_url()
-            time.sleep(1)
-            name = self.profile_scraper.locate_name()
+            # The page is loaded once; the fields are read from it without pauses
+            with wait_stage("profile"):
+                self.profile_scraper.access_profile(url)
+                email = self.profile_scraper.locate_emails()
+                phone = self.profile_scraper.locate_phone_numbers()
+                linkedin_url = self.profile_scraper.locate_linkedin_url()
+                name = self.profile_scraper.locate_name()
 
             alumni_urls_list.append(url)
             email_list.append(email)
@@ -353,7 +363,9 @@ class DukeBot(BaseManager):
             linkedin_url_list.append(linkedin_url)
             names_list.append(name)
 
-            time.sleep(random.uniform(25, 45))
+            wait_accountant.pace(random.uniform(25, 45))
+
+        wait_accountant.log_report()
 
         zipped_list = zip(alumni_urls_list, email_list, phone_list, linkedin_url_list, names_list)
 
@@ -21,13 +21,8 @@ Date:
     May 1, 2024
 
 """
-import time
-import random
-from scrapers.src.bots.linkedin.scripts.scout import Scout
-from .scripts.bot_credentials_manager import BotCredentialsManager
-from .scripts.linkedinbot import LinkedInBot
-from .scripts.bot_creator import PhoneNumberScraper
-from ...database.scripts.database_manager import DatabaseManager
+import os
+from ...monitoring.tracing import current_run_id, load_spans, summarize, TRACE_FILE_ENV
 
 def main():
     """
@@ -37,14 +32,16 @@ def main():
     It also retrieves a list of usable bot IDs from LinkedInBot and iterates 
     through each ID to create a LinkedInBot instance and scrape a LinkedIn page.
     """
-
-    
+    # The bot modules import selenium, so only load them once the bots run
+    from .scripts.scout import Scout  # pylint: disable=import-outside-toplevel
+    from .scripts.linkedinbot import LinkedInBot  # pylint: disable=import-outside-toplevel
 
     # Scout
     scout = Scout()
     scout.get_profiles_from_excel()
 
     """# Bot Credential Manager
+    from .scripts.bot_credentials_manager import BotCredentialsManager
     bot_credentials_manager = BotCredentialsManager()
     bot_credentials_manager.bot_credentials_wrapper()"""
 
@@ -55,8 +52,14 @@ def main():
     for bot_id in usable_bot_id_list:
         bot_instance = LinkedInBot(bot_id=bot_id)
         bot_instance.scrape_name_and_location()
+
+    # Time per stage and per profile of this run, when run with PPDB_TRACE_FILE set
+    run_id = current_run_id()
+    if run_id is not None:
+        print(summarize(load_spans(os.environ[TRACE_FILE_ENV], run_id=run_id)))
     
-    """phone_number_scraper = PhoneNumberScraper()
+    """from .scripts.bot_creator import PhoneNumberScraper
+    phone_number_scraper = PhoneNumberScraper()
     phone_number_scraper.wrapper()"""
     
 if __name__ == '__main__':
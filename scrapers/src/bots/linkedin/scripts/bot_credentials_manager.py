@@ -160,5 +160,3 @@ class BotCredentialsManager:
 
         # Update bot credentials in the database
         self.credentials_db_manager.update_bot_credentials(new_bots)
-        
-print("Completed")
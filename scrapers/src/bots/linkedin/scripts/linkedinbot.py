@@ -52,7 +52,6 @@ import random
 import time
 from typing import Union, Tuple, Optional, Set, List
 import re
-from datetime import datetime
 import os
 
 import psycopg2
@@ -63,15 +62,25 @@ from selenium.common.exceptions import (
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
-from geopy.geocoders import Nominatim
 
-from ....database.scripts.database_manager import DatabaseManager, LinkedInDatabaseManager
+from ....database.scripts.database_manager import (
+    DatabaseManager, LinkedInDatabaseManager, ContactInfo, ProfileWriteSession, SharedDatabaseManager)
 from ...webdriver.webdriver_manager import WebDriverManager
+from ...webdriver.wait_accounting import wait_stage, wait_accountant
+from ..utils.experience_text.experience_text import (
+    DateRange, parse_date_range, remove_emojis_and_blank_lines
+)
 from ..utils.location_formatter.location_formatter import LocationFormatter
+from ..utils.profile_freshness.profile_freshness import FreshnessTracker, RefreshScheduler
+from ..utils.run_journal.run_journal import RunJournal
+from ....monitoring.tracing import span, traced
 
 logging.basicConfig(level=logging.INFO, filename="log.log", filemode="w",
                     format="%(asctime)s - %(levelname)s - %(message)s")
 
+# Stages of a full profile scrape, in the order they run
+FULL_SCRAPE_STAGES = ("main", "contact_info", "skills", "experience", "education")
+
 class BaseManager:  # pylint: disable=too-few-public-methods
     """
     Base class for managing WebDriver and DatabaseManager instances.
@@ -94,11 +103,14 @@ class BaseManager:  # pylint: disable=too-few-public-methods
             The WebDriverWait instance used for waiting for elements.
         database_manager (DatabaseManager):
             The DatabaseManager instance for interacting with the database.
+        freshness_tracker (FreshnessTracker):
+            Optional tracker used to skip writes for sections that did not change.
 
     """
     def __init__(
             self, webdriver_manager: WebDriverManager,
-            database_manager: DatabaseManager) -> None:
+            database_manager: DatabaseManager,
+            freshness_tracker: Optional[FreshnessTracker] = None) -> None:
         """
         Initializes a BaseManager object with the provided 
         WebDriverManager and DatabaseManager instances.
@@ -108,6 +120,8 @@ class BaseManager:  # pylint: disable=too-few-public-methods
                 The WebDriverManager instance responsible for managing WebDriver operations.
             database_manager (DatabaseManager):
                 The DatabaseManager instance for interacting with the database.
+            freshness_tracker (FreshnessTracker, optional):
+                Tracker used to skip writes for sections that did not change.
 
         Returns:
             None
@@ -122,6 +136,17 @@ class BaseManager:  # pylint: disable=too-few-public-methods
 
         # Database
         self.database_manager = database_manager
+        self.freshness_tracker = freshness_tracker
+
+    def _section_changed(self, section: str, content) -> bool:
+        """
+        Tell whether a scraped section differs from the previous scrape.
+
+        Always True when no freshness tracker is attached.
+        """
+        if self.freshness_tracker is None:
+            return True
+        return self.freshness_tracker.section_changed(section, content)
 
 class LinkedInSignInManager(BaseManager):
     """
@@ -513,6 +538,7 @@ class LinkedInSignInManager(BaseManager):
         if is_captcha_solved == 'y':
             pass"""
 
+    @traced("stage.sign_in")
     def sign_in_wrapper(self, bot_id) -> None:
         """
         Sign in the bot with the given bot_id.
@@ -631,6 +657,7 @@ class UserProfileInteractor(BaseManager):
         return profile_urls
 
 
+    @traced("stage.visit")
     def visit_user(self, profile_url: str) -> None:
         """
         Visits the user's profile by navigating to the provided profile URL.
@@ -706,7 +733,8 @@ class MainUserPageScraper(BaseManager):
     """
     def __init__(
             self, webdriver_manager: WebDriverManager,
-            database_manager: DatabaseManager, bot_id: int):
+            database_manager: DatabaseManager, bot_id: int,
+            freshness_tracker: Optional[FreshnessTracker] = None):
         """
         Initializes a new instance of the class.
 
@@ -719,12 +747,14 @@ class MainUserPageScraper(BaseManager):
                 for managing database interactions.
             bot_id (int): 
                 The unique identifier for the bot.
+            freshness_tracker (FreshnessTracker, optional):
+                Tracker used to skip writes for sections that did not change.
 
         Attributes:
             bot_id (int): 
                 The unique identifier for the bot.
         """
-        super().__init__(webdriver_manager, database_manager)
+        super().__init__(webdriver_manager, database_manager, freshness_tracker)
         self.bot_id = bot_id
         self.linkedin_db_manager = LinkedInDatabaseManager()
         self.location_formatter = LocationFormatter()
@@ -815,6 +845,7 @@ class MainUserPageScraper(BaseManager):
 
             return None
 
+    @traced("stage.main")
     def main_user_page_scraper_wrapper(self, profile_url):
         """
         Wrapper method for scraping data from a user's main page.
@@ -829,25 +860,27 @@ class MainUserPageScraper(BaseManager):
         Returns:
             None
         """
-        # Extract the name from the user's main page
+        # Extract the name and location from the user's main page
         users_name = self.find_users_name()
+        location = self.extract_current_location()
+
+        if not self._section_changed("main", [users_name, location]):
+            return
 
         # Send the user's name to the database
         self.linkedin_db_manager.send_names_to_db(
             users_name=users_name, profile_url=profile_url
         )
 
-        # Extract the location from the user's main page
-        location = self.extract_current_location()
-
         # Update the database with the user's location
         self.linkedin_db_manager.update_location_in_db(
             users_location=location, profile_url=profile_url
         )
 
 class ContactInfoManager(BaseManager):
-    def __init__(self, webdriver_manager: WebDriverManager, database_manager: DatabaseManager) -> None:
-        super().__init__(webdriver_manager, database_manager)
+    def __init__(self, webdriver_manager: WebDriverManager, database_manager: DatabaseManager,
+                 freshness_tracker: Optional[FreshnessTracker] = None) -> None:
+        super().__init__(webdriver_manager, database_manager, freshness_tracker)
         self.linkedin_database_manager = LinkedInDatabaseManager()
 
     def click_contact_info_button(self):
@@ -942,19 +975,30 @@ class ContactInfoManager(BaseManager):
             logging.info("No phone number found for this person")
             return None
 
+    @traced("stage.contact_info")
     def contact_info_manager_wrapper(self, user_id):
         clicked = self.click_contact_info_button()
         if clicked:
-            time.sleep(3)
-            phone_number = self.extract_phone_number()
-            email = self.extract_email()
-            address = self.extract_address()
-            website = self.extract_website()
+            try:
+                # The overlay is ready once its section headers are rendered
+                self.wait.until(
+                    EC.visibility_of_element_located((By.CSS_SELECTOR, ".artdeco-modal h3"))
+                )
+            except TimeoutException:
+                logging.info("Contact info overlay did not open for user %s", user_id)
+                return
+
+            contact_info = ContactInfo(
+                phone_number=self.extract_phone_number(),
+                email=self.extract_email(),
+                address=self.extract_address(),
+                website=self.extract_website()
+            )
 
-            self.linkedin_database_manager.update_email_in_datebase(email, user_id)
-            self.linkedin_database_manager.update_phone_in_datebase(phone_number, user_id)
-            self.linkedin_database_manager.update_address_in_database(address, user_id)
-            self.linkedin_database_manager.update_website_in_database(website, user_id)
+            if not self._section_changed("contact_info", list(contact_info)):
+                return
+
+            self.linkedin_database_manager.update_contact_info(contact_info, user_id)
 
         else:
             pass
@@ -1012,8 +1056,9 @@ class ExperienceManager(BaseManager):  # pylint: disable=too-few-public-methods
                         position_descriptions, dates_worked_list):
             Prints the zipped list.
     """
-    def __init__(self, webdriver_manager: WebDriverManager, database_manager: DatabaseManager) -> None:
-        super().__init__(webdriver_manager, database_manager)
+    def __init__(self, webdriver_manager: WebDriverManager, database_manager: DatabaseManager,
+                 freshness_tracker: Optional[FreshnessTracker] = None) -> None:
+        super().__init__(webdriver_manager, database_manager, freshness_tracker)
         self.linkedin_db_manager = LinkedInDatabaseManager()
         self.location_formatter = LocationFormatter()
 
@@ -1585,42 +1630,8 @@ class ExperienceManager(BaseManager):  # pylint: disable=too-few-public-methods
 
     @staticmethod
     def remove_emojis_and_blank_lines(text):
-        """
-        Remove emojis, bullet points, and blank lines from the given text.
-
-        Args:
-        text (str): The input text containing emojis, bullet points, and blank lines.
-
-        Returns:
-        str: The text with emojis, bullet points, and blank lines removed.
-        """
-        # Remove emojis
-        emoji_pattern = re.compile("["
-                            u"\U0001F600-\U0001F64F"  # emoticons
-                            u"\U0001F300-\U0001F5FF"  # symbols & pictographs
-                            u"\U0001F680-\U0001F6FF"  # transport & map symbols
-                            u"\U0001F700-\U0001F77F"  # alchemical symbols
-                            u"\U0001F780-\U0001F7FF"  # Geometric Shapes Extended
-                            u"\U0001F800-\U0001F8FF"  # Supplemental Arrows-C
-                            u"\U0001F900-\U0001F9FF"  # Supplemental Symbols and Pictographs
-                            u"\U0001FA00-\U0001FA6F"  # Chess Symbols
-                            u"\U0001FA70-\U0001FAFF"  # Symbols and Pictographs Extended-A
-                            u"\U00002702-\U000027B0"  # Dingbats
-                            u"\U000024C2-\U0001F251"
-                            u"" 
-                            "]+", flags=re.UNICODE)
-        text_without_emojis = emoji_pattern.sub(r'', text)
-        
-        # Remove bullet points
-        text_without_bullets = text_without_emojis.replace("•", "").strip()
-
-        # Remove special characters
-        text_without_special_characters = text_without_bullets.replace("�", "").strip()
-        
-        # Replace blank lines with comma
-        lines = text_without_special_characters.split('\n')
-        clean_lines = (line.strip() for line in lines if line.strip())
-        return ' '.join(clean_lines)
+        """Remove emojis, bullet points, and blank lines from the given text."""
+        return remove_emojis_and_blank_lines(text)
     
     @staticmethod 
     def _clean_up_company_name(text: str):
@@ -1628,51 +1639,9 @@ class ExperienceManager(BaseManager):  # pylint: disable=too-few-public-methods
 
 
     @staticmethod
-    def parse_date_range(date_range_text: str) -> List[str]:
-        """
-        Parse the date range text into a list containing start and end dates.
-
-        Args:
-            date_range_text (str): The text containing the date range.
-
-        Returns:
-            list: A list containing the start and end dates in the format YYYY-MM-DD.
-        """
-        # Extract the start and end dates using regex
-        pattern = r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}\b|\b\d{4}\b|Present'
-        dates = re.findall(pattern, date_range_text)
-
-        # Convert dates to YYYY-MM-DD format
-        formatted_dates = []
-        for date_str in dates:
-            if date_str == "Present":
-                current_date = datetime.now().strftime("%Y-%m-%d")
-                formatted_dates.append(current_date)
-            else:
-                # Check if the date string contains a month and a year
-                date_parts = date_str.split()
-                if len(date_parts) == 2:
-                    month_str, year_str = date_parts
-                    month_num = {
-                        'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4,
-                        'May': 5, 'Jun': 6, 'Jul': 7, 'Aug': 8,
-                        'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
-                    }[month_str]
-                    formatted_date = f"{year_str}-{month_num:02d}-01"
-                elif len(date_parts) == 1 and date_parts[0].isdigit():
-                    year_str = date_parts[0]
-                    formatted_date = f"{year_str}-01-01"
-                else:
-                    continue
-                formatted_dates.append(formatted_date)
-
-        # If there are two dates, assume the first is the start date and the second is the end date
-        if len(formatted_dates) == 2:
-            start_date = formatted_dates[0]
-            end_date = formatted_dates[1]
-            formatted_dates = [start_date, end_date]
-
-        return formatted_dates
+    def parse_date_range(date_range_text: str) -> DateRange:
+        """Parse the date range text into a DateRange of start and end dates."""
+        return parse_date_range(date_range_text)
     
     @staticmethod
     def _zip_all_experience_information(company_names_list: List[str], job_positions_list: List[str], position_descriptions, dates_worked_list, locations_of_work):
@@ -1681,6 +1650,7 @@ class ExperienceManager(BaseManager):  # pylint: disable=too-few-public-methods
         zipped = zip(company_names_list, job_positions_list, position_descriptions, dates_worked_list, locations_of_work)
         return zipped
 
+    @traced("stage.experience")
     def experience_wrapper(self, user_id):
         """Wrapper for all experiences logic"""
         #button_href = self._locate_show_all_experiences_button()
@@ -1712,6 +1682,8 @@ class ExperienceManager(BaseManager):  # pylint: disable=too-few-public-methods
                 dates_worked_list=dates_worked_list,
                 locations_of_work=locations_of_work
             ))
+            if not self._section_changed("experience", zipped_experiences_list):
+                return
             self.linkedin_db_manager.update_experiences_in_database(user_id=user_id, zipped_list=zipped_experiences_list)
 
     def _handle_new_page(self, user_id):
@@ -1723,14 +1695,15 @@ class ExperienceManager(BaseManager):  # pylint: disable=too-few-public-methods
         position_descriptions = self._create_positions_descriptions_list(list_elements=list_elements, page=page)
         dates_worked_list = self._create_dates_worked_list(list_elements=list_elements, page=page)
         locations_of_work = self._create_location_worked_list(list_elements=list_elements, page=page)
-        zipped_list = self._zip_all_experience_information(
+        zipped_list = list(self._zip_all_experience_information(
             company_names_list=company_name_list,
             job_positions_list=job_positions_list,
             position_descriptions=position_descriptions,
             dates_worked_list=dates_worked_list,
             locations_of_work=locations_of_work
-        )
-        self.linkedin_db_manager.update_experiences_in_database(zipped_list=zipped_list, user_id=user_id)
+        ))
+        if self._section_changed("experience", zipped_list):
+            self.linkedin_db_manager.update_experiences_in_database(zipped_list=zipped_list, user_id=user_id)
         self.driver.back()
 
 class SkillsManager(BaseManager):
@@ -1779,8 +1752,9 @@ class SkillsManager(BaseManager):
         skills_wrapper(user_id: int) -> None:
             Generates skill set from user profile then updates the database.
     """
-    def __init__(self, webdriver_manager: WebDriverManager, database_manager: DatabaseManager) -> None:
-        super().__init__(webdriver_manager, database_manager)
+    def __init__(self, webdriver_manager: WebDriverManager, database_manager: DatabaseManager,
+                 freshness_tracker: Optional[FreshnessTracker] = None) -> None:
+        super().__init__(webdriver_manager, database_manager, freshness_tracker)
         self.linkedin_db_manager = LinkedInDatabaseManager()
 
     def locate_skills_button(self) -> Optional[str]:
@@ -1834,28 +1808,33 @@ class SkillsManager(BaseManager):
         """
         self.driver.get(button_href)
 
-    def create_skills_set(self, list_elements: List[str]) -> Set[str]:
+    def create_skills_set(self, skill_names: List[str]) -> Set[str]:
         """
-        Create a set of unique skills from the given list of elements.
+        Create a set of unique skills from the given skill names.
     
         Args:
-            list_elements (List): A list of elements to extract skills from.
+            skill_names (List): The skill names read from the page.
     
         Returns:
-            Set: A set containing unique skills extracted from the list of elements.
+            Set: A set containing the unique, non-empty skill names.
         """
-        skills_set = set()
-        for i, list_element in enumerate(list_elements):
-            print("index: ", i)
-            # Attempt to locate the span text within the list element
-            span_element = list_element.find_element(
-                By.XPATH, "div/div/div/div/a/div/div/div/div/span[@aria-hidden='true']")
-            if span_element:
-                span_text = span_element.text
-                if span_text != '':
-                    skills_set.add(span_text)
+        return {skill_name for skill_name in skill_names if skill_name != ''}
 
-        return skills_set
+    def locate_skill_names_in_new_page(self) -> List[str]:
+        """
+        Read the name of every skill on the "Show all skills" page.
+
+        All names are read with one script call instead of an XPath lookup
+        and a text read per list element.
+
+        Returns:
+            List[str]: The skill names, in page order.
+        """
+        skill_names_xpath = (
+            '//li[contains(@class, "pvs-list__paged-list-item")]'
+            "/div/div/div/div/a/div/div/div/div/span[@aria-hidden='true']"
+        )
+        return self.webdriver_manager.page_cache.xpath_texts(skill_names_xpath)
 
     def locate_skills_list_elements_in_new_page(self) -> Optional[List[WebElement]]:
         """
@@ -1876,16 +1855,16 @@ class SkillsManager(BaseManager):
         and returning it.
         """
         # Pause for a random amount of time
-        time.sleep(random.uniform(3, 6))
+        wait_accountant.pace(random.uniform(3, 6))
 
         # Scroll down the page
         self.webdriver_manager.scroll_down()
 
-        # Locate the list elements
-        list_elements = self.locate_skills_list_elements_in_new_page()
+        # Read the skill names
+        skill_names = self.locate_skill_names_in_new_page()
 
         # Create the skills set
-        skills_set = self.create_skills_set(list_elements)
+        skills_set = self.create_skills_set(skill_names)
 
         return skills_set
 
@@ -1896,7 +1875,7 @@ class SkillsManager(BaseManager):
                 list: A list of skills scraped from the original page.
         """
         # Sleep for a random amount of time to avoid detection
-        time.sleep(random.uniform(3, 6))
+        wait_accountant.pace(random.uniform(3, 6))
 
         # Scroll down
         self.webdriver_manager.scroll_down()
@@ -1922,22 +1901,17 @@ class SkillsManager(BaseManager):
             skills_div = self.wait.until(
                 EC.presence_of_element_located((By.ID, "skills"))
             )
-            # Switch to sibling element
-            sibling_div_tag = skills_div.find_element(
-                By.XPATH, './following-sibling::div[2]')
-            if sibling_div_tag:
-                # Locate the list elements
-                list_elements = sibling_div_tag.find_elements(
-                    By.XPATH, "ul/li[contains(@class, 'artdeco-list__item')]")
-                for list_element in list_elements:
-                    # Look for anchor tags in each list element
-                    anchor_element = list_element.find_element(By.TAG_NAME, "a")
-                    # Locate the span tag within the anchor element tree
-                    span_tag = anchor_element.find_element(
-                        By.XPATH, './/span[@aria-hidden="true"]')
-                    span_text = span_tag.text
-                    print(span_text)
-                    skills_set.add(span_text)
+            # The first visible span of the first anchor of every list element
+            # in the sibling div, read with one script call
+            skill_names_xpath = (
+                "./following-sibling::div[2]/ul/li[contains(@class, 'artdeco-list__item')]"
+                "/descendant::a[1]/descendant::span[@aria-hidden='true'][1]"
+            )
+            skill_names = self.webdriver_manager.page_cache.xpath_texts(
+                skill_names_xpath, root=skills_div
+            )
+            if skill_names:
+                skills_set.update(skill_names)
             else:
                 print("could not find the sibling tag")
 
@@ -2000,16 +1974,19 @@ class SkillsManager(BaseManager):
             else:
                 logging.info("Skill: %s is already in the database for User ID: %s. Moving on to the next skill.", skill, user_id)
 
+    @traced("stage.skills")
     def skills_wrapper(self, user_id, profile_url):
         """
         Generates skill set from user profile then updates the database
         """
         skills_set = self.scrape_skills(profile_url)
-        self.update_skills_database(skills_set, user_id)
+        if self._section_changed("skills", skills_set):
+            self.update_skills_database(skills_set, user_id)
 
 class EducationManager(BaseManager):
-    def __init__(self, webdriver_manager: WebDriverManager, database_manager: DatabaseManager) -> None:
-        super().__init__(webdriver_manager, database_manager)
+    def __init__(self, webdriver_manager: WebDriverManager, database_manager: DatabaseManager,
+                 freshness_tracker: Optional[FreshnessTracker] = None) -> None:
+        super().__init__(webdriver_manager, database_manager, freshness_tracker)
         self.linkedin_db_manager = LinkedInDatabaseManager()
 
     def _look_for_education_header(self):
@@ -2127,12 +2104,16 @@ class EducationManager(BaseManager):
         """
         cleaned_dates = []
         for dates in dates_attended_list:
+            if isinstance(dates, DateRange):
+                # Inserting into the list would shift the dates away from their precisions
+                cleaned_dates.append(dates.pair())
+                continue
             if len(dates) == 1:
                 dates.insert(0, None)  # Add None at the beginning if there's only one date
             elif len(dates) == 0:
                 dates = [None, None]  # Replace empty list with a list containing two None values
             elif len(dates) > 2:
-                dates = dates[:2]  # Truncate to two elements if there are more than two dates
+                del dates[2:]  # Truncate to two elements if there are more than two dates
             cleaned_dates.append(dates)
 
         return cleaned_dates
@@ -2191,6 +2172,7 @@ class EducationManager(BaseManager):
         return zipped_education
 
 
+    @traced("stage.education")
     def education_wrapper(self, user_id):
         education_section_exists = self._look_for_education_header()
         if education_section_exists:
@@ -2221,8 +2203,10 @@ class EducationManager(BaseManager):
                 descriptions_of_education=descriptions_of_education,
                 activities_and_clubs_list=activities_and_clubs_list
             )
+            zipped_education = list(zipped_education)
             # Update database
-            self.linkedin_db_manager.update_education_in_database(zipped_education, user_id)
+            if self._section_changed("education", zipped_education):
+                self.linkedin_db_manager.update_education_in_database(zipped_education, user_id)
 
         return None
 
@@ -2234,10 +2218,17 @@ class LinkedInBot(BaseManager):  # pylint: disable=too-many-arguments, too-few-p
     WebDriver and database interactions, handle LinkedIn sign-in, scrape user profiles, 
     and perform various automation tasks on LinkedIn.
 
+    Args:
+        bot_id (int):
+            The unique identifier for the LinkedIn bot.
+        webdriver_manager (WebDriverManager, optional):
+            The browser the bot drives, e.g. a FakeWebDriverManager over saved pages.
+            Defaults to a new Chrome WebDriverManager.
+
     Attributes:
-        database_manager (DatabaseManager): 
+        database_manager (DatabaseManager):
             An instance of DatabaseManager for database interactions.
-        bot_id (int): 
+        bot_id (int):
             The unique identifier for the LinkedIn bot.
         sign_in_manager (LinkedInSignInManager): 
             An instance of LinkedInSignInManager for handling sign-in operations.
@@ -2249,6 +2240,8 @@ class LinkedInBot(BaseManager):  # pylint: disable=too-many-arguments, too-few-p
             An instance of ExperienceManager for managing user experiences.
         skills_manager (SkillsManager): 
             An instance of SkillsManager for managing user skills.
+        freshness_tracker (FreshnessTracker):
+            Tracks per-section content hashes so unchanged sections are not rewritten.
 
     Methods:
         get_total_number_of_bot_ids() -> List[int]: 
@@ -2258,13 +2251,18 @@ class LinkedInBot(BaseManager):  # pylint: disable=too-many-arguments, too-few-p
         scrape_linkedin_page(): 
             Master wrapper for the LinkedIn scraping processes.
             Handles login, retrieves user profiles, and performs scraping tasks.
+        refresh_profiles(daily_budget, min_age_days):
+            Re-scrapes already scraped profiles chosen by the refresh scheduler.
     """
-    database_manager = DatabaseManager()
+    database_manager = SharedDatabaseManager(DatabaseManager)
 
-    def __init__(self, bot_id):
-        super().__init__(WebDriverManager(bot_id=bot_id), LinkedInBot.database_manager)
+    def __init__(self, bot_id, webdriver_manager: Optional[WebDriverManager] = None):
+        if webdriver_manager is None:
+            webdriver_manager = WebDriverManager(bot_id=bot_id)
+        super().__init__(webdriver_manager, LinkedInBot.database_manager)
 
         self.bot_id = bot_id
+        self.freshness_tracker = FreshnessTracker()
         self.sign_in_manager = LinkedInSignInManager(
             webdriver_manager=self.webdriver_manager,
             database_manager=self.database_manager,
@@ -2278,23 +2276,28 @@ class LinkedInBot(BaseManager):  # pylint: disable=too-many-arguments, too-few-p
         self.main_page_scraper = MainUserPageScraper(
             webdriver_manager=self.webdriver_manager,
             database_manager=self.database_manager,
-            bot_id=self.bot_id
+            bot_id=self.bot_id,
+            freshness_tracker=self.freshness_tracker
         )
         self.contact_info_manager = ContactInfoManager(
             webdriver_manager=self.webdriver_manager,
-            database_manager=self.database_manager
+            database_manager=self.database_manager,
+            freshness_tracker=self.freshness_tracker
         )
         self.experience_manager = ExperienceManager(
             webdriver_manager=self.webdriver_manager,
             database_manager=self.database_manager,
+            freshness_tracker=self.freshness_tracker
         )
         self.skills_manager = SkillsManager(
             webdriver_manager=self.webdriver_manager,
             database_manager=self.database_manager,
+            freshness_tracker=self.freshness_tracker
         )
         self.education_manager = EducationManager(
             webdriver_manager=self.webdriver_manager,
-            database_manager=self.database_manager
+            database_manager=self.database_manager,
+            freshness_tracker=self.freshness_tracker
         )
 
     @classmethod
@@ -2343,117 +2346,160 @@ class LinkedInBot(BaseManager):  # pylint: disable=too-many-arguments, too-few-p
 
     def scrape_linkedin_page(self):
         """Master wrapper for the linkedin scraping processes."""
+        self._run_batch(run_name="scrape_linkedin_page", stages=FULL_SCRAPE_STAGES)
+
+    def _run_batch(self, run_name: str, stages: Tuple[str, ...]) -> None:
+        """
+        Scrape a batch of profiles, resuming an interrupted batch of the same run.
+
+        The batch and every finished stage are recorded in a run journal. If the
+        previous batch of this run did not complete, its URLs are scraped again
+        starting at each profile's first incomplete stage, instead of fetching
+        a new batch. A profile URL the browser rejects is journaled as failed
+        and skipped, here and when the batch is resumed.
+
+        Args:
+            run_name (str): Name of the run, one journal is kept per run and bot.
+            stages (tuple): The profile stages to run, in order.
+        """
         # Handle login
-        self.sign_in_manager.sign_in_wrapper(bot_id=self.bot_id)
+        with wait_stage("sign_in"):
+            self.sign_in_manager.sign_in_wrapper(bot_id=self.bot_id)
 
-        # Get the user profiles from the database
-        profile_urls: List[str] = self.profile_interactor.get_profile_urls()
+        journal = RunJournal(bot_id=self.bot_id, run_name=run_name)
+        profile_urls = journal.resume()
+        if profile_urls is None:
+            # Get the user profiles from the database
+            profile_urls = journal.start_batch(self.profile_interactor.get_profile_urls())
 
         # Loop through profile urls
         for profile_url in profile_urls:
-            
+            if journal.has_failed(profile_url):
+                continue
+
             # Get the user id
             user_id = self.get_user_id(profile_url=profile_url)
 
             print("USER ID: ", user_id)
 
-            # Visit the user's profile
-            self.profile_interactor.visit_user(profile_url=profile_url)
-
-            # Run the main page wrapper
-            self.main_page_scraper.main_user_page_scraper_wrapper(profile_url=profile_url)
+            try:
+                scraped = self.scrape_profile(
+                    user_id=user_id, profile_url=profile_url, stages=stages, journal=journal
+                )
+            except InvalidArgumentException as e:
+                # Journaled, so that resuming the batch does not stop at this URL again
+                logging.warning("Skipping invalid profile URL %s: %s", profile_url, e)
+                journal.mark_failed(profile_url, str(e))
+                continue
 
-            # Run the contact info manager wrapper
-            self.contact_info_manager.contact_info_manager_wrapper(user_id=user_id)
+            # Wait a little to go to the next profile
+            if scraped:
+                wait_accountant.pace(10)
 
-            # Run the skills wrapper
-            self.skills_manager.skills_wrapper(self.get_user_id(profile_url=profile_url), profile_url=profile_url)
+        journal.complete_batch()
+        wait_accountant.log_report()
 
-            # Run the experience wrapper
-            self.experience_manager.experience_wrapper(user_id=user_id)
+    def scrape_profile(
+            self, user_id: int, profile_url: str,
+            stages: Tuple[str, ...] = FULL_SCRAPE_STAGES,
+            journal: Optional[RunJournal] = None) -> bool:
+        """
+        Scrape the sections of one profile.
 
-            # Run the education wrapper
-            self.education_manager.education_wrapper(user_id=user_id)
+        Sections whose content hash matches the previous scrape are not
+        written, and the hashes of every seen section are recorded at the end.
+        Stages already completed according to the journal are skipped; the
+        profile is always visited again since the page state is lost on a crash.
 
-            # Wait a little to go to the next profile
-            time.sleep(10)
-        
-    def test(self, user_id, profile_url="file://C://Users//Doug Brown//Desktop//Dannys Stuff//Job//PreferredPartnerDB//scrapers//src//bots//linkedin//testing//hom.html"):
-        # Test the Experiences methods
-        self.driver.get(profile_url)
-        user_id = 1
-        self.contact_info_manager.contact_info_manager_wrapper(user_id=1)
-        # self.database_manager.export_to_xslx()
-
-    def scrape_name_and_contact_info(self):        
-        # Handle login
-        self.sign_in_manager.sign_in_wrapper(bot_id=self.bot_id)
+        Args:
+            user_id (int): The ID of the scraped user.
+            profile_url (str): The URL of the user's profile.
+            stages (tuple): The stages to run, in order.
+            journal (RunJournal, optional): Journal recording stage completion.
 
-        # Get the user profiles from the database
-        profile_urls: List[str] = self.profile_interactor.get_profile_urls()
+        Returns:
+            bool: False if every stage was already complete and the profile was not visited.
+        """
+        pending_stages = [
+            stage for stage in stages
+            if journal is None or not journal.is_complete(profile_url, stage)
+        ]
+        if not pending_stages:
+            return False
 
-        # Loop through profile urls
-        for profile_url in profile_urls:
-            
-            # Get the user id
-            user_id = self.get_user_id(profile_url=profile_url)
+        stage_wrappers = {
+            "main": lambda: self.main_page_scraper.main_user_page_scraper_wrapper(
+                profile_url=profile_url),
+            "contact_info": lambda: self.contact_info_manager.contact_info_manager_wrapper(
+                user_id=user_id),
+            "skills": lambda: self.skills_manager.skills_wrapper(user_id, profile_url=profile_url),
+            "experience": lambda: self.experience_manager.experience_wrapper(user_id=user_id),
+            "education": lambda: self.education_manager.education_wrapper(user_id=user_id),
+        }
 
-            print("USER ID: ", user_id)
+        # The stages read back what earlier stages wrote, so keep their reads on the primary
+        with span("profile", user_id=user_id, profile_url=profile_url), ProfileWriteSession():
+            self.freshness_tracker.begin(user_id)
 
             # Visit the user's profile
-            try:
+            with wait_stage("visit"):
                 self.profile_interactor.visit_user(profile_url=profile_url)
 
-            except InvalidArgumentException:
-                continue
-
-            """approval = input("Do you approve this page to be used in the database?")
+            for stage in pending_stages:
+                with wait_stage(stage):
+                    stage_wrappers[stage]()
+                if journal is not None:
+                    journal.mark_complete(profile_url, stage)
 
-            if approval.lower() == "n":
-                pass"""
+            self.freshness_tracker.commit()
+        return True
 
-            # else:
-            # Run the main page wrapper
-            self.main_page_scraper.main_user_page_scraper_wrapper(profile_url=profile_url)
+    def refresh_profiles(self, daily_budget: int = 200, min_age_days: int = 7) -> None:
+        """
+        Re-scrape already scraped profiles that are most likely out of date.
 
-            # Run the contact info manager wrapper
-            self.contact_info_manager.contact_info_manager_wrapper(user_id=user_id)
+        The budget is shared by every bot: each bot refreshes its own partition
+        of the users table, so running all bots never exceeds daily_budget.
 
-            # Wait a little to go to the next profile
-            time.sleep(10)
+        Args:
+            daily_budget (int): Maximum number of profiles refreshed per day across all bots.
+            min_age_days (int): Profiles seen more recently than this are not refreshed.
+        """
+        bot_ids = self.get_total_number_of_bot_ids()
+        scheduler = RefreshScheduler(daily_budget=daily_budget, min_age_days=min_age_days)
+        profiles = scheduler.get_profiles_to_refresh(
+            partition=bot_ids.index(self.bot_id), partitions=len(bot_ids)
+        )
+        if not profiles:
+            return
 
-    def scrape_name_and_location(self):
         # Handle login
         self.sign_in_manager.sign_in_wrapper(bot_id=self.bot_id)
 
-        # Get the user profiles from the database
-        profile_urls: List[str] = self.profile_interactor.get_profile_urls()
-
-        print("Profile URLS sent to LinkedinBot: ", profile_urls)
-
-        # Loop through profile urls
-        for profile_url in profile_urls:
-            
-            # Get the user id
-            user_id = self.get_user_id(profile_url=profile_url)
-
-            print("USER ID: ", user_id)
-
-            # Visit the user's profile
+        for user_id, profile_url in profiles:
             try:
-                self.profile_interactor.visit_user(profile_url=profile_url)
-
+                self.scrape_profile(user_id=user_id, profile_url=profile_url)
             except InvalidArgumentException:
                 continue
 
-            """approval = input("Do you approve this page to be used in the database?")
+            # Wait a little to go to the next profile
+            wait_accountant.pace(10)
 
-            if approval.lower() == "n":
-                pass"""
+        logging.info(
+            "Refreshed %s profiles, skipped %s unchanged sections",
+            len(profiles), self.freshness_tracker.skipped_sections
+        )
+        wait_accountant.log_report()
+        
+    def test(self, user_id, profile_url="file://C://Users//Doug Brown//Desktop//Dannys Stuff//Job//PreferredPartnerDB//scrapers//src//bots//linkedin//testing//hom.html"):
+        # Test the Experiences methods
+        self.driver.get(profile_url)
+        user_id = 1
+        self.contact_info_manager.contact_info_manager_wrapper(user_id=1)
+        # self.database_manager.export_to_xslx()
 
-            # else:
-            # Run the main page wrapper
-            self.main_page_scraper.main_user_page_scraper_wrapper(profile_url=profile_url)
+    def scrape_name_and_contact_info(self):
+        self._run_batch(run_name="scrape_name_and_contact_info", stages=("main", "contact_info"))
 
-            # Wait a little to go to the next profile
-            time.sleep(10)
\ No newline at end of file
+    def scrape_name_and_location(self):
+        self._run_batch(run_name="scrape_name_and_location", stages=("main",))
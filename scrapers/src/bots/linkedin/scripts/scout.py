@@ -45,9 +45,8 @@ Version:
 import logging
 import random
 import time
-from typing import List
+from typing import Dict, List, Optional
 
-import pandas as pd
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
@@ -63,6 +62,9 @@ from ....database.scripts.database_manager import DatabaseManager, LinkedInDatab
 logging.basicConfig(level=logging.INFO, filename="log.log", filemode="w",
                     format="%(asctime)s - %(levelname)s - %(message)s")
 
+# Conference contacts to search for, relative to the repository root
+CONTACTS_WORKBOOK = "BD Conference Parsed.xlsx"
+
 class GoogleSearcher(BaseManager):
     """
     GoogleSearcher provides functionality to interact with the Google search engine.
@@ -202,11 +204,10 @@ class LinkExtractor(BaseManager):  #pylint: disable=too-few-public-methods
         link_extractor_wrapper():
             Finds and returns a list of LinkedIn profile links from the webpage.
         _collect_links():
-            Waits for links to load on the webpage and returns a list of web elements
-            representing the links.
+            Waits for links to load on the webpage and returns the attributes
+            of every link, read with a single script call.
         _parse_links(links):
-            Parses a list of web elements representing links and 
-            filters out LinkedIn profile links.
+            Parses the link attributes and filters out LinkedIn profile links.
         _update_last_known_index(length):
             Updates the last known index to indicate the number of links processed.
     """
@@ -217,14 +218,14 @@ class LinkExtractor(BaseManager):  #pylint: disable=too-few-public-methods
         self.last_known_links_index = 0
         self.scroll_object = Scroller(webdriver_manager, linkedin_db_manager)
 
-    def _collect_links(self) -> List[WebElement]:
-        """Waits for the links to load."""
+    def _collect_links(self) -> List[Dict[str, Optional[str]]]:
+        """Waits for the links to load and returns their href, className and target."""
         try:
-            links = self.wait.until(
-                EC.presence_of_all_elements_located((By.TAG_NAME, 'a'))
+            self.wait.until(
+                EC.presence_of_element_located((By.TAG_NAME, 'a'))
             )
 
-            return links
+            return self.webdriver_manager.page_cache.anchors()
 
         except NoSuchElementException:
             logging.critical("Link elements were not found in the Google search.")
@@ -235,25 +236,25 @@ class LinkExtractor(BaseManager):  #pylint: disable=too-few-public-methods
             raise
 
 
-    def _parse_links(self, links: List[WebElement], site: str) -> List[str]:
+    def _parse_links(self, links: List[Dict[str, Optional[str]]], site: str) -> List[str]:
         """Parses LinkedIn profile links."""
         if site.lower() == 'google':
             return [
-                link.get_attribute('href')
+                link['href']
                 for link in links
-                if link.get_attribute('href') is not None
-                and 'www.linkedin.com/in' in link.get_attribute('href')
+                if link['href'] is not None
+                and 'www.linkedin.com/in' in link['href']
             ]
         
         else:
             return [
-                link.get_attribute('href')
+                link['href']
                 for link in links
-                if link.get_attribute('href') is not None
-                and 'www.linkedin.com/in' in link.get_attribute('href')
-                and 'app-aware-link' in link.get_attribute('class')
-                and 'scale-down' in link.get_attribute('class')
-                and link.get_attribute('target') != '_self'
+                if link['href'] is not None
+                and 'www.linkedin.com/in' in link['href']
+                and 'app-aware-link' in link['className']
+                and 'scale-down' in link['className']
+                and link['target'] != '_self'
             ]
     
     def link_extractor_wrapper(self, user_count, site):
@@ -384,14 +385,17 @@ class Scout(BaseManager):  #pylint: disable=too-few-public-methods
         scroller (Scroller): Instance of Scroller class for scrolling the webpage.
 
     Methods:
-        __init__():
+        __init__(webdriver_manager=None):
             Initializes a Scout instance with WebDriverManager and DatabaseManager.
+            A WebDriverManager is started unless one is given.
         execute(user_count=20):
             Executes the search process, link extraction, and database updates.
             If the link count exceeds the user_count, trims the list to match.
     """
-    def __init__(self) -> None:
-        super().__init__(WebDriverManager(), DatabaseManager())
+    def __init__(self, webdriver_manager: Optional[WebDriverManager] = None) -> None:
+        if webdriver_manager is None:
+            webdriver_manager = WebDriverManager()
+        super().__init__(webdriver_manager, DatabaseManager())
 
         self.linkedin_db_manager = LinkedInDatabaseManager()
 
@@ -457,10 +461,10 @@ class Scout(BaseManager):  #pylint: disable=too-few-public-methods
         links = self.link_extractor.link_extractor_wrapper(user_count=user_count, site=site)
         self.linkedin_db_manager.update_profile_urls_from_scout(links)
 
-    def get_profiles_from_excel(self):
+    def get_profiles_from_excel(self, file_path: str = CONTACTS_WORKBOOK):
+        import pandas as pd  # pylint: disable=import-outside-toplevel
 
         # Load the Excel file
-        file_path = 'C://Users//Doug Brown//Desktop//BD Conference Parsed.xlsx'
         excel_data = pd.ExcelFile(file_path)
 
         # Assuming the data is in the first sheet, change the sheet name if necessary
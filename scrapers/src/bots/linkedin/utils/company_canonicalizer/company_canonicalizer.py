@@ -0,0 +1,125 @@
+"""
+Canonicalizes scraped company names and links work_experience rows to the
+companies table.
+
+"Google", "Google LLC" and "Google, Inc." all fold to the canonical name
+"google": the name is case folded, punctuation is dropped and trailing legal
+suffixes are stripped. Names that folding cannot reconcile are resolved
+through the company_aliases table.
+
+Usage:
+    >>> backfill = CompanyBackfill()
+    >>> backfill.run()
+
+    Or from the command line:
+
+    $ python -m scrapers.src.bots.linkedin.utils.company_canonicalizer.company_canonicalizer
+"""
+import logging
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from .....database.scripts.database_manager import CompanyDatabaseManager
+
+logging.basicConfig(level=logging.INFO, filename="log.log", filemode="w",
+                    format="%(asctime)s - %(levelname)s - %(message)s")
+
+LEGAL_SUFFIXES = {
+    "inc", "incorporated", "llc", "llp", "lp", "pllc", "ltd", "limited",
+    "corp", "corporation", "co", "company", "plc", "gmbh", "ag", "sa",
+    "nv", "bv", "pc", "pty", "srl",
+}
+
+class CompanyCanonicalizer:
+    def __init__(self, aliases: Optional[Dict[str, int]] = None) -> None:
+        self.aliases = aliases or {}
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def canonicalize(company_name: str) -> str:
+        """
+        Fold a company name to its canonical form.
+
+        Args:
+            company_name (str): The raw name, e.g. "RELI Group, Inc.".
+
+        Returns:
+            str: The canonical name, e.g. "reli group". Empty if nothing is left.
+        """
+        # LinkedIn appends the employment type, e.g. "RELI Group, Inc. · Full-time"
+        name = company_name.split(" · ")[0]
+        name = name.casefold().replace("&", " and ")
+        # "l.l.c." -> "llc" before the remaining punctuation becomes whitespace
+        name = re.sub(r"(?<=\b\w)\.(?=\w\b)", "", name)
+        name = re.sub(r"[^\w\s]", " ", name)
+        words = name.split()
+
+        # Strip trailing legal suffixes, but never the whole name
+        while len(words) > 1 and words[-1] in LEGAL_SUFFIXES:
+            words.pop()
+
+        return " ".join(words)
+
+    def resolve_alias(self, company_name: str) -> Optional[int]:
+        """Return the company_id of an aliased name, if any."""
+        return self.aliases.get(self.canonicalize(company_name))
+
+class CompanyBackfill:
+    """
+    Fills work_experience.company_id for every row that does not have one.
+
+    Known companies and aliases are loaded once into dictionaries, so every
+    raw name is resolved with hash lookups. Missing companies are inserted and
+    all rows are linked with one bulk statement each.
+    """
+    def __init__(self, company_db_manager: Optional[CompanyDatabaseManager] = None) -> None:
+        self.company_db_manager = company_db_manager or CompanyDatabaseManager()
+
+    def run(self) -> int:
+        """
+        Run the backfill.
+
+        Returns:
+            int: Number of work_experience rows linked to a company.
+        """
+        company_ids = self.company_db_manager.get_company_ids()
+        canonicalizer = CompanyCanonicalizer(self.company_db_manager.get_company_aliases())
+        unlinked_names = self.company_db_manager.get_unlinked_company_names()
+
+        links: List[Tuple[str, int]] = []
+        # canonical name -> [(raw name, row count)] for companies that do not exist yet
+        new_companies: Dict[str, List[Tuple[str, int]]] = {}
+
+        for company_name, row_count in unlinked_names:
+            canonical_name = canonicalizer.canonicalize(company_name)
+            if not canonical_name:
+                continue
+
+            company_id = canonicalizer.aliases.get(canonical_name) or company_ids.get(canonical_name)
+            if company_id:
+                links.append((company_name, company_id))
+            else:
+                new_companies.setdefault(canonical_name, []).append((company_name, row_count))
+
+        # The most common spelling becomes the display name
+        inserted_ids = self.company_db_manager.insert_companies([
+            (canonical_name, max(spellings, key=lambda spelling: spelling[1])[0])
+            for canonical_name, spellings in new_companies.items()
+        ])
+        for canonical_name, spellings in new_companies.items():
+            for company_name, _ in spellings:
+                links.append((company_name, inserted_ids[canonical_name]))
+
+        linked_rows = self.company_db_manager.link_work_experience(links)
+        logging.info(
+            "Linked %s work_experience rows (%s new companies)", linked_rows, len(new_companies)
+        )
+        return linked_rows
+
+def main():
+    linked_rows = CompanyBackfill().run()
+    print(f"Linked {linked_rows} work experience rows to companies")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Parses the text of LinkedIn experience entries: date ranges and descriptions.
+
+These helpers only work on strings, so they live apart from the scraper and
+can be used, tested and benchmarked without selenium or a browser.
+ExperienceManager exposes them as its parse_date_range and
+remove_emojis_and_blank_lines staticmethods.
+
+Usage:
+    >>> parse_date_range("Mar 2018 - Present · 6 yrs 2 mos")
+    ['2018-03-01', None]
+    >>> remove_emojis_and_blank_lines("• Built things 🚀\\n\\n• Shipped them")
+    'Built things Shipped them'
+"""
+import logging
+import re
+from typing import List, Optional
+
+logging.basicConfig(level=logging.INFO, filename="log.log", filemode="w",
+                    format="%(asctime)s - %(levelname)s - %(message)s")
+
+MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4,
+    'May': 5, 'Jun': 6, 'Jul': 7, 'Aug': 8,
+    'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+
+DATE_PATTERN = re.compile(
+    r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}\b|\b\d{4}\b|Present'
+)
+
+EMOJI_PATTERN = re.compile("["
+                           u"\U0001F600-\U0001F64F"  # emoticons
+                           u"\U0001F300-\U0001F5FF"  # symbols & pictographs
+                           u"\U0001F680-\U0001F6FF"  # transport & map symbols
+                           u"\U0001F700-\U0001F77F"  # alchemical symbols
+                           u"\U0001F780-\U0001F7FF"  # Geometric Shapes Extended
+                           u"\U0001F800-\U0001F8FF"  # Supplemental Arrows-C
+                           u"\U0001F900-\U0001F9FF"  # Supplemental Symbols and Pictographs
+                           u"\U0001FA00-\U0001FA6F"  # Chess Symbols
+                           u"\U0001FA70-\U0001FAFF"  # Symbols and Pictographs Extended-A
+                           u"\U00002702-\U000027B0"  # Dingbats
+                           u"\U000024C2-\U0001F251"
+                           "]+", flags=re.UNICODE)
+
+class DateRange(list):
+    """
+    The [start_date, end_date] list returned by parse_date_range, with what
+    the dates really say.
+
+    LinkedIn shows "Mar 2018" or "2018", never a day, so each YYYY-MM-DD date is
+    the first day of its month or year; precisions holds 'month' or 'year' for
+    the date at the same position, so "Jan 2018 - 2018" keeps both. A "Present"
+    end date is None with is_current set, rather than the date of the scrape.
+    Pad or truncate with pair(), which moves the precisions with the dates.
+    """
+    def __init__(self, dates=(), precisions: Optional[List[Optional[str]]] = None,
+                 is_current: bool = False) -> None:
+        super().__init__(dates)
+        self.precisions = list(precisions) if precisions is not None else [None] * len(self)
+        self.is_current = is_current
+
+    def pair(self) -> "DateRange":
+        """
+        Return the range as exactly [start_date, end_date].
+
+        A single date is the end date, and dates after the second are dropped.
+
+        Returns:
+            DateRange: The two dates, with their precisions.
+        """
+        return DateRange(
+            ([None, None] + self[:2])[-2:], ([None, None] + self.precisions[:2])[-2:], self.is_current
+        )
+
+    @property
+    def start_precision(self) -> Optional[str]:
+        return self.pair().precisions[0]
+
+    @property
+    def end_precision(self) -> Optional[str]:
+        return self.pair().precisions[1]
+
+def remove_emojis_and_blank_lines(text):
+    """
+    Remove emojis, bullet points, and blank lines from the given text.
+
+    Args:
+    text (str): The input text containing emojis, bullet points, and blank lines.
+
+    Returns:
+    str: The text with emojis, bullet points, and blank lines removed.
+    """
+    # Remove emojis
+    text_without_emojis = EMOJI_PATTERN.sub(r'', text)
+
+    # Remove bullet points
+    text_without_bullets = text_without_emojis.replace("•", "").strip()
+
+    # Remove special characters
+    text_without_special_characters = text_without_bullets.replace("�", "").strip()
+
+    # Replace blank lines with comma
+    lines = text_without_special_characters.split('\n')
+    clean_lines = (line.strip() for line in lines if line.strip())
+    return ' '.join(clean_lines)
+
+def parse_date_range(date_range_text: str) -> DateRange:
+    """
+    Parse the date range text into a list containing start and end dates.
+
+    Args:
+        date_range_text (str): The text containing the date range.
+
+    Returns:
+        DateRange: A list containing the start and end dates in the format YYYY-MM-DD,
+            with None for "Present", and the precision of each date.
+    """
+    # Extract the start and end dates using regex
+    dates = DATE_PATTERN.findall(date_range_text)
+
+    # Convert dates to YYYY-MM-DD format
+    formatted_dates = DateRange()
+    for date_str in dates:
+        if date_str == "Present":
+            # Open-ended: storing today's date would go stale after the scrape
+            formatted_dates.append(None)
+            formatted_dates.precisions.append(None)
+            formatted_dates.is_current = True
+        else:
+            # Check if the date string contains a month and a year
+            date_parts = date_str.split()
+            if len(date_parts) == 2:
+                month_str, year_str = date_parts
+                formatted_date = f"{year_str}-{MONTHS[month_str]:02d}-01"
+                precision = "month"
+            elif len(date_parts) == 1 and date_parts[0].isdigit():
+                year_str = date_parts[0]
+                formatted_date = f"{year_str}-01-01"
+                precision = "year"
+            else:
+                continue
+            formatted_dates.append(formatted_date)
+            formatted_dates.precisions.append(precision)
+
+    return formatted_dates
@@ -1,22 +1,26 @@
 import re
-import pycountry
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
-from geopy.geocoders import Nominatim
-from geopy.exc import GeocoderTimedOut
 from .states import state_abbreviations
+from .....database.scripts.database_manager import LocationDatabaseManager  # pylint: disable=relative-beyond-top-level
 
 logging.basicConfig(level=logging.INFO, filename="log.log", filemode="w",
                     format="%(asctime)s - %(levelname)s - %(message)s")
 
 class LocationFormatter:
-    def __init__(self):
+    def __init__(self, geolocator=None):
         self.user_agent = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
                            "AppleWebKit/537.36 (KHTML, like Gecko) "
                            "Chrome/124.0.0.0 "
                            "Safari/537.36"
         )
-        self.geolocator = Nominatim(user_agent=self.user_agent)
+        # Any object with a geopy-style geocode(query, timeout) method can stand in for Nominatim
+        if geolocator is None:
+            from geopy.geocoders import Nominatim  # pylint: disable=import-outside-toplevel
+            geolocator = Nominatim(user_agent=self.user_agent)
+        self.geolocator = geolocator
 
     def clean_location(self, location):
         words_to_remove = ["Metropolitan", "Area", "Greater", "Metro"]
@@ -24,6 +28,10 @@ class LocationFormatter:
         return cleaned_location.strip()
 
     def reformat_location(self, location, max_retries=3):
+        # geopy and pycountry are only loaded by bots that resolve locations
+        import pycountry  # pylint: disable=import-outside-toplevel
+        from geopy.exc import GeocoderTimedOut  # pylint: disable=import-outside-toplevel
+
         if location is not None:
             cleaned_location = self.clean_location(location)
             filtered_loc = cleaned_location.split("-")[0]
@@ -59,13 +67,58 @@ class LocationFormatter:
                         elif city and country:
                             return f'{city}, {country}'
                         else:
-                            logging.warning("Unknown location: ", location)
+                            logging.warning("Unknown location: %s", location)
                             return 'United States'
                     else:
-                        logging.warning("No geolocation found for ", location)
+                        logging.warning("No geolocation found for %s", location)
                         return 'United States'
                 except GeocoderTimedOut:
                     retry_count += 1
                     print(f"Connection timed out. Retrying attempt {retry_count}.")
         
         return 'United States'
+
+class LocationNormalizationJob:
+    """
+    Rewrites the raw locations of users and jobs as "City, ST" (or "City, Country").
+
+    Each distinct raw location is geocoded once, by `jobs` threads at a time,
+    and written to all of its rows with bulk UPDATEs. Locations already in
+    "City, ST" form are skipped, and locations that cannot be resolved keep
+    their raw value rather than becoming 'United States'.
+    """
+    FORMATTED_LOCATION = re.compile(r"^[^,]+, [A-Z]{2}$")
+
+    def __init__(self, location_db_manager: Optional[LocationDatabaseManager] = None,
+                 location_formatter: Optional[LocationFormatter] = None, jobs: int = 1) -> None:
+        self.location_db_manager = location_db_manager or LocationDatabaseManager()
+        self.location_formatter = location_formatter or LocationFormatter()
+        self.jobs = jobs
+
+    def run(self) -> int:
+        """
+        Run the normalization.
+
+        Returns:
+            int: Number of updated users and work_experience rows.
+        """
+        raw_locations = [
+            location for location in self.location_db_manager.get_distinct_locations()
+            if not self.FORMATTED_LOCATION.match(location)
+        ]
+        # Geocoding waits on the network, so threads are enough
+        with ThreadPoolExecutor(max_workers=max(self.jobs, 1)) as executor:
+            formatted = list(executor.map(self.location_formatter.reformat_location, raw_locations))
+
+        formatted_locations = [
+            (raw_location, formatted_location)
+            for raw_location, formatted_location in zip(raw_locations, formatted)
+            if formatted_location != raw_location and formatted_location != 'United States'
+        ]
+        updated_rows = self.location_db_manager.update_locations(formatted_locations)
+        logging.info(
+            "Formatted %s of %s distinct locations across %s rows",
+            len(formatted_locations), len(raw_locations), updated_rows
+        )
+        return updated_rows
+
@@ -0,0 +1,132 @@
+"""
+Freshness tracking for scraped LinkedIn profiles.
+
+Every profile section the bot scrapes (main, contact_info, skills, experience,
+education) is hashed. FreshnessTracker compares the hash with the one stored
+by the previous scrape so unchanged sections are not written again, and
+RefreshScheduler picks which already scraped profiles to revisit within a
+daily budget, ordered by staleness and past change rate.
+
+Usage:
+    >>> tracker = FreshnessTracker()
+    >>> tracker.begin(user_id)
+    >>> if tracker.section_changed("skills", skills_set):
+    ...     write_skills(skills_set)
+    >>> tracker.commit()
+
+    >>> RefreshScheduler(daily_budget=200).get_profiles_to_refresh()
+"""
+import hashlib
+import json
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from .....database.scripts.database_manager import FreshnessDatabaseManager
+
+logging.basicConfig(level=logging.INFO, filename="log.log", filemode="w",
+                    format="%(asctime)s - %(levelname)s - %(message)s")
+
+def section_hash(content: Any) -> str:
+    """
+    Return the SHA-256 of a scraped section.
+
+    Sets are sorted first, so the same skills scraped in a different order
+    hash the same.
+    """
+    if isinstance(content, (set, frozenset)):
+        content = sorted(content, key=str)
+    serialized = json.dumps(content, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+class FreshnessTracker:
+    """
+    Compares the sections of one profile with its previous scrape.
+
+    begin() loads the stored hashes of a user with one query, section_changed()
+    is answered from memory, and commit() records every seen section with one
+    bulk upsert.
+    """
+    def __init__(self, freshness_db_manager: Optional[FreshnessDatabaseManager] = None) -> None:
+        self.freshness_db_manager = freshness_db_manager or FreshnessDatabaseManager()
+        self.user_id: Optional[int] = None
+        self.stored_hashes: Dict[str, str] = {}
+        self.seen_hashes: List[Tuple[str, str]] = []
+        self.skipped_sections = 0
+
+    def begin(self, user_id: int) -> None:
+        """Start tracking the scrape of a user."""
+        self.user_id = user_id
+        self.stored_hashes = self.freshness_db_manager.get_section_hashes(user_id)
+        self.seen_hashes = []
+
+    def section_changed(self, section: str, content: Any) -> bool:
+        """
+        Record a scraped section and tell whether it needs to be written.
+
+        Args:
+            section (str): The section name, e.g. "skills".
+            content: The scraped content of the section.
+
+        Returns:
+            bool: False if the section is identical to the previous scrape.
+        """
+        if self.user_id is None:
+            return True
+
+        content_hash = section_hash(content)
+        self.seen_hashes.append((section, content_hash))
+        if self.stored_hashes.get(section) == content_hash:
+            self.skipped_sections += 1
+            logging.info("Section %s of user %s is unchanged, skipping writes", section, self.user_id)
+            return False
+        return True
+
+    def commit(self) -> None:
+        """Store the hashes of every section seen since begin()."""
+        if self.user_id is None:
+            return
+        self.freshness_db_manager.record_section_hashes(self.user_id, self.seen_hashes)
+        self.user_id = None
+        self.stored_hashes = {}
+        self.seen_hashes = []
+
+class RefreshScheduler:
+    """
+    Picks already scraped profiles to refresh within a daily budget.
+
+    Args:
+        daily_budget (int): Maximum number of profiles refreshed per day across all bots.
+        min_age_days (int): Profiles seen more recently than this are never refreshed.
+        freshness_db_manager (FreshnessDatabaseManager): Optional database manager.
+    """
+    def __init__(self, daily_budget: int = 200, min_age_days: int = 7,
+                 freshness_db_manager: Optional[FreshnessDatabaseManager] = None) -> None:
+        self.daily_budget = daily_budget
+        self.min_age_days = min_age_days
+        self.freshness_db_manager = freshness_db_manager or FreshnessDatabaseManager()
+
+    def get_profiles_to_refresh(self, partition: int = 0, partitions: int = 1) -> List[Tuple[int, str]]:
+        """
+        Return this bot's share of today's remaining refresh budget.
+
+        Args:
+            partition (int): Index of the calling bot.
+            partitions (int): Number of bots sharing the budget.
+
+        Returns:
+            list: (user_id, profile_url) tuples, most urgent first.
+        """
+        remaining = self.daily_budget - self.freshness_db_manager.count_refreshed_today()
+        if remaining <= 0:
+            logging.info("Daily refresh budget of %s profiles is used up", self.daily_budget)
+            return []
+
+        limit = -(-remaining // partitions)
+        profiles = self.freshness_db_manager.get_refresh_candidates(
+            limit=limit, min_age_days=self.min_age_days,
+            partition=partition, partitions=partitions
+        )
+        logging.info(
+            "Scheduled %s profiles for refresh (%s left in today's budget)", len(profiles), remaining
+        )
+        return profiles
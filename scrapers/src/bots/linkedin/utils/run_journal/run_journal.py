@@ -0,0 +1,131 @@
+"""
+Append-only journal of a bot's scraping batch, used to resume after a crash.
+
+A batch starts with the list of profile URLs it will scrape. Every finished
+stage of a profile (main, contact_info, skills, ...) is appended as its own
+line and flushed to disk, and a final line marks the batch complete. When a
+bot restarts and the last batch is incomplete, it resumes with the same URLs
+and skips every stage that already finished, so a crash costs at most the
+stage that was running. A profile that cannot be scraped at all (an invalid
+URL) is journaled as failed and skipped on resume, so it cannot block the batch.
+
+Each bot and run type has its own file, e.g. journals/scrape_linkedin_page_bot3.jsonl:
+
+    {"event": "batch_start", "urls": ["https://...", ...], "at": "..."}
+    {"event": "stage_complete", "url": "https://...", "stage": "main", "at": "..."}
+    {"event": "profile_failed", "url": "https://...", "error": "...", "at": "..."}
+    {"event": "batch_complete", "at": "..."}
+
+Usage:
+    >>> journal = RunJournal(bot_id=3, run_name="scrape_linkedin_page")
+    >>> profile_urls = journal.resume() or journal.start_batch(fetch_profile_urls())
+    >>> if not journal.is_complete(url, "skills"):
+    ...     scrape_skills(url)
+    ...     journal.mark_complete(url, "skills")
+    >>> journal.complete_batch()
+"""
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set
+
+logging.basicConfig(level=logging.INFO, filename="log.log", filemode="w",
+                    format="%(asctime)s - %(levelname)s - %(message)s")
+
+DEFAULT_JOURNAL_DIR = os.path.join("scrapers", "journals")
+
+class RunJournal:
+    """
+    Records per-URL stage completion of one bot's batch.
+
+    Args:
+        bot_id (int): The bot running the batch.
+        run_name (str): The kind of run, e.g. "scrape_linkedin_page".
+        journal_dir (str): Directory of the journal files.
+    """
+    def __init__(self, bot_id: int, run_name: str, journal_dir: str = DEFAULT_JOURNAL_DIR) -> None:
+        os.makedirs(journal_dir, exist_ok=True)
+        self.path = os.path.join(journal_dir, f"{run_name}_bot{bot_id}.jsonl")
+        self.urls: List[str] = []
+        self.completed: Dict[str, Set[str]] = {}
+        self.failed: Dict[str, str] = {}
+
+    def _append(self, event: dict, mode: str = "a") -> None:
+        """Write one event and make sure it reaches the disk before returning."""
+        event["at"] = datetime.now(timezone.utc).isoformat()
+        with open(self.path, mode=mode, encoding="utf-8") as journal_file:
+            journal_file.write(json.dumps(event) + "\n")
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+
+    def resume(self) -> Optional[List[str]]:
+        """
+        Load the last batch if it did not complete.
+
+        Returns:
+            list: The URLs of the interrupted batch, or None if there is nothing to resume.
+        """
+        if not os.path.exists(self.path):
+            return None
+
+        urls, completed, failed, finished = None, {}, {}, False
+        with open(self.path, mode="r", encoding="utf-8") as journal_file:
+            for line in journal_file:
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    # A line cut short by the crash
+                    logging.warning("Ignoring a truncated line in %s", self.path)
+                    continue
+
+                if event["event"] == "batch_start":
+                    urls, completed, failed, finished = event["urls"], {}, {}, False
+                elif event["event"] == "stage_complete":
+                    completed.setdefault(event["url"], set()).add(event["stage"])
+                elif event["event"] == "profile_failed":
+                    failed[event["url"]] = event.get("error", "")
+                elif event["event"] == "batch_complete":
+                    finished = True
+
+        if urls is None or finished:
+            return None
+
+        self.urls, self.completed, self.failed = urls, completed, failed
+        logging.info(
+            "Resuming batch of %s profiles from %s (%s already started, %s failed)",
+            len(urls), self.path, len(completed), len(failed)
+        )
+        return urls
+
+    def start_batch(self, urls: List[str]) -> List[str]:
+        """
+        Start a new batch, replacing the journal of the previous (complete) one.
+
+        Args:
+            urls (list): The profile URLs of the batch.
+
+        Returns:
+            list: The same URLs.
+        """
+        self.urls, self.completed, self.failed = list(urls), {}, {}
+        self._append({"event": "batch_start", "urls": self.urls}, mode="w")
+        return self.urls
+
+    def is_complete(self, url: str, stage: str) -> bool:
+        return stage in self.completed.get(url, ())
+
+    def mark_complete(self, url: str, stage: str) -> None:
+        self.completed.setdefault(url, set()).add(stage)
+        self._append({"event": "stage_complete", "url": url, "stage": stage})
+
+    def mark_failed(self, url: str, error: str) -> None:
+        """Record that a profile cannot be scraped, so a resumed batch skips it."""
+        self.failed[url] = error
+        self._append({"event": "profile_failed", "url": url, "error": error})
+
+    def has_failed(self, url: str) -> bool:
+        return url in self.failed
+
+    def complete_batch(self) -> None:
+        self._append({"event": "batch_complete"})
@@ -2,7 +2,6 @@ import logging
 import random
 import time
 from typing import List
-from datetime import datetime
 
 import pandas as pd
 from pandas import DataFrame
@@ -17,6 +16,7 @@ from selenium.webdriver.common.keys import Keys
 from ...scripts.linkedinbot import BaseManager  # pylint: disable=relative-beyond-top-level
 from ....webdriver.webdriver_manager import WebDriverManager
 from .....database.scripts.database_manager import DatabaseManager, LinkedInDatabaseManager  # pylint: disable=relative-beyond-top-level
+from .salary_calculator import SalaryCalculator
 
 logging.basicConfig(level=logging.INFO, filename="log.log", filemode="w",
                     format="%(asctime)s - %(levelname)s - %(message)s")
@@ -88,29 +88,6 @@ class SalaryScraper(BaseManager):
         time.sleep(5)
 
 
-class SalaryCalculator:
-    current_date = datetime.now()
-
-    def __init__(self, salary: float, start_date: str, end_date: str) -> None:
-        self.salary = salary,
-        self.start_date = start_date,
-        self.end_date = end_date,
-        self.inflation = 0.03  #  3% per year
-        self.current_year = self.current_date.year
-
-    def generate_list_of_years(self):
-        # Extract the years
-        start_date_year = int(self.start_date[0][:4])
-        end_date_year = int(self.end_date[0][:4])
-        if end_date_year > start_date_year:
-            return list(range(start_date_year, end_date_year + 1))
-        return [start_date_year]
-
-    def calculate_pre_taxed_salary(self, year):
-        pre_taxed_income = self.salary[0] / ((1 + self.inflation) ** (self.current_year - year))  # Only calculates for 1 year. Expected input comes from a  member of list_of_years
-        return pre_taxed_income
-
-
 class FederalTaxCalculator(SalaryCalculator):
     def __init__(self, salary: float, start_date: str, end_date: str) -> None:
         super().__init__(salary, start_date, end_date)
@@ -124,10 +101,10 @@ class FederalTaxCalculator(SalaryCalculator):
 
         # Iterate over DataFrame columns
         for col in cols:
-            # Check if the column contains strings
-            if df[col].dtype == 'object':
+            # Check if the column contains strings (object dtype before pandas 3, str since)
+            if pd.api.types.is_string_dtype(df[col]):
                 # Use regular expression to remove '$' and ',' characters, then convert to float
-                df[col] = df[col].replace('[\$,]', '', regex=True).astype(float)
+                df[col] = df[col].replace(r'[\$,]', '', regex=True).astype(float)
 
         # Convert the year column to integers
         if 'Year' in df.columns:
@@ -234,15 +211,16 @@ class FederalTaxCalculator(SalaryCalculator):
         print(df.head(10))
 
 
-# Example usage
-calc = SalaryCalculator(100, '2015-09-09', '2020-10-02')
-fedcalc = FederalTaxCalculator(100, '2015-09-09', '2020-10-02')
-list_of_years = calc.generate_list_of_years()
-print(list_of_years)
-pretaxed_vals = []
-for year in list_of_years:
-    pretaxed_val = calc.calculate_pre_taxed_salary(year)
-    rouded_pretaxed_val = round(pretaxed_val, 2)
-    pretaxed_vals.append(rouded_pretaxed_val)
-print(pretaxed_vals)
-fedcalc.calcalate_federal_tax(2023)
+if __name__ == "__main__":
+    # Example usage
+    calc = SalaryCalculator(100, '2015-09-09', '2020-10-02')
+    fedcalc = FederalTaxCalculator(100, '2015-09-09', '2020-10-02')
+    list_of_years = calc.generate_list_of_years()
+    print(list_of_years)
+    pretaxed_vals = []
+    for year in list_of_years:
+        pretaxed_val = calc.calculate_pre_taxed_salary(year)
+        rouded_pretaxed_val = round(pretaxed_val, 2)
+        pretaxed_vals.append(rouded_pretaxed_val)
+    print(pretaxed_vals)
+    fedcalc.calcalate_federal_tax(2023)
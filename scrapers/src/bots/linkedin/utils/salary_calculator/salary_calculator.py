@@ -0,0 +1,123 @@
+"""
+Estimate the earnings of each work experience from scraped salaries.
+
+The median salary scraped for a job title (the salaries table) is taken as
+today's pay, discounted by inflation for every year of the experience and
+summed. Titles without a scraped salary are left unestimated.
+
+Usage:
+    $ python -m scrapers.src.bots.linkedin.utils.salary_calculator.salary_calculator
+"""
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from itertools import islice
+from typing import List, Optional, Tuple
+
+from .....database.scripts.database_manager import SalaryDatabaseManager  # pylint: disable=relative-beyond-top-level
+
+logging.basicConfig(level=logging.INFO, filename="log.log", filemode="w",
+                    format="%(asctime)s - %(levelname)s - %(message)s")
+
+class SalaryCalculator:
+    current_date = datetime.now()
+
+    def __init__(self, salary: float, start_date: str, end_date: str) -> None:
+        self.salary = salary,
+        self.start_date = start_date,
+        self.end_date = end_date,
+        self.inflation = 0.03  #  3% per year
+        self.current_year = self.current_date.year
+
+    def generate_list_of_years(self):
+        # Extract the years
+        start_date_year = int(self.start_date[0][:4])
+        end_date_year = int(self.end_date[0][:4])
+        if end_date_year > start_date_year:
+            return list(range(start_date_year, end_date_year + 1))
+        return [start_date_year]
+
+    def calculate_pre_taxed_salary(self, year):
+        pre_taxed_income = self.salary[0] / ((1 + self.inflation) ** (self.current_year - year))  # Only calculates for 1 year. Expected input comes from a  member of list_of_years
+        return pre_taxed_income
+
+def estimate_earnings(salary: float, start_date: str, end_date: Optional[str]) -> float:
+    """
+    Sum the inflation-adjusted salary over every year of an experience.
+
+    Args:
+        salary (float): Today's salary for the job title.
+        start_date (str): YYYY-MM-DD start of the experience.
+        end_date (str): YYYY-MM-DD end of the experience, None while current.
+
+    Returns:
+        float: Estimated earnings, rounded to cents.
+    """
+    end_date = end_date or SalaryCalculator.current_date.strftime("%Y-%m-%d")
+    calculator = SalaryCalculator(salary, start_date, end_date)
+    return round(sum(
+        calculator.calculate_pre_taxed_salary(year) for year in calculator.generate_list_of_years()
+    ), 2)
+
+def _estimate_chunk(experiences: List[Tuple[int, float, str, Optional[str]]]) -> List[Tuple[int, float]]:
+    # Module level so that worker processes can unpickle it
+    return [
+        (experience_id, estimate_earnings(salary, start_date, end_date))
+        for experience_id, salary, start_date, end_date in experiences
+    ]
+
+class SalaryEstimationJob:
+    """
+    Writes estimated_net_earnings for every work experience whose title has a scraped salary.
+
+    The experiences are streamed from the server chunk by chunk, and each
+    chunk's estimates are written with one bulk UPDATE, so memory stays flat
+    however large work_experience grows. With jobs > 1 that many chunks are
+    estimated at once, in worker processes.
+    """
+    def __init__(self, salary_db_manager: Optional[SalaryDatabaseManager] = None, jobs: int = 1,
+                 chunk_size: int = 10_000) -> None:
+        self.salary_db_manager = salary_db_manager or SalaryDatabaseManager()
+        self.jobs = jobs
+        self.chunk_size = chunk_size
+
+    def run(self) -> int:
+        """
+        Run the estimation.
+
+        Returns:
+            int: Number of updated work_experience rows.
+        """
+        median_salaries = self.salary_db_manager.get_median_salaries()
+        chunks = (
+            [
+                (experience_id, median_salaries[title], str(start_date), end_date and str(end_date))
+                for experience_id, title, start_date, end_date in rows
+                if title in median_salaries
+            ]
+            for rows in self.salary_db_manager.get_unestimated_experiences(chunk_size=self.chunk_size)
+        )
+
+        updated_rows = 0
+        if self.jobs > 1:
+            with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                # executor.map would read every chunk up front, so submit `jobs` chunks at a time
+                for batch in iter(lambda: list(islice(chunks, self.jobs)), []):
+                    for estimates in executor.map(_estimate_chunk, batch):
+                        updated_rows += self.salary_db_manager.update_estimated_earnings(estimates)
+        else:
+            for chunk in chunks:
+                updated_rows += self.salary_db_manager.update_estimated_earnings(_estimate_chunk(chunk))
+
+        logging.info(
+            "Estimated the earnings of %s work_experience rows from %s job title salaries",
+            updated_rows, len(median_salaries)
+        )
+        return updated_rows
+
+def main():
+    updated_rows = SalaryEstimationJob().run()
+    print(f"Estimated the earnings of {updated_rows} work experience rows")
+
+if __name__ == "__main__":
+    main()
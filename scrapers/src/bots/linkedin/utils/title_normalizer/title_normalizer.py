@@ -0,0 +1,210 @@
+"""
+Normalizes raw job titles into a normalized title, a seniority level and a
+role family.
+
+    "Sr. SWE"                     -> ("software engineer", "senior", "engineering")
+    "Senior Software Engineer II" -> ("software engineer", "senior", "engineering")
+    "VP, Sales"                   -> ("vice president sales", "vice president", "sales")
+
+Lookups are memoized, and the bulk job normalizes each distinct title once
+and writes the result to every row that uses it.
+
+Usage:
+    >>> TitleNormalizer.normalize("Sr. SWE")
+    NormalizedTitle(normalized_title='software engineer', seniority='senior', role_family='engineering')
+
+    $ python -m scrapers.src.bots.linkedin.utils.title_normalizer.title_normalizer
+"""
+import logging
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+from .....database.scripts.database_manager import TitleDatabaseManager
+
+logging.basicConfig(level=logging.INFO, filename="log.log", filemode="w",
+                    format="%(asctime)s - %(levelname)s - %(message)s")
+
+ABBREVIATIONS = {
+    "sr": "senior",
+    "snr": "senior",
+    "jr": "junior",
+    "swe": "software engineer",
+    "sde": "software engineer",
+    "eng": "engineer",
+    "engr": "engineer",
+    "dev": "developer",
+    "mgr": "manager",
+    "mngr": "manager",
+    "dir": "director",
+    "asst": "assistant",
+    "assoc": "associate",
+    "admin": "administrator",
+    "coord": "coordinator",
+    "spec": "specialist",
+    "exec": "executive",
+    "ops": "operations",
+    "mgmt": "management",
+    "acct": "accountant",
+    "hr": "human resources",
+    "qa": "quality assurance",
+    "svp": "senior vice president",
+    "evp": "executive vice president",
+    "avp": "assistant vice president",
+    "vp": "vice president",
+    "ceo": "chief executive officer",
+    "cto": "chief technology officer",
+    "cfo": "chief financial officer",
+    "coo": "chief operating officer",
+    "cio": "chief information officer",
+    "ciso": "chief information security officer",
+    "cmo": "chief marketing officer",
+}
+
+# Level numerals, e.g. "Software Engineer II"
+LEVEL_NUMERALS = {
+    "i": "junior", "1": "junior",
+    "ii": "mid", "2": "mid",
+    "iii": "senior", "3": "senior",
+    "iv": "staff", "4": "staff",
+}
+
+# Words that only describe the level and are removed from the normalized title
+SENIORITY_MODIFIERS = {
+    "intern": "intern",
+    "internship": "intern",
+    "trainee": "intern",
+    "junior": "junior",
+    "entry": "junior",
+    "associate": "junior",
+    "senior": "senior",
+    "lead": "lead",
+    "staff": "staff",
+    "principal": "principal",
+}
+
+# Titles whose seniority is part of the role itself, checked in order
+EXECUTIVE_LEVELS = (
+    ("vice president", "vice president"),
+    ("chief", "executive"),
+    ("founder", "executive"),
+    ("president", "executive"),
+    ("partner", "executive"),
+    ("director", "director"),
+    ("head of", "director"),
+    ("manager", "manager"),
+)
+
+# Role taxonomy, checked in order; the first family with a matching keyword
+# (a regular expression matched on word boundaries) wins
+ROLE_FAMILIES = (
+    ("executive", ("chief", "founder", "(?<!vice )president", "owner")),
+    ("data", ("data", "analytics", "machine learning", "scientist")),
+    ("engineering", ("engineer", "engineering", "developer", "programmer", "architect", "devops")),
+    ("product", ("product",)),
+    ("design", ("designer", "design", "ux", "ui")),
+    ("sales", ("sales", "account executive", "business development")),
+    ("marketing", ("marketing", "brand", "content", "communications")),
+    ("finance", ("finance", "financial", "accountant", "accounting", "controller", "analyst")),
+    ("human resources", ("human resources", "recruiter", "talent", "people")),
+    ("legal", ("attorney", "counsel", "lawyer", "legal", "paralegal")),
+    ("operations", ("operations", "logistics", "supply chain", "coordinator")),
+    ("consulting", ("consultant", "consulting", "advisor")),
+    ("research", ("research", "professor", "scientist")),
+    ("education", ("teacher", "instructor", "lecturer", "tutor")),
+    ("administrative", ("assistant", "administrator", "receptionist", "secretary")),
+)
+
+class NormalizedTitle(NamedTuple):
+    normalized_title: Optional[str]
+    seniority: Optional[str]
+    role_family: Optional[str]
+
+class TitleNormalizer:
+    @staticmethod
+    @lru_cache(maxsize=65536)
+    def normalize(job_title: str) -> NormalizedTitle:
+        """
+        Normalize a raw job title.
+
+        Args:
+            job_title (str): The raw title, e.g. "Sr. SWE".
+
+        Returns:
+            NormalizedTitle: The normalized title, its seniority and role family.
+                The title is None when only a level is left (e.g. "Intern"), so
+                readers fall back to the raw title.
+        """
+        # Drop qualifiers such as "Engineer (Contract)" or "Analyst - Remote"
+        title = re.split(r"\s[-|@·]\s|\(", job_title.casefold())[0]
+        title = title.replace("&", " and ")
+        words = re.sub(r"[^\w\s]", " ", title).split()
+
+        expanded = []
+        for word in words:
+            expanded.extend(ABBREVIATIONS.get(word, word).split())
+
+        seniority = None
+        role_words = []
+        for index, word in enumerate(expanded):
+            if word in SENIORITY_MODIFIERS:
+                seniority = seniority or SENIORITY_MODIFIERS[word]
+            elif word == "level" and index > 0 and expanded[index - 1] == "entry":
+                continue
+            elif word in LEVEL_NUMERALS and index > 0:
+                seniority = seniority or LEVEL_NUMERALS[word]
+            else:
+                role_words.append(word)
+
+        normalized_title = " ".join(role_words) or None
+        if normalized_title is None:
+            return NormalizedTitle(None, seniority, None)
+
+        for keyword, level in EXECUTIVE_LEVELS:
+            if re.search(rf"\b{keyword}\b", normalized_title):
+                # "senior vice president" stays a vice president
+                seniority = level
+                break
+
+        role_family = None
+        for family, keywords in ROLE_FAMILIES:
+            if any(re.search(rf"\b{keyword}\b", normalized_title) for keyword in keywords):
+                role_family = family
+                break
+
+        return NormalizedTitle(normalized_title, seniority, role_family)
+
+class TitleNormalizationJob:
+    """
+    Writes normalized_title, seniority and role_family for every un-normalized row.
+
+    Each distinct raw title is normalized once and written to all of its rows
+    with a single bulk UPDATE.
+    """
+    def __init__(self, title_db_manager: Optional[TitleDatabaseManager] = None) -> None:
+        self.title_db_manager = title_db_manager or TitleDatabaseManager()
+
+    def run(self) -> int:
+        """
+        Run the bulk normalization.
+
+        Returns:
+            int: Number of updated work_experience rows.
+        """
+        job_titles = self.title_db_manager.get_unnormalized_titles()
+        normalized_titles = [
+            (job_title, *TitleNormalizer.normalize(job_title)) for job_title in job_titles
+        ]
+        updated_rows = self.title_db_manager.update_normalized_titles(normalized_titles)
+        logging.info(
+            "Normalized %s distinct titles across %s work_experience rows",
+            len(job_titles), updated_rows
+        )
+        return updated_rows
+
+def main():
+    updated_rows = TitleNormalizationJob().run()
+    print(f"Normalized the titles of {updated_rows} work experience rows")
+
+if __name__ == "__main__":
+    main()
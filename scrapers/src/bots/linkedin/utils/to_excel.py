@@ -1,49 +1,72 @@
-import psycopg2
-import pandas as pd
-from openpyxl import Workbook
-
-# Database connection parameters
-DB_HOST = "localhost"
-DB_NAME = "house2"
-DB_USER = "postgres"
-DB_PASSWORD = "postgres"
-
-# Connect to the PostgreSQL database
-conn = psycopg2.connect(
-    host=DB_HOST,
-    database=DB_NAME,
-    user=DB_USER,
-    password=DB_PASSWORD
-)
-
-# Function to fetch data from a table and return as a DataFrame
-def fetch_table_to_df(table_name, order_by=None):
+import argparse
+
+from ....database.scripts.database_manager import ExportDatabaseManager
+
+# Stream a table from the server as DataFrames of at most chunk_size rows
+def iter_table_frames(export_manager, table_name, order_by=None, chunk_size=5000):
     if order_by:
-        query = f"SELECT * FROM {table_name} ORDER BY {order_by};"
+        query = f"SELECT * FROM {table_name} ORDER BY {order_by}"
     else:
-        query = f"SELECT * FROM {table_name};"
-    df = pd.read_sql_query(query, conn)
-    return df
+        query = f"SELECT * FROM {table_name}"
+    return export_manager.iter_dataframes(query, chunk_size=chunk_size)
 
 # List of tables to export and their order by column (if applicable)
 tables = [
-    ("users", "user_id"), 
-    ("education", "user_id"), 
-    ("work_experience", "user_id"), 
-    ("skills", "user_id"), 
-    ("bots", None), 
-    ("phone_numbers", None), 
-    ("cookies", "bot_id"), 
+    ("users", "user_id"),
+    ("education", "user_id"),
+    ("work_experience", "user_id"),
+    ("skills", "user_id"),
+    ("bots", None),
+    ("phone_numbers", None),
+    ("cookies", "bot_id"),
     ("salaries", None)
 ]
 
-# Create a Pandas Excel writer using openpyxl as the engine
-with pd.ExcelWriter("database_export.xlsx", engine="openpyxl") as writer:
-    for table, order_by in tables:
-        df = fetch_table_to_df(table, order_by)
-        df.to_excel(writer, sheet_name=table, index=False)
+def export_tables(output_path="database_export.xlsx", chunk_size=5000):
+    # Connect to the database configured in database.ini
+    export_manager = ExportDatabaseManager()
+
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
+    # Create a Pandas Excel writer using openpyxl as the engine
+    with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
+        for table, order_by in tables:
+            # Each chunk is appended below the previous one, only the first writes the header
+            start_row = 0
+            for df in iter_table_frames(export_manager, table, order_by, chunk_size):
+                df.to_excel(writer, sheet_name=table, index=False, startrow=start_row, header=start_row == 0)
+                start_row += len(df) + (start_row == 0)
+            if start_row == 0:
+                pd.DataFrame().to_excel(writer, sheet_name=table, index=False)
+
+    # Release the database connection
+    export_manager.close()
+
+    print(f"Database has been exported to {output_path}")
 
-# Close the database connection
-conn.close()
+def export_profiles(output_path="user_profiles.xlsx", chunk_size=5000):
+    # One row per user, aggregated in a single SQL pass and streamed in chunks
+    export_manager = ExportDatabaseManager()
+    row_count = export_manager.export_user_profiles(output_path=output_path, chunk_size=chunk_size)
+
+    export_manager.close()
+
+    print(f"{row_count} user profiles have been exported to {output_path}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the database to a spreadsheet.")
+    parser.add_argument(
+        "--mode", choices=["tables", "profiles"], default="tables",
+        help="'tables' writes one sheet per table, 'profiles' writes one row per user."
+    )
+    parser.add_argument("--output", default=None, help="Output file (.xlsx, or .csv for profiles).")
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    if args.mode == "profiles":
+        export_profiles(output_path=args.output or "user_profiles.xlsx", chunk_size=args.chunk_size)
+    else:
+        export_tables(output_path=args.output or "database_export.xlsx", chunk_size=args.chunk_size)
 
-print("Database has been exported to database_export.xlsx")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,553 @@
+"""
+In-process stand-in for the Chrome WebDriver, backed by lxml over saved HTML pages.
+
+FakeWebDriver implements the part of the Selenium API the bots use: get(),
+back(), find_element(s) with every By strategy, the element methods (text,
+get_attribute, click, send_keys, ...), the scripts run through
+execute_script() and anything WebDriverWait and expected_conditions call.
+URLs are answered from saved pages, so a bot can run its whole orchestration,
+database writes included, without a browser or network. FakeWebDriverManager
+has the attributes of WebDriverManager and can be handed to any bot instead
+of it.
+
+Pages are looked up by exact URL first, then by fnmatch patterns in the order
+given, so list specific patterns before general ones. Links are resolved
+against the current URL as a browser would, and clicking an anchor follows it.
+Nothing is rendered: every element is displayed unless it or an ancestor is
+hidden with the hidden attribute or an inline display: none, and text
+approximates innerText (block elements and <br> break lines, runs of spaces
+collapse, line breaks inside text are kept).
+
+Usage:
+    >>> manager = FakeWebDriverManager({
+    ...     "https://www.linkedin.com/in/*/details/skills/": "benchmarks/pages/skills.html",
+    ...     "https://www.linkedin.com/in/*": "benchmarks/pages/profile.html",
+    ... })
+    >>> bot = LinkedInBot(bot_id=1, webdriver_manager=manager)
+    >>> bot.scrape_profile(user_id=1, profile_url="https://www.linkedin.com/in/someone/")
+"""
+import fnmatch
+import json
+import logging
+import pathlib
+import re
+import uuid
+from typing import Any, Dict, List, Mapping, Optional, Union
+from urllib.parse import urljoin
+
+import lxml.etree
+import lxml.html
+from selenium.common.exceptions import (
+    InvalidSelectorException, JavascriptException, NoSuchElementException,
+    StaleElementReferenceException, WebDriverException)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as EC
+
+from .page_cache import ANCHOR_ATTRIBUTES_SCRIPT, PAGE_STATE_SCRIPT, XPATH_TEXTS_SCRIPT, PageLookupCache
+from .wait_accounting import AccountedWebDriverWait
+
+logging.basicConfig(level=logging.INFO, filename="log.log", filemode="w",
+                    format="%(asctime)s - %(levelname)s - %(message)s")
+
+WINDOW_WIDTH = 1920
+WINDOW_HEIGHT = 1080
+
+# Elements whose boundaries break lines in innerText
+_BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "dd", "details", "dialog", "div", "dl", "dt",
+    "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6",
+    "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section", "summary", "table", "tr", "ul",
+}
+_UNRENDERED_TAGS = {"head", "script", "style", "template", "noscript"}
+_LINE_BREAK = "\x00"
+
+# Attributes a browser reports as absolute URLs
+_URL_ATTRIBUTES = {"href", "src", "action"}
+
+_SCROLL_SCRIPT = re.compile(r"^\s*window\.scroll(By|To)\(\s*(-?[\d.]+)\s*,\s*(-?[\d.]+)\s*\);?\s*$")
+_COUNT_SCRIPT = re.compile(r"""^\s*return document\.querySelectorAll\((["'])(.*)\1\)\.length;?\s*$""")
+
+_CSS_TOKEN = re.compile(r"""
+    \s*(?P<combinator>[>+~])\s*
+    | (?P<descendant>\s+)
+    | (?P<tag>\*|[a-zA-Z][\w-]*)
+    | \#(?P<id>[\w-]+)
+    | \.(?P<class>[\w-]+)
+    | \[\s*(?P<attribute>[\w-]+)\s*
+        (?:(?P<operator>[*^$~|]?=)\s*(?P<value>"[^"]*"|'[^']*'|[^\]\s]+)\s*)?\]
+""", re.VERBOSE)
+
+def _xpath_literal(value: str) -> str:
+    """Quote a string for an XPath expression."""
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in value.split("'")) + ")"
+
+def _class_predicate(attribute: str, name: str) -> str:
+    return (f"[contains(concat(' ', normalize-space(@{attribute}), ' '), "
+            f"{_xpath_literal(f' {name} ')})]")
+
+def _attribute_predicate(attribute: str, operator: Optional[str], value: Optional[str]) -> str:
+    if operator is None:
+        return f"[@{attribute}]"
+    if value[0] in "'\"":
+        value = value[1:-1]
+    literal = _xpath_literal(value)
+    if operator == "=":
+        return f"[@{attribute}={literal}]"
+    if operator == "*=":
+        return f"[contains(@{attribute}, {literal})]"
+    if operator == "^=":
+        return f"[starts-with(@{attribute}, {literal})]"
+    if operator == "$=":
+        return (f"[substring(@{attribute}, string-length(@{attribute}) - {len(value)} + 1)"
+                f" = {literal}]")
+    if operator == "~=":
+        return _class_predicate(attribute, value)
+    return f"[@{attribute}={literal} or starts-with(@{attribute}, {_xpath_literal(value + '-')})]"
+
+def css_to_xpath(selector: str, prefix: str = "descendant::") -> str:
+    """
+    Translate a CSS selector to XPath 1.0.
+
+    Supports type, universal, id, class and attribute selectors
+    (=, *=, ^=, $=, ~=, |=), the descendant, child (>), adjacent (+) and
+    general sibling (~) combinators, and selector lists.
+
+    Args:
+        selector (str): The CSS selector.
+        prefix (str): Axis of the first compound selector, relative to the context node.
+
+    Returns:
+        str: The equivalent XPath expression.
+
+    Raises:
+        InvalidSelectorException: If the selector uses unsupported syntax.
+    """
+    paths = []
+    for group in selector.split(","):
+        group = group.strip()
+        path = prefix
+        compound = ""
+        predicates = ""
+        position = 0
+        while position < len(group):
+            match = _CSS_TOKEN.match(group, position)
+            if match is None or match.end() == position:
+                raise InvalidSelectorException(f"Unsupported CSS selector: {selector}")
+            position = match.end()
+            if match.group("combinator") or match.group("descendant"):
+                path += (compound or "*") + predicates
+                axis = {">": "/", "+": "/following-sibling::*[1]/self::", "~": "/following-sibling::"}
+                path += axis.get(match.group("combinator"), "/descendant::")
+                compound = ""
+                predicates = ""
+            elif match.group("tag"):
+                compound = match.group("tag")
+            elif match.group("id"):
+                predicates += f"[@id={_xpath_literal(match.group('id'))}]"
+            elif match.group("class"):
+                predicates += _class_predicate("class", match.group("class"))
+            else:
+                predicates += _attribute_predicate(
+                    match.group("attribute"), match.group("operator"), match.group("value")
+                )
+        if not group or path.endswith(("/", "::")) and not (compound or predicates):
+            raise InvalidSelectorException(f"Unsupported CSS selector: {selector}")
+        paths.append(path + (compound or "*") + predicates)
+    return " | ".join(paths)
+
+def _locator_to_xpath(by: str, value: str, prefix: str) -> str:
+    """Translate a Selenium locator to XPath, relative to the context node."""
+    if by == By.XPATH:
+        return value
+    if by == By.ID:
+        return css_to_xpath(f"[id={json.dumps(value)}]", prefix)
+    if by == By.NAME:
+        return css_to_xpath(f"[name={json.dumps(value)}]", prefix)
+    if by == By.CLASS_NAME:
+        # Like Selenium, a compound class name ("a.b.c") is matched as a CSS class selector
+        return css_to_xpath(f".{value}", prefix)
+    if by == By.TAG_NAME:
+        return css_to_xpath(value, prefix)
+    if by == By.CSS_SELECTOR:
+        return css_to_xpath(value, prefix)
+    if by == By.LINK_TEXT:
+        return f"{prefix}a[normalize-space(.) = {_xpath_literal(value.strip())}]"
+    if by == By.PARTIAL_LINK_TEXT:
+        return f"{prefix}a[contains(normalize-space(.), {_xpath_literal(value.strip())})]"
+    raise InvalidSelectorException(f"Unsupported locator strategy: {by}")
+
+def _rendered_text(node) -> str:
+    """Approximate the innerText of an element."""
+    parts: List[str] = []
+
+    def add_text(text: Optional[str]) -> None:
+        if text:
+            parts.append(" " if text.isspace() else re.sub(r"[ \t\r\f]+", " ", text))
+
+    def walk(element) -> None:
+        if not isinstance(element.tag, str) or element.tag in _UNRENDERED_TAGS or _is_hidden(element):
+            return
+        if element.tag == "br":
+            parts.append("\n")
+            return
+        block = element.tag in _BLOCK_TAGS
+        if block:
+            parts.append(_LINE_BREAK)
+        add_text(element.text)
+        for child in element:
+            walk(child)
+            add_text(child.tail)
+        if block:
+            parts.append(_LINE_BREAK)
+
+    if isinstance(node.tag, str) and node.tag not in _UNRENDERED_TAGS:
+        add_text(node.text)
+        for child in node:
+            walk(child)
+            add_text(child.tail)
+
+    text = "".join(parts)
+    text = re.sub(rf"[ {_LINE_BREAK}]*{_LINE_BREAK}[ {_LINE_BREAK}]*", "\n", text)
+    text = re.sub(r" *\n *", "\n", text)
+    return text.strip()
+
+def _is_hidden(element) -> bool:
+    if element.get("hidden") is not None:
+        return True
+    style = re.sub(r"\s+", "", element.get("style", "")).lower()
+    return "display:none" in style or "visibility:hidden" in style
+
+class _Document:
+    """A parsed page and the URL it was loaded from."""
+    def __init__(self, url: str, source: bytes) -> None:
+        self.url = url
+        self.token = uuid.uuid4().hex
+        self.root = lxml.html.fromstring(source) if source.strip() else lxml.html.fromstring("<html></html>")
+        self.tree = self.root.getroottree()
+
+class FakeWebElement(WebElement):
+    """
+    An element of a FakeWebDriver page.
+
+    Accessing an element of a page the driver has navigated away from raises
+    StaleElementReferenceException, as with a real browser.
+    """
+    def __init__(self, driver: "FakeWebDriver", document: _Document, node) -> None:
+        super().__init__(driver, f"{document.token}:{document.tree.getpath(node)}")
+        self._document = document
+        self._node = node
+
+    def _checked_node(self):
+        if self._parent.document is not self._document:
+            raise StaleElementReferenceException("The element is not attached to the current page")
+        return self._node
+
+    @property
+    def tag_name(self) -> str:
+        return self._checked_node().tag
+
+    @property
+    def text(self) -> str:
+        return _rendered_text(self._checked_node())
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        node = self._checked_node()
+        if name in ("textContent", "innerText"):
+            return node.text_content() if name == "textContent" else _rendered_text(node)
+        if name in ("innerHTML", "outerHTML"):
+            outer_html = lxml.html.tostring(node, encoding="unicode", with_tail=False)
+            if name == "outerHTML":
+                return outer_html
+            return (node.text or "") + "".join(
+                lxml.html.tostring(child, encoding="unicode") for child in node
+            )
+        if name in ("checked", "selected", "disabled"):
+            return "true" if node.get(name) is not None else None
+        value = node.get(name)
+        if value is not None and name in _URL_ATTRIBUTES:
+            return urljoin(self._document.url, value)
+        return value
+
+    def get_dom_attribute(self, name: str) -> Optional[str]:
+        return self._checked_node().get(name)
+
+    def get_property(self, name: str) -> Optional[str]:
+        return self.get_attribute(name)
+
+    def is_displayed(self) -> bool:
+        node = self._checked_node()
+        return not any(_is_hidden(element) for element in node.iterancestors()) and not _is_hidden(node)
+
+    def is_enabled(self) -> bool:
+        return self._checked_node().get("disabled") is None
+
+    def is_selected(self) -> bool:
+        node = self._checked_node()
+        return node.get("checked") is not None or node.get("selected") is not None
+
+    def click(self) -> None:
+        """Follow the link of an anchor, toggle a checkbox and ignore anything else."""
+        node = self._checked_node()
+        if node.tag == "a" and node.get("href") and not node.get("href").startswith(("#", "javascript:")):
+            self._parent.get(urljoin(self._document.url, node.get("href")))
+        elif node.tag == "input" and node.get("type") in ("checkbox", "radio"):
+            if node.get("checked") is None:
+                node.set("checked", "")
+            elif node.get("type") == "checkbox":
+                del node.attrib["checked"]
+
+    def send_keys(self, *value) -> None:
+        """Append typed text to the value of the element. Special keys (Keys.*) are ignored."""
+        node = self._checked_node()
+        typed = "".join(str(part) for part in value)
+        typed = "".join(character for character in typed if not "\ue000" <= character <= "\uf8ff")
+        node.set("value", node.get("value", "") + typed)
+
+    def clear(self) -> None:
+        self._checked_node().set("value", "")
+
+    def submit(self) -> None:
+        self._checked_node()
+
+    @property
+    def location(self) -> Dict[str, int]:
+        # Nothing is laid out, every element sits in the top left corner
+        self._checked_node()
+        return {"x": 0, "y": 0}
+
+    @property
+    def size(self) -> Dict[str, int]:
+        self._checked_node()
+        return {"width": WINDOW_WIDTH, "height": 20}
+
+    @property
+    def rect(self) -> Dict[str, int]:
+        return {**self.location, **self.size}
+
+    def find_element(self, by=By.ID, value: Optional[str] = None) -> "FakeWebElement":
+        return self._parent.find_in(self._document, self._checked_node(), by, value, many=False)
+
+    def find_elements(self, by=By.ID, value: Optional[str] = None) -> List["FakeWebElement"]:
+        return self._parent.find_in(self._document, self._checked_node(), by, value, many=True)
+
+    def value_of_css_property(self, property_name: str) -> str:
+        if property_name == "display":
+            return "none" if _is_hidden(self._checked_node()) else "block"
+        return ""
+
+    def __repr__(self) -> str:
+        return f"<FakeWebElement {self._id}>"
+
+class FakeWebDriver:
+    """
+    A WebDriver answering URLs with saved HTML pages.
+
+    Args:
+        pages (mapping): URL or fnmatch pattern to the path of the saved page.
+            file:// URLs are read from disk without needing an entry.
+    """
+    def __init__(self, pages: Mapping[str, Union[str, pathlib.Path]]) -> None:
+        self.pages = {url: pathlib.Path(path) for url, path in pages.items()}
+        self.sources: Dict[pathlib.Path, bytes] = {}
+        self.history: List[str] = []
+        self.history_index = -1
+        self.document = _Document("about:blank", b"")
+        self.scroll_x = 0
+        self.scroll_y = 0
+        self.session_id = uuid.uuid4().hex
+
+    def _page_path(self, url: str) -> pathlib.Path:
+        if url in self.pages:
+            return self.pages[url]
+        for pattern, path in self.pages.items():
+            if fnmatch.fnmatchcase(url, pattern):
+                return path
+        if url.startswith("file://"):
+            return pathlib.Path(url[len("file://"):])
+        raise WebDriverException(f"No saved page for {url}")
+
+    def _load(self, url: str) -> None:
+        if url == "about:blank":
+            source = b""
+        else:
+            path = self._page_path(url)
+            if path not in self.sources:
+                try:
+                    self.sources[path] = path.read_bytes()
+                except OSError as error:
+                    raise WebDriverException(f"Could not read the saved page {path}: {error}") from error
+            source = self.sources[path]
+        self.document = _Document(url, source)
+        self.scroll_x = 0
+        self.scroll_y = 0
+        logging.info("FakeWebDriver loaded %s", url)
+
+    def get(self, url: str) -> None:
+        self._load(url)
+        del self.history[self.history_index + 1:]
+        self.history.append(url)
+        self.history_index = len(self.history) - 1
+
+    def back(self) -> None:
+        if self.history_index > 0:
+            self.history_index -= 1
+            self._load(self.history[self.history_index])
+
+    def forward(self) -> None:
+        if self.history_index < len(self.history) - 1:
+            self.history_index += 1
+            self._load(self.history[self.history_index])
+
+    def refresh(self) -> None:
+        self._load(self.document.url)
+
+    @property
+    def current_url(self) -> str:
+        return self.document.url
+
+    @property
+    def title(self) -> str:
+        titles = self.document.root.xpath("//title")
+        return titles[0].text_content().strip() if titles else ""
+
+    @property
+    def page_source(self) -> str:
+        return lxml.html.tostring(self.document.root, encoding="unicode")
+
+    def find_in(self, document: _Document, context, by: str, value: Optional[str], many: bool):
+        """Find elements under a context node of a page, as find_element(s) of a driver or element."""
+        prefix = "descendant-or-self::" if context is document.root else "descendant::"
+        xpath = _locator_to_xpath(by, value, prefix)
+        try:
+            nodes = context.xpath(xpath)
+        except lxml.etree.XPathError as error:
+            raise InvalidSelectorException(f"Invalid selector {xpath}: {error}") from error
+        if not isinstance(nodes, list) or not all(isinstance(node, lxml.html.HtmlElement) for node in nodes):
+            raise InvalidSelectorException(f"The selector {value} does not select elements")
+        if many:
+            return [FakeWebElement(self, document, node) for node in nodes]
+        if not nodes:
+            raise NoSuchElementException(f"Unable to locate element: {{\"method\":\"{by}\",\"selector\":\"{value}\"}}")
+        return FakeWebElement(self, document, nodes[0])
+
+    def find_element(self, by=By.ID, value: Optional[str] = None) -> FakeWebElement:
+        return self.find_in(self.document, self.document.root, by, value, many=False)
+
+    def find_elements(self, by=By.ID, value: Optional[str] = None) -> List[FakeWebElement]:
+        return self.find_in(self.document, self.document.root, by, value, many=True)
+
+    def execute_script(self, script: str, *args) -> Any:
+        """
+        Run one of the scripts the bots use.
+
+        Raises:
+            JavascriptException: If the script is not one the fake knows.
+        """
+        if script == PAGE_STATE_SCRIPT:
+            body = self.document.root.find("body")
+            body_length = len(lxml.html.tostring(body, encoding="unicode")) if body is not None else 0
+            element_count = sum(1 for _ in self.document.root.iter(lxml.etree.Element))
+            return f"{self.document.token}:{element_count}:{body_length}"
+        if script == ANCHOR_ATTRIBUTES_SCRIPT:
+            return json.dumps([
+                {
+                    "href": urljoin(self.document.url, anchor.get("href")) if anchor.get("href") else None,
+                    "className": anchor.get("class", ""),
+                    "target": anchor.get("target"),
+                }
+                for anchor in self.document.root.iter("a")
+            ])
+        if script == XPATH_TEXTS_SCRIPT:
+            xpath, root = args
+            context = root._checked_node() if root is not None else self.document.root  # pylint: disable=protected-access
+            return json.dumps([
+                (node.text_content() if hasattr(node, "text_content") else str(node)).strip()
+                for node in context.xpath(xpath)
+            ])
+
+        stripped = script.strip()
+        if stripped in ("return document.readyState", "return document.readyState;"):
+            return "complete"
+        if stripped == "return window.innerHeight;":
+            return WINDOW_HEIGHT
+        if stripped == "return window.pageYOffset;":
+            return self.scroll_y
+        if stripped == "return window.pageXOffset;":
+            return self.scroll_x
+        if stripped in ("arguments[0].scrollIntoView(true);", "arguments[0].scrollIntoView();"):
+            args[0]._checked_node()  # pylint: disable=protected-access
+            return None
+        if stripped == "arguments[0].click();":
+            args[0].click()
+            return None
+        scroll = _SCROLL_SCRIPT.match(stripped)
+        if scroll:
+            x, y = int(float(scroll.group(2))), int(float(scroll.group(3)))
+            if scroll.group(1) == "By":
+                x, y = self.scroll_x + x, self.scroll_y + y
+            self.scroll_x, self.scroll_y = max(x, 0), max(y, 0)
+            return None
+        count = _COUNT_SCRIPT.match(stripped)
+        if count:
+            return len(self.find_elements(By.CSS_SELECTOR, count.group(2)))
+        raise JavascriptException(f"Script not supported by FakeWebDriver: {stripped[:80]}")
+
+    def execute(self, driver_command: str, params: Optional[Dict] = None) -> None:
+        """Commands are not sent anywhere, so WebElement methods not overridden fail loudly."""
+        raise WebDriverException(f"Command not supported by FakeWebDriver: {driver_command} {params or ''}")
+
+    def implicitly_wait(self, time_to_wait: float) -> None:
+        pass
+
+    def close(self) -> None:
+        self.history = []
+        self.history_index = -1
+        self.document = _Document("about:blank", b"")
+
+    def quit(self) -> None:
+        self.close()
+
+class FakeWebDriverManager:
+    """
+    A WebDriverManager driving a FakeWebDriver.
+
+    Waits time out after a second, since a saved page never changes, and the
+    humanized input methods act at once.
+
+    Args:
+        pages (mapping): URL or fnmatch pattern to the path of the saved page.
+        timeout (float): Timeout of the condition waits, in seconds.
+        bot_id (int): Unique Bot ID.
+    """
+    def __init__(self, pages: Mapping[str, Union[str, pathlib.Path]], timeout: float = 1.0,
+                 bot_id: Optional[int] = None) -> None:
+        self.bot_id = bot_id
+        self.driver = FakeWebDriver(pages)
+        self.wait = AccountedWebDriverWait(self.driver, timeout, poll_frequency=0.05)
+        self.page_cache = PageLookupCache(self.driver)
+
+    def close_webdriver(self) -> None:
+        self.driver.close()
+        logging.info("Fake webdriver closed successfully.")
+
+    def rotate_proxies(self):
+        """Method that handles proxy rotation, provides unique proxy pool for each bot id"""
+
+    def scroll_down(self, scroll_distance: float = 1000) -> None:
+        self.driver.execute_script(f"window.scrollBy(0, {scroll_distance});")
+
+    def humanized_send_keys(self, element: WebElement, text: str, characters_per_minute: int = 7500) -> None:  # pylint: disable=unused-argument
+        element.send_keys(text)
+
+    def humanize_click(self, element) -> None:
+        self.wait.until(EC.element_to_be_clickable(element))
+
+    def wait_for_page_load(self) -> None:
+        self.wait.until(
+            lambda driver: driver.execute_script("return document.readyState") == "complete"
+        )
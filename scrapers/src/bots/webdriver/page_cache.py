@@ -0,0 +1,118 @@
+"""
+Page-scoped cache of element lookups done with a single script call.
+
+Every get_attribute() or find_element() on a WebElement is a chromedriver
+round-trip, so reading href, class and target of every anchor on a results
+page costs hundreds of calls. The scripts below read everything in one
+execute_script call and return it as JSON, and PageLookupCache keeps the
+result until the page changes.
+
+A page is identified by a token stamped on the current document plus the
+number of elements in it and the length of its body's HTML, so navigating
+away, loading more results (e.g. infinite scroll) or changing content in
+place (e.g. expanding "see more") invalidates the cached lookups.
+
+Usage:
+    >>> cache = PageLookupCache(driver)
+    >>> anchors = cache.anchors()
+    >>> [anchor["href"] for anchor in anchors if anchor["href"]]
+    >>> cache.xpath_texts("//li/span[@aria-hidden='true']")
+"""
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from selenium.webdriver.remote.webelement import WebElement
+
+# Token of the current document, its element count and the length of its body's HTML
+PAGE_STATE_SCRIPT = """
+if (!document.__ppdbPageId) {
+    document.__ppdbPageId = Date.now().toString(36) + Math.random().toString(36).slice(2);
+}
+return document.__ppdbPageId + ':' + document.getElementsByTagName('*').length
+    + ':' + (document.body ? document.body.innerHTML.length : 0);
+"""
+
+# href, class and target of every anchor, as JSON
+ANCHOR_ATTRIBUTES_SCRIPT = """
+return JSON.stringify(Array.from(document.querySelectorAll('a'), function (anchor) {
+    return {
+        href: anchor.href || null,
+        className: anchor.getAttribute('class') || '',
+        target: anchor.getAttribute('target')
+    };
+}));
+"""
+
+# Trimmed text of every node matching an XPath, evaluated from arguments[1] or the document
+XPATH_TEXTS_SCRIPT = """
+var result = document.evaluate(
+    arguments[0], arguments[1] || document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+);
+var texts = [];
+for (var i = 0; i < result.snapshotLength; i++) {
+    texts.push((result.snapshotItem(i).textContent || '').trim());
+}
+return JSON.stringify(texts);
+"""
+
+class PageLookupCache:
+    """
+    Caches the results of lookup scripts for the current page.
+
+    Args:
+        driver (WebDriver): The driver whose pages are read.
+    """
+    def __init__(self, driver) -> None:
+        self.driver = driver
+        self.page_state: Optional[str] = None
+        self.lookups: Dict[Tuple, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _refresh_page_state(self) -> None:
+        page_state = self.driver.execute_script(PAGE_STATE_SCRIPT)
+        if page_state != self.page_state:
+            self.page_state = page_state
+            self.lookups = {}
+
+    def clear(self) -> None:
+        """Drop every cached lookup, e.g. after changing the page without reloading it."""
+        self.page_state = None
+        self.lookups = {}
+
+    def get(self, key: Tuple, script: str, *args) -> Any:
+        """
+        Run a JSON-returning script once per page and cache the decoded result.
+
+        Args:
+            key (tuple): Cache key of the lookup.
+            script (str): Script returning a JSON string.
+            *args: Script arguments.
+
+        Returns:
+            The decoded result of the script.
+        """
+        self._refresh_page_state()
+        if key in self.lookups:
+            self.hits += 1
+            return self.lookups[key]
+
+        self.misses += 1
+        result = json.loads(self.driver.execute_script(script, *args))
+        self.lookups[key] = result
+        return result
+
+    def anchors(self) -> List[Dict[str, Optional[str]]]:
+        """Return href, className and target of every anchor on the page."""
+        return self.get(("anchors",), ANCHOR_ATTRIBUTES_SCRIPT)
+
+    def xpath_texts(self, xpath: str, root: Optional[WebElement] = None) -> List[str]:
+        """
+        Return the text of every node matching an XPath.
+
+        Args:
+            xpath (str): The XPath, relative to root when one is given.
+            root (WebElement, optional): Element the XPath is evaluated from.
+        """
+        key = ("xpath_texts", xpath, root.id if root is not None else None)
+        return self.get(key, XPATH_TEXTS_SCRIPT, xpath, root)
@@ -0,0 +1,117 @@
+"""
+Accounting of the time bots spend waiting on page state.
+
+AccountedWebDriverWait is a drop-in WebDriverWait that adds the duration of
+every until() / until_not() call to the current stage, set with wait_stage().
+Deliberate pacing delays are recorded separately through pace(), so the report
+shows how much of each stage is waiting for the page and how much is throttling.
+
+Usage:
+    >>> wait = AccountedWebDriverWait(driver, 10)
+    >>> with wait_stage("contact_info"):
+    ...     wait.until(EC.visibility_of_element_located((By.ID, "modal")))
+    >>> print(wait_accountant.report())
+"""
+import contextvars
+import logging
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.wait import WebDriverWait
+
+_current_stage: contextvars.ContextVar = contextvars.ContextVar("wait_stage", default="unstaged")
+
+@contextmanager
+def wait_stage(name: str) -> Iterator[None]:
+    """Attribute the waits of the enclosed block to a stage."""
+    token = _current_stage.set(name)
+    try:
+        yield
+    finally:
+        _current_stage.reset(token)
+
+class WaitAccountant:
+    """
+    Totals of condition waits, timeouts and pacing delays per stage.
+
+    Args:
+        pacing_sleeps (bool): Whether pace() sleeps. Runs against saved pages turn
+            it off, the delays are then only recorded.
+    """
+    def __init__(self, pacing_sleeps: bool = True) -> None:
+        self.pacing_sleeps = pacing_sleeps
+        self.condition_seconds: Dict[str, float] = defaultdict(float)
+        self.condition_counts: Dict[str, int] = defaultdict(int)
+        self.timeouts: Dict[str, int] = defaultdict(int)
+        self.pacing_seconds: Dict[str, float] = defaultdict(float)
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        stage = _current_stage.get()
+        self.condition_seconds[stage] += seconds
+        self.condition_counts[stage] += 1
+        if timed_out:
+            self.timeouts[stage] += 1
+
+    def pace(self, seconds: float) -> None:
+        """Sleep on purpose (throttling) and record it against the current stage."""
+        if self.pacing_sleeps:
+            time.sleep(seconds)
+        self.pacing_seconds[_current_stage.get()] += seconds
+
+    def reset(self) -> None:
+        self.__init__(pacing_sleeps=self.pacing_sleeps)
+
+    def report(self) -> str:
+        """Return a table of waiting time per stage, longest first."""
+        stages = set(self.condition_seconds) | set(self.pacing_seconds)
+        lines = [f"{'stage':<20} {'waits':>7} {'wait s':>9} {'timeouts':>9} {'pacing s':>9}"]
+        for stage in sorted(
+                stages, key=lambda name: -(self.condition_seconds[name] + self.pacing_seconds[name])):
+            lines.append(
+                f"{stage:<20} {self.condition_counts[stage]:>7} "
+                f"{self.condition_seconds[stage]:>9.2f} {self.timeouts[stage]:>9} "
+                f"{self.pacing_seconds[stage]:>9.2f}"
+            )
+        return "\n".join(lines)
+
+    def log_report(self) -> None:
+        logging.info("Time spent waiting per stage:\n%s", self.report())
+
+wait_accountant = WaitAccountant()
+
+class AccountedWebDriverWait(WebDriverWait):
+    """
+    WebDriverWait that reports how long each wait took to the wait accountant.
+
+    Only a TimeoutException counts as a timeout; other errors raised by the
+    condition (e.g. a stale element) are recorded as plain waits.
+    """
+    def __init__(self, driver, timeout: float, *args, accountant: WaitAccountant = wait_accountant,
+                 **kwargs) -> None:
+        super().__init__(driver, timeout, *args, **kwargs)
+        self.accountant = accountant
+
+    def until(self, method, message: str = ""):
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super().until(method, message)
+        except TimeoutException:
+            timed_out = True
+            raise
+        finally:
+            self.accountant.record_wait(time.perf_counter() - start, timed_out)
+
+    def until_not(self, method, message: str = ""):
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super().until_not(method, message)
+        except TimeoutException:
+            timed_out = True
+            raise
+        finally:
+            self.accountant.record_wait(time.perf_counter() - start, timed_out)
@@ -43,14 +43,12 @@ import time
 import math
 from typing import Tuple, List
 
-import pyautogui  # pylint: disable=import-error
-import numpy as np
-import mouse
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.webdriver import WebDriver
 from selenium import webdriver
 from selenium.webdriver.support.wait import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import WebDriverException, ElementNotVisibleException
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.by import By
@@ -58,6 +56,8 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
 
 from ...database.scripts.database_manager import DatabaseManager
+from .wait_accounting import AccountedWebDriverWait
+from .page_cache import PageLookupCache
 
 class WebDriverManager:
     """
@@ -76,6 +76,9 @@ class WebDriverManager:
             The WebDriver instance initialized by the class.
         wait (WebDriverWait): 
             A WebDriverWait instance associated with the WebDriver instance.
+            Time spent in its waits is reported per stage by the wait accountant.
+        page_cache (PageLookupCache):
+            Lookups of the current page done with one script call and cached until the page changes.
         bot_id (int):
             Unique Bot ID
 
@@ -97,7 +100,8 @@ class WebDriverManager:
         self.bot_id = bot_id
         self.driver_path = 'chromedriver-win64/chromedriver.exe'
         self.driver = self.initialize_webdriver()
-        self.wait = WebDriverWait(self.driver, 10)
+        self.wait = AccountedWebDriverWait(self.driver, 10)
+        self.page_cache = PageLookupCache(self.driver)
         self.database_manager = DatabaseManager()
 
     def initialize_webdriver(self) -> WebDriver:
@@ -268,6 +272,8 @@ class WebDriverManager:
         # Adjust path for navbar thickness
         adjusted_path = [(x, y) for x, y in zip(mouse_path[0], mouse_path[1])]
 
+        import mouse  # pylint: disable=import-outside-toplevel
+
         print("Moving mouse to the center")
         for x, y in adjusted_path:
             mouse.move(x, y, duration=0.0001)
@@ -275,10 +281,10 @@ class WebDriverManager:
         print("At the target")
         print(adjusted_path[-1][0], adjusted_path[-1][1])
 
-        time.sleep(3)
-
     def calculate_mouse_path(self, start: Tuple[int, int], target: Tuple[int, int], navbar_thickness=95):
         """Calculate the mouse path between start and target."""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
         num_steps = round(abs(target[0] - start[0]))
 
         # Generate linearly spaced x and y coordinates
@@ -302,6 +308,9 @@ class WebDriverManager:
         return mouse_path
     
     def humanize_click(self, element):
+        # pyautogui needs a display as soon as it is imported, so only load it to click
+        import pyautogui  # pylint: disable=import-outside-toplevel, import-error
+
         # Get current mouse position
         startingx, startingy = pyautogui.position()
 
@@ -315,6 +324,15 @@ class WebDriverManager:
         # Move the cursor to the element
         self.humanized_mouse_movement(mouse_path)
 
+        # Ready as soon as the element accepts clicks, instead of a fixed pause
+        self.wait.until(EC.element_to_be_clickable(element))
+
+    def wait_for_page_load(self) -> None:
+        """Wait until the current document has finished loading."""
+        self.wait.until(
+            lambda driver: driver.execute_script("return document.readyState") == "complete"
+        )
+
     def save_cookies(self, bot_id, website):
         # Check if cookies exist
         query = (
@@ -0,0 +1,268 @@
+"""
+ppdb: one command for every batch job that does not drive a browser.
+
+Each subcommand imports the modules it needs only once it runs, so --help and
+short jobs start fast. The database jobs share one connection pool, opened
+with the settings of the --profile section of database.ini (see
+scrapers/src/database/scripts/config/config.py) and closed after the job,
+plus a pool of the read_replica of that profile when it sets one.
+--jobs sets the worker count of the jobs that can run in parallel.
+
+Usage:
+    $ python ppdb.py --help
+    $ python ppdb.py export --mode profiles --output user_profiles.csv
+    $ python ppdb.py normalize-locations --jobs 4
+    $ python ppdb.py migrate --list
+    $ python ppdb.py coworker-graph --jobs 4
+    $ python ppdb.py --profile replica export --mode profiles
+    $ python ppdb.py bench --with-db --group db
+    $ python -m scrapers.src.cli.ppdb dedupe --dry-run
+"""
+import argparse
+import datetime
+import logging
+import os
+import pathlib
+
+from ..database.scripts.config.config import PROFILE_ENV, ConfigError, load_config
+
+logging.basicConfig(level=logging.INFO, filename="log.log", filemode="w",
+                    format="%(asctime)s - %(levelname)s - %(message)s")
+
+MIGRATIONS_DIR = pathlib.Path(__file__).resolve().parent.parent / "database" / "migrations"
+
+def run_export(args):
+    from ..bots.linkedin.utils.to_excel import export_profiles, export_tables  # pylint: disable=import-outside-toplevel
+
+    if args.mode == "profiles":
+        export_profiles(output_path=args.output or "user_profiles.xlsx", chunk_size=args.chunk_size)
+    else:
+        export_tables(output_path=args.output or "database_export.xlsx", chunk_size=args.chunk_size)
+
+def run_normalize_locations(args):
+    from ..bots.linkedin.utils.location_formatter.location_formatter import LocationNormalizationJob  # pylint: disable=import-outside-toplevel
+
+    updated_rows = LocationNormalizationJob(jobs=args.jobs).run()
+    print(f"Formatted the locations of {updated_rows} users and work experience rows")
+
+def run_estimate_salaries(args):
+    from ..bots.linkedin.utils.salary_calculator.salary_calculator import SalaryEstimationJob  # pylint: disable=import-outside-toplevel
+
+    updated_rows = SalaryEstimationJob(jobs=args.jobs).run()
+    print(f"Estimated the earnings of {updated_rows} work experience rows")
+
+def run_parse_documents(args):
+    from sqlizer.main import match_documents  # pylint: disable=import-outside-toplevel
+
+    match_documents(args.path, batch_size=args.batch_size, n_process=args.n_process,
+                    top_users=args.top_users, workers=args.jobs)
+
+def run_dedupe(args):
+    from ..database.scripts.entity_resolution import DeduplicationJob  # pylint: disable=import-outside-toplevel
+
+    merged_users = DeduplicationJob(args.threshold, args.max_block_size).run(args.dry_run)
+    action = "Would merge" if args.dry_run else "Merged"
+    print(f"{action} {merged_users} duplicate users")
+
+def run_migrate(args):
+    from ..database.scripts.database_manager import MigrationDatabaseManager  # pylint: disable=import-outside-toplevel
+
+    migration_manager = MigrationDatabaseManager()
+    applied_versions = migration_manager.get_applied_versions()
+    migrations = sorted(MIGRATIONS_DIR.glob("*.sql"))
+    pending = [path for path in migrations if path.name.split("_")[0] not in applied_versions]
+
+    if args.list:
+        for path in migrations:
+            print(f"{'pending' if path in pending else 'applied':<8} {path.name}")
+        return
+
+    for path in pending:
+        migration_manager.apply_migration(
+            path.name.split("_")[0], path.name, path.read_text(encoding="utf-8"),
+            record_only=args.record_only
+        )
+        print(f"{'Recorded' if args.record_only else 'Applied'} {path.name}")
+    print(f"{len(pending)} migrations {'recorded' if args.record_only else 'applied'}, "
+          f"{len(migrations) - len(pending)} already up to date")
+
+def run_refresh_summaries(args):
+    from ..database.scripts.database_manager import ReportsDatabaseManager  # pylint: disable=import-outside-toplevel
+
+    ReportsDatabaseManager().refresh_summary_views(concurrently=not args.blocking)
+    print("Summary views refreshed")
+
+def run_normalize_titles(args):  # pylint: disable=unused-argument
+    from ..bots.linkedin.utils.title_normalizer.title_normalizer import TitleNormalizationJob  # pylint: disable=import-outside-toplevel
+
+    updated_rows = TitleNormalizationJob().run()
+    print(f"Normalized the titles of {updated_rows} work experience rows")
+
+def run_normalize_companies(args):  # pylint: disable=unused-argument
+    from ..bots.linkedin.utils.company_canonicalizer.company_canonicalizer import CompanyBackfill  # pylint: disable=import-outside-toplevel
+
+    linked_rows = CompanyBackfill().run()
+    print(f"Linked {linked_rows} work experience rows to companies")
+
+def run_coworker_graph(args):
+    from ..database.scripts.coworker_graph import CoworkerGraphJob  # pylint: disable=import-outside-toplevel
+
+    edge_count = CoworkerGraphJob(jobs=args.jobs, batch_size=args.batch_size, as_of=args.as_of).run()
+    print(f"Wrote {edge_count} co-worker edges")
+
+def run_load_synthetic(args):
+    import time  # pylint: disable=import-outside-toplevel
+    from ..database.scripts.synthetic_data import SCALES, load  # pylint: disable=import-outside-toplevel
+
+    start = time.perf_counter()
+    row_counts = load(SCALES[args.scale], seed=args.seed, chunk_size=args.chunk_size, truncate=args.truncate)
+    print(", ".join(f"{count} {table}" for table, count in row_counts.items()),
+          f"loaded in {time.perf_counter() - start:.1f} s")
+
+def run_bench(args):
+    from benchmarks.run import main as run_benchmarks  # pylint: disable=import-outside-toplevel
+
+    run_benchmarks(args.bench_args)
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the ppdb argument parser. Every subcommand sets `handler`, and
+    `uses_database` when it needs the shared connection pool.
+    """
+    parser = argparse.ArgumentParser(prog="ppdb", description="PreferredPartnerDB batch jobs.")
+    parser.add_argument(
+        "--profile", default=None,
+        help="database.ini profile to connect to (default PPDB_DB_PROFILE, or postgresql)."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True, metavar="command")
+
+    def add_command(name, handler, help_text, uses_database=True, parallel=False, epilog=None):
+        subparser = subparsers.add_parser(name, help=help_text, description=help_text, epilog=epilog)
+        subparser.set_defaults(handler=handler, uses_database=uses_database, jobs=1)
+        if parallel:
+            subparser.add_argument("-j", "--jobs", type=int, default=1, help="Worker count.")
+        return subparser
+
+    export = add_command("export", run_export, "Export the database to a spreadsheet.")
+    export.add_argument(
+        "--mode", choices=["tables", "profiles"], default="tables",
+        help="'tables' writes one sheet per table, 'profiles' writes one row per user."
+    )
+    export.add_argument("--output", default=None, help="Output file (.xlsx, or .csv for profiles).")
+    export.add_argument("--chunk-size", type=int, default=5000, help="Rows fetched from the server at a time.")
+
+    add_command(
+        "normalize-locations", run_normalize_locations,
+        "Format the raw locations of users and jobs as 'City, ST'.", parallel=True,
+        epilog="Keep --jobs at 1 against the public Nominatim service (1 request/s)."
+    )
+
+    add_command(
+        "estimate-salaries", run_estimate_salaries,
+        "Estimate the earnings of work experiences from scraped salaries.", parallel=True
+    )
+
+    parse_documents = add_command(
+        "parse-documents", run_parse_documents,
+        "Match job description documents against the skills table.", parallel=True,
+        epilog="--jobs sets the text extraction processes, every core by default."
+    )
+    parse_documents.add_argument(
+        "path", nargs="?", default=str(pathlib.Path("sqlizer", "files", "sample-job-description.pdf")),
+        help="A PDF/DOCX file, or a directory of them."
+    )
+    parse_documents.add_argument("--batch-size", type=int, default=16)
+    parse_documents.add_argument("--n-process", type=int, default=1, help="spaCy processes.")
+    parse_documents.add_argument("--top-users", type=int, default=10)
+    parse_documents.set_defaults(jobs=None)
+
+    dedupe = add_command("dedupe", run_dedupe, "Find and merge duplicate users.")
+    dedupe.add_argument("--threshold", type=float, default=0.8,
+                        help="Minimum match score for two users to be merged.")
+    dedupe.add_argument("--max-block-size", type=int, default=50,
+                        help="Skip blocking keys shared by more users than this.")
+    dedupe.add_argument("--dry-run", action="store_true", help="Log the merges without writing them.")
+
+    migrate = add_command("migrate", run_migrate, "Apply the pending database migrations.")
+    migrate.add_argument("--list", action="store_true", help="Only list applied and pending migrations.")
+    migrate.add_argument(
+        "--record-only", action="store_true",
+        help="Mark the pending migrations as applied without running them (for hand-migrated databases)."
+    )
+
+    refresh_summaries = add_command(
+        "refresh-summaries", run_refresh_summaries, "Refresh the materialized summary views."
+    )
+    refresh_summaries.add_argument("--blocking", action="store_true",
+                                   help="Use a plain REFRESH instead of REFRESH ... CONCURRENTLY.")
+
+    add_command("normalize-titles", run_normalize_titles, "Normalize the job titles of work experiences.")
+    add_command("normalize-companies", run_normalize_companies, "Link work experiences to canonical companies.")
+
+    coworker_graph = add_command(
+        "coworker-graph", run_coworker_graph,
+        "Rebuild the graph of users who overlapped at the same company.", parallel=True,
+        epilog="Run normalize-companies first: only positions linked to a company are joined."
+    )
+    coworker_graph.add_argument("--batch-size", type=int, default=500,
+                                help="Companies whose edges are replaced per transaction.")
+    coworker_graph.add_argument("--as-of", type=datetime.date.fromisoformat, default=None,
+                                help="YYYY-MM-DD end of the current positions (default today).")
+
+    load_synthetic = add_command("load-synthetic", run_load_synthetic, "Load synthetic profiles for scale testing.")
+    load_synthetic.add_argument("--scale", choices=["10k", "100k", "1m"], default="10k",
+                                help="Number of users to generate.")
+    load_synthetic.add_argument("--seed", type=int, default=0, help="Seed of the random generator.")
+    load_synthetic.add_argument("--chunk-size", type=int, default=20_000, help="Users loaded per transaction.")
+    load_synthetic.add_argument("--truncate", action="store_true",
+                                help="Delete every user, experience, education and skill row first.")
+
+    bench = add_command("bench", run_bench, "Run the benchmark suite (arguments go to benchmarks.run).",
+                        uses_database=False)
+    bench.add_argument("bench_args", nargs=argparse.REMAINDER, help="Arguments of benchmarks.run.")
+
+    return parser
+
+def main(argv=None):
+    parser = build_parser()
+    # Options of benchmarks.run are not ppdb options, pass them through to bench
+    args, unknown_args = parser.parse_known_args(argv)
+    if args.command == "bench":
+        args.bench_args = unknown_args + args.bench_args
+    elif unknown_args:
+        parser.error(f"unrecognized arguments: {' '.join(unknown_args)}")
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    if args.profile:
+        # Through the environment, so that worker processes and bench use it too
+        os.environ[PROFILE_ENV] = args.profile
+
+    if not args.uses_database:
+        args.handler(args)
+        return
+
+    import psycopg2  # pylint: disable=import-outside-toplevel
+    from ..database.scripts.connect_to_db import close_pool, open_pool  # pylint: disable=import-outside-toplevel
+
+    try:
+        # Pool sizes, timeouts and keepalives come from the profile
+        open_pool()
+        read_replica = load_config().read_replica
+    except ConfigError as error:
+        parser.exit(1, f"ppdb {args.command}: {error}\n")
+    except psycopg2.OperationalError as error:
+        parser.exit(1, f"ppdb {args.command}: cannot connect to the database: {error}\n")
+    if read_replica:
+        try:
+            open_pool(profile=read_replica)
+        except (ConfigError, psycopg2.OperationalError) as error:
+            # The managers read from the primary when the replica is unreachable
+            logging.warning("Replica %s unavailable, reading from the primary: %s", read_replica, error)
+    try:
+        args.handler(args)
+    finally:
+        close_pool()
+
+if __name__ == "__main__":
+    main()
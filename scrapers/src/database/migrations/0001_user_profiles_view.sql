@@ -0,0 +1,70 @@
+-- View: user_profiles
+--
+-- One wide record per user. Each child table is aggregated once (json_agg /
+-- string_agg grouped by user_id) and then joined to users, so building the
+-- whole export is a single pass over every table instead of one lookup per
+-- user.
+
+CREATE OR REPLACE VIEW user_profiles AS
+SELECT
+    u.user_id,
+    u.users_name,
+    u.email,
+    u.phone_number,
+    u.address,
+    u.website,
+    u.location_of_user,
+    u.profile_url,
+    u.alumni_url,
+    u.approved,
+    u.estimated_age,
+    u.estimated_net_worth,
+    COALESCE(we.work_experience, '[]'::json) AS work_experience,
+    COALESCE(ed.education, '[]'::json) AS education,
+    sk.skills
+FROM users u
+LEFT JOIN (
+    SELECT
+        user_id,
+        json_agg(
+            json_build_object(
+                'company', company,
+                'job_title', job_title,
+                'location_of_job', location_of_job,
+                'start_date', start_date,
+                'end_date', end_date,
+                'work_description', work_description,
+                'estimated_net_earnings', estimated_net_earnings
+            )
+            ORDER BY start_date DESC NULLS LAST, experience_id
+        ) AS work_experience
+    FROM work_experience
+    GROUP BY user_id
+) we ON we.user_id = u.user_id
+LEFT JOIN (
+    SELECT
+        user_id,
+        json_agg(
+            json_build_object(
+                'school_name', school_name,
+                'degree', degree,
+                'grade', grade,
+                'start_date', start_date,
+                'end_date', end_date,
+                'description_of_education', description_of_education,
+                'activities_and_societies', activities_and_societies
+            )
+            ORDER BY start_date DESC NULLS LAST, education_id
+        ) AS education
+    FROM education
+    GROUP BY user_id
+) ed ON ed.user_id = u.user_id
+LEFT JOIN (
+    -- skills holds a NULL placeholder row for users without skills
+    SELECT
+        user_id,
+        string_agg(DISTINCT skill_name, ', ') AS skills
+    FROM skills
+    WHERE skill_name IS NOT NULL
+    GROUP BY user_id
+) sk ON sk.user_id = u.user_id;
@@ -0,0 +1,82 @@
+-- Materialized summary views
+--
+-- Pre-computed aggregates for the reports analysts run over work_experience,
+-- skills and users. Each view has a UNIQUE index so it can be refreshed with
+-- REFRESH MATERIALIZED VIEW CONCURRENTLY (readers are never blocked) and so
+-- report lookups are index scans instead of full-table aggregations.
+
+-- How many users list each skill
+CREATE MATERIALIZED VIEW IF NOT EXISTS skills_frequency AS
+SELECT
+    skill_name,
+    COUNT(DISTINCT user_id) AS user_count
+FROM skills
+WHERE skill_name IS NOT NULL
+GROUP BY skill_name;
+
+CREATE UNIQUE INDEX IF NOT EXISTS skills_frequency_skill_name_idx
+    ON skills_frequency (skill_name);
+CREATE INDEX IF NOT EXISTS skills_frequency_user_count_idx
+    ON skills_frequency (user_count DESC);
+
+-- Distinct users employed at each company in each calendar year
+CREATE MATERIALIZED VIEW IF NOT EXISTS company_headcount_by_year AS
+SELECT
+    company,
+    year,
+    COUNT(DISTINCT user_id) AS headcount
+FROM (
+    SELECT
+        user_id,
+        company,
+        generate_series(
+            EXTRACT(YEAR FROM start_date)::int,
+            EXTRACT(YEAR FROM COALESCE(end_date, CURRENT_DATE))::int
+        ) AS year
+    FROM work_experience
+    WHERE company IS NOT NULL AND start_date IS NOT NULL
+) employment_years
+GROUP BY company, year;
+
+CREATE UNIQUE INDEX IF NOT EXISTS company_headcount_by_year_company_year_idx
+    ON company_headcount_by_year (company, year);
+
+-- Number of users per location
+CREATE MATERIALIZED VIEW IF NOT EXISTS location_distribution AS
+SELECT
+    COALESCE(location_of_user, 'Unknown') AS location,
+    COUNT(*) AS user_count
+FROM users
+GROUP BY COALESCE(location_of_user, 'Unknown');
+
+CREATE UNIQUE INDEX IF NOT EXISTS location_distribution_location_idx
+    ON location_distribution (location);
+CREATE INDEX IF NOT EXISTS location_distribution_user_count_idx
+    ON location_distribution (user_count DESC);
+
+-- Number of positions per tenure bucket
+CREATE MATERIALIZED VIEW IF NOT EXISTS tenure_distribution AS
+SELECT
+    tenure_bucket,
+    COUNT(*) AS position_count
+FROM (
+    SELECT
+        CASE
+            WHEN tenure_months < 12 THEN '0-1 years'
+            WHEN tenure_months < 24 THEN '1-2 years'
+            WHEN tenure_months < 60 THEN '2-5 years'
+            WHEN tenure_months < 120 THEN '5-10 years'
+            ELSE '10+ years'
+        END AS tenure_bucket
+    FROM (
+        SELECT
+            (EXTRACT(YEAR FROM age(COALESCE(end_date, CURRENT_DATE), start_date)) * 12
+             + EXTRACT(MONTH FROM age(COALESCE(end_date, CURRENT_DATE), start_date))) AS tenure_months
+        FROM work_experience
+        WHERE start_date IS NOT NULL
+    ) tenures
+) buckets
+GROUP BY tenure_bucket;
+
+CREATE UNIQUE INDEX IF NOT EXISTS tenure_distribution_tenure_bucket_idx
+    ON tenure_distribution (tenure_bucket);
@@ -0,0 +1,36 @@
+-- Full-text search over work experience and education
+--
+-- Weighted tsvector columns are generated from the free-text columns and
+-- indexed with GIN, so ranked searches are index lookups instead of ILIKE
+-- scans over an Excel export. A trigram index on work_experience.company
+-- backs fuzzy company-name lookups.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Weights: job title (A) > company (B) > description (C)
+ALTER TABLE work_experience
+    ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', COALESCE(job_title, '')), 'A') ||
+        setweight(to_tsvector('english', COALESCE(company, '')), 'B') ||
+        setweight(to_tsvector('english', COALESCE(work_description, '')), 'C')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS work_experience_search_vector_idx
+    ON work_experience USING GIN (search_vector);
+
+-- Weights: degree (A) > school (B) > description and activities (C)
+ALTER TABLE education
+    ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', COALESCE(degree, '')), 'A') ||
+        setweight(to_tsvector('english', COALESCE(school_name, '')), 'B') ||
+        setweight(to_tsvector('english', COALESCE(description_of_education, '')), 'C') ||
+        setweight(to_tsvector('english', COALESCE(activities_and_societies, '')), 'C')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS education_search_vector_idx
+    ON education USING GIN (search_vector);
+
+CREATE INDEX IF NOT EXISTS work_experience_company_trgm_idx
+    ON work_experience USING GIN (company gin_trgm_ops);
@@ -0,0 +1,24 @@
+-- Company entities
+--
+-- work_experience.company keeps the raw scraped string; company_id points at
+-- one canonical company so "Google", "Google LLC" and "Google Inc." aggregate
+-- together through an integer join.
+
+CREATE TABLE IF NOT EXISTS companies(
+    company_id SERIAL PRIMARY KEY,
+    canonical_name VARCHAR(255) NOT NULL UNIQUE,
+    display_name VARCHAR(255)
+);
+
+-- Folded name -> company, for names that suffix stripping cannot reconcile
+-- (e.g. 'facebook' -> Meta)
+CREATE TABLE IF NOT EXISTS company_aliases(
+    alias VARCHAR(255) PRIMARY KEY,
+    company_id INTEGER NOT NULL REFERENCES companies(company_id)
+);
+
+ALTER TABLE work_experience
+    ADD COLUMN IF NOT EXISTS company_id INTEGER REFERENCES companies(company_id);
+
+CREATE INDEX IF NOT EXISTS work_experience_company_id_idx
+    ON work_experience (company_id);
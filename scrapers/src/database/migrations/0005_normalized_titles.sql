@@ -0,0 +1,13 @@
+-- Normalized job titles
+--
+-- job_title keeps the raw scraped string. normalized_title has abbreviations
+-- expanded and seniority words removed ("Sr. SWE" -> "software engineer"),
+-- seniority holds the extracted level and role_family the taxonomy bucket.
+
+ALTER TABLE work_experience
+    ADD COLUMN IF NOT EXISTS normalized_title VARCHAR(255),
+    ADD COLUMN IF NOT EXISTS seniority VARCHAR(50),
+    ADD COLUMN IF NOT EXISTS role_family VARCHAR(50);
+
+CREATE INDEX IF NOT EXISTS work_experience_normalized_title_idx
+    ON work_experience (normalized_title);
@@ -0,0 +1,33 @@
+-- User provenance and merge history
+--
+-- The same person can be scraped from LinkedIn and from the Duke alumni
+-- directory. sources records which scrapers contributed to a users row and
+-- merged_from the user_ids that were folded into it. user_merges keeps the
+-- URLs of every merged row, so a later scrape of the same person is
+-- recognized instead of inserted again.
+
+ALTER TABLE users
+    ADD COLUMN IF NOT EXISTS sources TEXT[] NOT NULL DEFAULT '{}',
+    ADD COLUMN IF NOT EXISTS merged_from INTEGER[] NOT NULL DEFAULT '{}';
+
+UPDATE users SET sources = array_remove(ARRAY[
+    CASE WHEN profile_url IS NOT NULL AND alumni_url IS NULL THEN 'linkedin' END,
+    CASE WHEN alumni_url IS NOT NULL THEN 'duke_alumni' END
+], NULL)
+WHERE sources = '{}';
+
+CREATE TABLE IF NOT EXISTS user_merges(
+    merge_id SERIAL PRIMARY KEY,
+    surviving_user_id INTEGER NOT NULL REFERENCES users(user_id) ON DELETE CASCADE,
+    merged_user_id INTEGER NOT NULL,
+    merged_profile_url TEXT,
+    merged_alumni_url TEXT,
+    match_score REAL,
+    merged_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS user_merges_merged_profile_url_idx
+    ON user_merges (merged_profile_url);
+
+CREATE INDEX IF NOT EXISTS user_merges_merged_alumni_url_idx
+    ON user_merges (merged_alumni_url);
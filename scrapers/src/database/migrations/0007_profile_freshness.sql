@@ -0,0 +1,21 @@
+-- Per-section content hashes of scraped profiles
+--
+-- Every scrape of a profile section (main, contact_info, skills, experience,
+-- education) records the SHA-256 of what was seen. A section whose hash did
+-- not change is not written again, and seen_count / change_count give the
+-- refresh scheduler each profile's past change rate.
+
+CREATE TABLE IF NOT EXISTS profile_section_hashes(
+    user_id INTEGER NOT NULL REFERENCES users(user_id) ON DELETE CASCADE,
+    section VARCHAR(30) NOT NULL,
+    content_hash CHAR(64) NOT NULL,
+    first_seen_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    last_seen_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    last_changed_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    seen_count INTEGER NOT NULL DEFAULT 1,
+    change_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, section)
+);
+
+CREATE INDEX IF NOT EXISTS profile_section_hashes_last_seen_at_idx
+    ON profile_section_hashes (last_seen_at);
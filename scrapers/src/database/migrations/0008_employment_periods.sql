@@ -0,0 +1,169 @@
+-- Employment and education periods
+--
+-- LinkedIn shows "Mar 2018" or "2018", never a day, and parse_date_range
+-- stores each as the first day of its month or year. start_precision and
+-- end_precision record which, and is_current marks a "Present" end date,
+-- which is now NULL instead of the date of the scrape. period is the whole
+-- time span those columns describe, e.g. "Mar 2018 - 2020" is
+-- [2018-03-01, 2021-01-01), and a current position has no upper bound.
+--
+-- The GiST indexes turn "who worked at company X during 2018" into an
+-- indexed range-overlap lookup:
+--
+--     SELECT user_id FROM work_experience
+--     WHERE company_id = 42 AND period && daterange('2018-01-01', '2019-01-01');
+
+-- GiST operator classes for the scalar columns of the composite indexes
+CREATE EXTENSION IF NOT EXISTS btree_gist;
+
+ALTER TABLE work_experience
+    ADD COLUMN IF NOT EXISTS start_precision VARCHAR(5)
+        CHECK (start_precision IN ('day', 'month', 'year')),
+    ADD COLUMN IF NOT EXISTS end_precision VARCHAR(5)
+        CHECK (end_precision IN ('day', 'month', 'year')),
+    ADD COLUMN IF NOT EXISTS is_current BOOLEAN NOT NULL DEFAULT false;
+
+ALTER TABLE education
+    ADD COLUMN IF NOT EXISTS start_precision VARCHAR(5)
+        CHECK (start_precision IN ('day', 'month', 'year')),
+    ADD COLUMN IF NOT EXISTS end_precision VARCHAR(5)
+        CHECK (end_precision IN ('day', 'month', 'year')),
+    ADD COLUMN IF NOT EXISTS is_current BOOLEAN NOT NULL DEFAULT false;
+
+-- Every scraped date is the first of a month, except "Present", which was
+-- stored as the day of the scrape. Rows loaded by an older load-synthetic end
+-- on arbitrary days; reload them with load-synthetic --truncate instead.
+UPDATE work_experience
+SET is_current = true, end_date = NULL
+WHERE extract(day FROM end_date) <> 1;
+
+UPDATE education
+SET is_current = true, end_date = NULL
+WHERE extract(day FROM end_date) <> 1;
+
+-- "2018" and "Jan 2018" cannot be told apart any more; month is the safe reading
+UPDATE work_experience
+SET start_precision = CASE WHEN extract(day FROM start_date) = 1 THEN 'month'
+                           WHEN start_date IS NOT NULL THEN 'day' END,
+    end_precision = CASE WHEN extract(day FROM end_date) = 1 THEN 'month'
+                         WHEN end_date IS NOT NULL THEN 'day' END
+WHERE start_precision IS NULL AND end_precision IS NULL;
+
+UPDATE education
+SET start_precision = CASE WHEN extract(day FROM start_date) = 1 THEN 'month'
+                           WHEN start_date IS NOT NULL THEN 'day' END,
+    end_precision = CASE WHEN extract(day FROM end_date) = 1 THEN 'month'
+                         WHEN end_date IS NOT NULL THEN 'day' END
+WHERE start_precision IS NULL AND end_precision IS NULL;
+
+-- The upper bound is the day after the period: the end of its month or year
+-- for imprecise dates, none while current. A NULL end date was already read
+-- as "still there" by the summary views. An end before the start (a typo on
+-- the profile) still yields a one-day period rather than failing the insert.
+ALTER TABLE work_experience
+    ADD COLUMN IF NOT EXISTS period daterange GENERATED ALWAYS AS (
+        CASE
+            WHEN start_date IS NULL THEN NULL
+            WHEN is_current OR end_date IS NULL THEN daterange(start_date, NULL)
+            ELSE daterange(start_date, GREATEST(
+                CASE end_precision
+                    WHEN 'year' THEN (end_date + interval '1 year')::date
+                    WHEN 'month' THEN (end_date + interval '1 month')::date
+                    ELSE end_date + 1
+                END,
+                start_date + 1
+            ))
+        END
+    ) STORED;
+
+ALTER TABLE education
+    ADD COLUMN IF NOT EXISTS period daterange GENERATED ALWAYS AS (
+        CASE
+            WHEN start_date IS NULL THEN NULL
+            WHEN is_current OR end_date IS NULL THEN daterange(start_date, NULL)
+            ELSE daterange(start_date, GREATEST(
+                CASE end_precision
+                    WHEN 'year' THEN (end_date + interval '1 year')::date
+                    WHEN 'month' THEN (end_date + interval '1 month')::date
+                    ELSE end_date + 1
+                END,
+                start_date + 1
+            ))
+        END
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS work_experience_company_period_idx
+    ON work_experience USING gist (company_id, period);
+
+CREATE INDEX IF NOT EXISTS work_experience_period_idx
+    ON work_experience USING gist (period);
+
+CREATE INDEX IF NOT EXISTS education_school_period_idx
+    ON education USING gist (school_name, period);
+
+-- Expose the new columns in the export view
+CREATE OR REPLACE VIEW user_profiles AS
+SELECT
+    u.user_id,
+    u.users_name,
+    u.email,
+    u.phone_number,
+    u.address,
+    u.website,
+    u.location_of_user,
+    u.profile_url,
+    u.alumni_url,
+    u.approved,
+    u.estimated_age,
+    u.estimated_net_worth,
+    COALESCE(we.work_experience, '[]'::json) AS work_experience,
+    COALESCE(ed.education, '[]'::json) AS education,
+    sk.skills
+FROM users u
+LEFT JOIN (
+    SELECT
+        user_id,
+        json_agg(
+            json_build_object(
+                'company', company,
+                'job_title', job_title,
+                'location_of_job', location_of_job,
+                'start_date', start_date,
+                'end_date', end_date,
+                'is_current', is_current,
+                'work_description', work_description,
+                'estimated_net_earnings', estimated_net_earnings
+            )
+            ORDER BY start_date DESC NULLS LAST, experience_id
+        ) AS work_experience
+    FROM work_experience
+    GROUP BY user_id
+) we ON we.user_id = u.user_id
+LEFT JOIN (
+    SELECT
+        user_id,
+        json_agg(
+            json_build_object(
+                'school_name', school_name,
+                'degree', degree,
+                'grade', grade,
+                'start_date', start_date,
+                'end_date', end_date,
+                'is_current', is_current,
+                'description_of_education', description_of_education,
+                'activities_and_societies', activities_and_societies
+            )
+            ORDER BY start_date DESC NULLS LAST, education_id
+        ) AS education
+    FROM education
+    GROUP BY user_id
+) ed ON ed.user_id = u.user_id
+LEFT JOIN (
+    -- skills holds a NULL placeholder row for users without skills
+    SELECT
+        user_id,
+        string_agg(DISTINCT skill_name, ', ') AS skills
+    FROM skills
+    WHERE skill_name IS NOT NULL
+    GROUP BY user_id
+) sk ON sk.user_id = u.user_id;
@@ -0,0 +1,27 @@
+-- Co-worker graph
+--
+-- One row per pair of users whose positions at the same canonical company
+-- overlapped, with the number of days they worked there together. The table
+-- is rebuilt by `ppdb coworker-graph` (scripts/coworker_graph.py) from the
+-- periods of migration 0008; it is not maintained by the scrapers.
+--
+-- Each pair is stored once, with user_a < user_b: the primary key serves
+-- lookups by user_a, and the user_b index the other direction:
+--
+--     SELECT * FROM coworker_edges WHERE user_a = 7 OR user_b = 7;
+
+CREATE TABLE IF NOT EXISTS coworker_edges(
+    user_a INTEGER NOT NULL REFERENCES users(user_id) ON DELETE CASCADE,
+    user_b INTEGER NOT NULL REFERENCES users(user_id) ON DELETE CASCADE,
+    company_id INTEGER NOT NULL REFERENCES companies(company_id) ON DELETE CASCADE,
+    overlap_days INTEGER NOT NULL CHECK (overlap_days > 0),
+    PRIMARY KEY (user_a, user_b, company_id),
+    CHECK (user_a < user_b)
+);
+
+CREATE INDEX IF NOT EXISTS coworker_edges_user_b_idx
+    ON coworker_edges (user_b);
+
+-- The rebuild replaces the edges company by company
+CREATE INDEX IF NOT EXISTS coworker_edges_company_id_idx
+    ON coworker_edges (company_id);
@@ -1,28 +1,35 @@
 """
 Module: config
 
-This module provides functions to establish a connection to a PostgreSQL database 
-using configuration parameters read from a specified INI file.
+This module reads the PostgreSQL connection settings from database.ini, once per
+process and per profile, with environment-variable overrides.
+
+Each section of database.ini is a profile: [postgresql] is the primary that the
+scrapers write to, and optional sections such as [replica] or [bench] describe
+other servers. PPDB_DB_PROFILE selects the profile used by default, and any
+setting can be overridden with PPDB_<PROFILE>_<KEY>, e.g. PPDB_POSTGRESQL_PASSWORD
+or PPDB_REPLICA_HOST. A profile may also come from the environment alone.
+PPDB_CONFIG points at another database.ini.
+
+Besides the psycopg2/libpq connection parameters (host, port, database, user,
+password, application_name, connect_timeout, keepalives, ...), a profile may set
+statement_timeout (milliseconds), the pool sizes pool_min and pool_max, and
+read_replica: the profile that DatabaseManager sends its read-only queries to.
 
 Functions:
-    - config(filename="database.ini", section="postgresql"): 
-        Read database configuration from the specified file and section.
-        Args:
-            filename (str): The path to the configuration file.
-            section (str): The section name in the configuration file.
-        Returns:
-            dict: A dictionary containing the database configuration parameters.
+    - load_config(profile=None):
+        Return the validated DatabaseConfig of a profile, cached for the process.
+    - config(filename="database.ini", section=None):
+        Return the psycopg2.connect() keyword arguments of a profile.
 
 Example:
-    To establish a connection to a PostgreSQL database, you can use the `config` function
-    to read the configuration parameters from a file named 'database.ini' located in the 
-    'src/database/scripts/config' directory, under the 'postgresql' section:
-    
     ```
-    >>> from config import config
+    >>> from config import config, load_config
 
-    >>> params = config()
-    >>> conn = psycopg2.connect(**params)
+    >>> conn = psycopg2.connect(**config())
+    >>> replica = load_config("replica")
+    >>> replica.pool_max
+    4
     ```
 
 Author:
@@ -32,48 +39,150 @@ Date:
     April 29, 2024
 
 Version:
-    0.1-dev
+    0.2-dev
 """
 
-from configparser import ConfigParser, NoSectionError
-from os.path import join
+import os
+from configparser import ConfigParser, Error as ConfigParserError
+from functools import lru_cache
+from os.path import dirname, join
+from typing import Dict, NamedTuple, Optional
+
+CONFIG_FILE_ENV = "PPDB_CONFIG"
+PROFILE_ENV = "PPDB_DB_PROFILE"
+PRIMARY_PROFILE = "postgresql"
+DEFAULT_CONFIG_FILE = join(dirname(__file__), "database.ini")
+
+# Applied unless the profile sets them
+CONNECTION_DEFAULTS = {
+    "application_name": "ppdb",
+    "connect_timeout": "10",
+    "keepalives": "1",
+    "keepalives_idle": "30",
+    "keepalives_interval": "10",
+    "keepalives_count": "5",
+}
+CONNECTION_KEYS = {
+    "host", "hostaddr", "port", "database", "dbname", "user", "password", "sslmode",
+    "application_name", "connect_timeout", "keepalives", "keepalives_idle",
+    "keepalives_interval", "keepalives_count", "target_session_attrs", "options",
+}
+INTEGER_KEYS = {
+    "port", "connect_timeout", "keepalives", "keepalives_idle", "keepalives_interval",
+    "keepalives_count", "statement_timeout", "pool_min", "pool_max",
+}
+ROUTING_KEYS = {"read_replica"}
+
+class ConfigError(Exception):
+    """Raised when the database configuration is missing or invalid."""
+
+class DatabaseConfig(NamedTuple):
+    profile: str
+    connection: Dict[str, str]  # psycopg2.connect() keyword arguments
+    pool_min: int
+    pool_max: int
+    read_replica: Optional[str] = None  # Profile of the read-only queries
+
+def _read_profile(file_path: str, profile: str) -> Dict[str, str]:
+    settings = {}
+    if os.path.exists(file_path):
+        parser = ConfigParser()
+        try:
+            parser.read(file_path)
+        except ConfigParserError as error:
+            raise ConfigError(f"Cannot parse {file_path}: {error}") from error
+        if parser.has_section(profile):
+            settings.update(parser.items(profile))
+
+    # PPDB_REPLICA_HOST overrides host of [replica]
+    prefix = f"PPDB_{profile.upper()}_"
+    for name, value in os.environ.items():
+        if name.startswith(prefix):
+            settings[name[len(prefix):].lower()] = value
+
+    if not settings:
+        if not os.path.exists(file_path):
+            raise ConfigError(
+                f"Database configuration file {file_path} not found. Create it, point "
+                f"{CONFIG_FILE_ENV} at one, or set {prefix}HOST, {prefix}DATABASE and {prefix}USER."
+            )
+        raise ConfigError(
+            f"Profile '{profile}' is neither a section of {file_path} nor set with {prefix}* variables."
+        )
+    return settings
+
+@lru_cache(maxsize=None)
+def _load_config(file_path: str, profile: str) -> DatabaseConfig:
+    settings = _read_profile(file_path, profile)
 
-def config(filename="database.ini", section="postgresql"):
+    unknown_keys = set(settings) - CONNECTION_KEYS - INTEGER_KEYS - ROUTING_KEYS
+    if unknown_keys:
+        raise ConfigError(
+            f"Unknown setting(s) {', '.join(sorted(unknown_keys))} in profile '{profile}'."
+        )
+    for key in INTEGER_KEYS.intersection(settings):
+        if not settings[key].strip().isdigit():
+            raise ConfigError(f"Setting {key} of profile '{profile}' must be a whole number, got '{settings[key]}'.")
+    missing_keys = [key for key in ("host", "user") if key not in settings]
+    if "database" not in settings and "dbname" not in settings:
+        missing_keys.append("database")
+    if missing_keys:
+        raise ConfigError(f"Profile '{profile}' is missing {', '.join(missing_keys)}.")
+
+    pool_min = int(settings.pop("pool_min", 1))
+    pool_max = int(settings.pop("pool_max", 4))
+    if not 0 <= pool_min <= pool_max or pool_max < 1:
+        raise ConfigError(f"Profile '{profile}' needs 0 <= pool_min <= pool_max and pool_max >= 1.")
+
+    read_replica = settings.pop("read_replica", None) or None
+    if read_replica == profile:
+        raise ConfigError(f"Profile '{profile}' cannot be its own read_replica.")
+
+    connection = {**CONNECTION_DEFAULTS, **settings}
+    statement_timeout = connection.pop("statement_timeout", None)
+    if statement_timeout:
+        options = connection.get("options", "")
+        connection["options"] = f"{options} -c statement_timeout={statement_timeout}".strip()
+    return DatabaseConfig(profile, connection, pool_min, pool_max, read_replica)
+
+def load_config(profile: Optional[str] = None) -> DatabaseConfig:
+    """
+    Return the validated settings of a profile. The file is read once per
+    process and profile, so repeated calls are free.
+
+    Args:
+        profile (str): Section of database.ini. Defaults to PPDB_DB_PROFILE, or postgresql.
+
+    Returns:
+        DatabaseConfig: Connection parameters and pool sizes of the profile.
+
+    Raises:
+        ConfigError: If the file or profile is missing, or a setting is invalid.
+    """
+    file_path = os.environ.get(CONFIG_FILE_ENV, DEFAULT_CONFIG_FILE)
+    profile = profile or os.environ.get(PROFILE_ENV, PRIMARY_PROFILE)
+    return _load_config(file_path, profile)
+
+def config(filename="database.ini", section=None):
     """
     Read database configuration from the specified file and section.
 
     Args:
-        filename (str): The path to the configuration file.
-        section (str): The section name in the configuration file.
+        filename (str): Name of a configuration file next to this module.
+            Ignored when PPDB_CONFIG is set.
+        section (str): The section name (profile) in the configuration file.
+            Defaults to PPDB_DB_PROFILE, or postgresql.
 
     Returns:
         dict: A dictionary containing the database configuration parameters.
+
+    Raises:
+        ConfigError: If the file or section is missing, or a setting is invalid.
     """
-    # Construct the full path to the configuration file
-    file_path = join("scrapers", "src", "database", "scripts", "config", filename)
-
-    # Create a parser object
-    parser = ConfigParser()
-
-    # Read the configuration file
-    parser.read(file_path)
-
-    # Initialize an empty dictionary to store configuration parameters
-    db = {}
-
-    # Check if the specified section exists in the configuration file
-    if parser.has_section(section):
-        # Get all parameters from the specified section
-        params = parser.items(section)
-
-        # Populate the dictionary with parameter key-value pairs
-        for key, value in params:
-            db[key] = value
-    else:
-        # If the specified section is not found, raise an exception
-        raise NoSectionError(
-            f"Section '{section}' not found in '{filename}' file."
-        )
+    if filename != "database.ini" and CONFIG_FILE_ENV not in os.environ:
+        file_path = join(dirname(__file__), filename)
+        profile = section or os.environ.get(PROFILE_ENV, PRIMARY_PROFILE)
+        return dict(_load_config(file_path, profile).connection)
 
-    # Return the dictionary containing database configuration
-    return db
+    # A copy, so that callers cannot change the cached settings
+    return dict(load_config(section).connection)
@@ -6,11 +6,15 @@ It includes a function to establish a connection to the database and retrieve a
 
 Functions:
     - connect: Establishes a connection to the PostgreSQL database using configuration parameters.
+    - open_pool: Opens the process-wide connection pool of a profile, that connect() then draws from.
+    - release: Returns a connection to the pool, or closes it when it is not pooled.
+    - close_pool: Closes every pooled connection.
 
 Dependencies:
     - psycopg2: A PostgreSQL adapter for the Python programming language.
-    - config: A function from the `config` module within the `src.database.scripts.config` package,
+    - load_config: A function from the `config` module within the `src.database.scripts.config` package,
               which provides configuration parameters for connecting to the PostgreSQL database.
+              They are read once per process, so connecting again costs no file access.
 
 Example:
     To connect to the PostgreSQL database, use the `connect` function as follows:
@@ -36,22 +40,84 @@ Version:
 # pylint: disable=E0401
 import psycopg2
 import logging
-from .config.config import config
+from psycopg2.pool import PoolError, ThreadedConnectionPool
+from typing import Dict, Optional
+from .config.config import load_config
 
 logging.basicConfig(filename="log.log", level=logging.INFO)
 
-def connect():
+# Set by open_pool(), for the batch jobs that share one set of connections, per profile
+_pools: Dict[str, ThreadedConnectionPool] = {}
+
+def open_pool(min_connections: Optional[int] = None, max_connections: Optional[int] = None,
+              profile: Optional[str] = None) -> ThreadedConnectionPool:
+    """
+    Open the process-wide connection pool of a profile. Once open, connect()
+    hands out pooled connections of that profile instead of opening a new one each time.
+
+    Args:
+        min_connections (int): Connections opened right away. Defaults to pool_min of the profile.
+        max_connections (int): Connections the pool may hold at once. Defaults to pool_max of the profile.
+        profile (str): Profile of database.ini. Defaults to the active profile.
+
+    Returns:
+        psycopg2.pool.ThreadedConnectionPool: The pool, or the already open one.
     """
-    Connect to a PostgreSQL database.
+    database_config = load_config(profile)
+    if database_config.profile not in _pools:
+        max_connections = max_connections or database_config.pool_max
+        min_connections = min(
+            database_config.pool_min if min_connections is None else min_connections, max_connections
+        )
+        logging.info('Opening a pool of up to %s PostgreSQL connections (%s) ...',
+                     max_connections, database_config.profile)
+        _pools[database_config.profile] = ThreadedConnectionPool(
+            min_connections, max_connections, **database_config.connection
+        )
+    return _pools[database_config.profile]
+
+def close_pool() -> None:
+    """Close every connection of every open pool."""
+    for pool in _pools.values():
+        pool.closeall()
+    _pools.clear()
+
+def release(conn) -> None:
+    """
+    Hand a connection back to its pool, or close it when it was not pooled.
+
+    Args:
+        conn (psycopg2.extensions.connection): A connection returned by connect().
+    """
+    if conn is None:
+        return
+    for pool in _pools.values():
+        try:
+            pool.putconn(conn)
+            return
+        except PoolError:
+            # Not from this pool
+            continue
+    conn.close()
+
+def connect(profile: Optional[str] = None):
+    """
+    Connect to a PostgreSQL database, through the pool when one is open.
+
+    Args:
+        profile (str): Profile of database.ini. Defaults to the active profile.
     
     Returns:
         psycopg2.extensions.connection: A connection to the PostgreSQL database.
     """
     conn = None
     try:
-        params = config()
-        logging.info('Connecting to PostgreSQL database ...')
-        conn = psycopg2.connect(**params)
+        database_config = load_config(profile)
+        if database_config.profile in _pools:
+            conn = _pools[database_config.profile].getconn()
+        else:
+            logging.info('Connecting to PostgreSQL database (%s) ...', database_config.profile)
+            conn = psycopg2.connect(**database_config.connection)
     except (psycopg2.Error, psycopg2.DatabaseError):
         logging.critical(
             "A critical errored occurred.", exc_info=True
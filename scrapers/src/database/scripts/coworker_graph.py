@@ -0,0 +1,177 @@
+"""
+Builds the co-worker graph: who overlapped with whom at the same employer.
+
+Two users are linked at a canonical company when their positions there
+overlap in time. Each link is a row (user_a, user_b, company_id, overlap_days)
+of coworker_edges (migrations/0009_coworker_edges.sql), with user_a < user_b.
+A self-join of work_experience on company_id and period && period compares
+every pair of positions at a company, which is quadratic in its headcount and
+times out on large employers. Instead the periods are streamed in company
+order and each company is joined with a sweep line:
+
+    - the positions of each user at the company are merged into disjoint
+      spans, so a promotion does not count the same days twice;
+    - the spans are visited by start date while a heap holds the spans still
+      running, keyed by their end. At each start the spans that have ended are
+      popped, and every span left in the heap overlaps the new one.
+
+That is O(n log n + k) per company for n spans and k overlapping pairs.
+Current positions run up to the as-of date. The edges of each batch of
+companies replace the previous ones in a single transaction, so readers
+never see a half-built company.
+
+Usage:
+    >>> job = CoworkerGraphJob(jobs=4)
+    >>> job.run()
+
+    $ python -m scrapers.src.database.scripts.coworker_graph --jobs 4
+"""
+import argparse
+import heapq
+import logging
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from itertools import chain, groupby, islice
+from operator import itemgetter
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .database_manager import CoworkerGraphDatabaseManager
+
+logging.basicConfig(level=logging.INFO, filename="log.log", filemode="w",
+                    format="%(asctime)s - %(levelname)s - %(message)s")
+
+class Span(NamedTuple):
+    start: date
+    end: date  # Exclusive
+    user_id: int
+
+def merge_spans(periods: Iterable[Tuple[int, date, date]]) -> List[Span]:
+    """
+    Merge the periods of each user into disjoint spans.
+
+    Args:
+        periods (iterable): (user_id, start, end) tuples, end exclusive.
+
+    Returns:
+        list: The spans, ordered by user and start.
+    """
+    spans = []
+    for user_id, start, end in sorted(periods):
+        if spans and spans[-1].user_id == user_id and start <= spans[-1].end:
+            if end > spans[-1].end:
+                spans[-1] = spans[-1]._replace(end=end)
+        else:
+            spans.append(Span(start, end, user_id))
+    return spans
+
+def sweep_overlaps(spans: Iterable[Span]) -> Iterator[Tuple[int, int, int]]:
+    """
+    Yield every pair of overlapping spans of two different users.
+
+    Args:
+        spans (iterable): Spans of one company, disjoint per user (see merge_spans).
+
+    Yields:
+        tuple: (user_a, user_b, overlap_days), with user_a < user_b.
+    """
+    running = []  # Heap of (end, user_id)
+    for start, end, user_id in sorted(spans):
+        while running and running[0][0] <= start:
+            heapq.heappop(running)
+        # Whatever is left ends after this start, and started before it
+        for other_end, other_user_id in running:
+            if other_user_id != user_id:
+                yield (min(user_id, other_user_id), max(user_id, other_user_id),
+                       (min(end, other_end) - start).days)
+        heapq.heappush(running, (end, user_id))
+
+def company_edges(company_id: int, periods: List[Tuple[int, date, date]]) -> List[Tuple[int, int, int, int]]:
+    """
+    Build the co-worker edges of one company.
+
+    Args:
+        company_id (int): The canonical company.
+        periods (list): (user_id, start, end) of every position there, end exclusive.
+
+    Returns:
+        list: (user_a, user_b, company_id, overlap_days) tuples, one per pair of users.
+    """
+    overlap_days = defaultdict(int)
+    for user_a, user_b, days in sweep_overlaps(merge_spans(periods)):
+        overlap_days[(user_a, user_b)] += days
+    return [(user_a, user_b, company_id, days) for (user_a, user_b), days in overlap_days.items()]
+
+class CoworkerGraphJob:
+    """
+    Rebuilds coworker_edges from the work experience periods.
+
+    Companies are processed batch_size at a time; with jobs > 1 the companies
+    of a batch are swept in worker processes.
+    """
+    def __init__(self, graph_db_manager: Optional[CoworkerGraphDatabaseManager] = None, jobs: int = 1,
+                 batch_size: int = 500, chunk_size: int = 10_000, as_of: Optional[date] = None) -> None:
+        self.graph_db_manager = graph_db_manager or CoworkerGraphDatabaseManager()
+        self.jobs = jobs
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        self.as_of = as_of or date.today()
+
+    def _company_periods(self) -> Iterator[Tuple[int, List[Tuple[int, date, date]]]]:
+        # Rows arrive ordered by company, so one company is in memory at a time
+        rows = chain.from_iterable(
+            self.graph_db_manager.get_company_periods(self.as_of + timedelta(days=1), self.chunk_size)
+        )
+        for company_id, company_rows in groupby(rows, key=itemgetter(0)):
+            yield company_id, [row[1:] for row in company_rows]
+
+    def _write_batch(self, batch: List[Tuple[int, List]], edge_lists: Iterable[List[Tuple]]) -> int:
+        edges = list(chain.from_iterable(edge_lists))
+        self.graph_db_manager.replace_edges([company_id for company_id, _ in batch], edges)
+        return len(edges)
+
+    def run(self) -> int:
+        """
+        Run the rebuild.
+
+        Returns:
+            int: Number of edges written.
+        """
+        companies = self._company_periods()
+        batches = iter(lambda: list(islice(companies, self.batch_size)), [])
+
+        edge_count = company_count = 0
+        if self.jobs > 1:
+            with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                for batch in batches:
+                    edge_lists = executor.map(
+                        company_edges, *zip(*batch), chunksize=max(1, len(batch) // (self.jobs * 4))
+                    )
+                    edge_count += self._write_batch(batch, edge_lists)
+                    company_count += len(batch)
+        else:
+            for batch in batches:
+                edge_count += self._write_batch(batch, (company_edges(*company) for company in batch))
+                company_count += len(batch)
+
+        pruned = self.graph_db_manager.prune_edges()
+        logging.info(
+            "Wrote %s co-worker edges for %s companies as of %s, pruned %s stale edges",
+            edge_count, company_count, self.as_of, pruned
+        )
+        return edge_count
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the co-worker overlap graph.")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Worker count.")
+    parser.add_argument("--batch-size", type=int, default=500,
+                        help="Companies whose edges are replaced per transaction.")
+    parser.add_argument("--as-of", type=date.fromisoformat, default=None,
+                        help="YYYY-MM-DD end of the current positions (default today).")
+    args = parser.parse_args()
+
+    edge_count = CoworkerGraphJob(jobs=args.jobs, batch_size=args.batch_size, as_of=args.as_of).run()
+    print(f"Wrote {edge_count} co-worker edges")
+
+if __name__ == "__main__":
+    main()
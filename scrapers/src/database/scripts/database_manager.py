@@ -10,16 +10,76 @@ and logging events related to database interactions.
 """
 import logging
 import csv
+import io
+import json
+import re
 import time
-from typing import Union, Optional, Tuple, List, Dict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Union, Optional, Tuple, List, Dict, Iterator, NamedTuple
 import psycopg2
-import pandas as pd
-from .connect_to_db import connect
+from psycopg2.extras import execute_values
+from .config.config import load_config
+from .connect_to_db import connect, release
+from ...monitoring.tracing import span
 
 # Configure the logging system
 logging.basicConfig(level=logging.INFO, filename="log.log", filemode="w",
                     format="%(asctime)s - %(levelname)s - %(message)s")
 
+# A SELECT (or WITH ... SELECT) that neither writes nor locks rows
+_READ_ONLY_QUERY = re.compile(r"^\s*(SELECT|WITH)\b", re.IGNORECASE)
+_WRITING_QUERY = re.compile(
+    r"\b(INSERT|UPDATE|DELETE|MERGE|FOR\s+(NO\s+KEY\s+)?UPDATE|FOR\s+(KEY\s+)?SHARE|NEXTVAL|SETVAL)\b",
+    re.IGNORECASE
+)
+
+def is_read_only_query(query: str) -> bool:
+    """Return True for queries that a read replica can answer."""
+    return bool(_READ_ONLY_QUERY.match(query)) and not _WRITING_QUERY.search(query)
+
+class RoutingPolicy(NamedTuple):
+    """
+    Where a DatabaseManager sends its queries: writes to the primary profile,
+    read-only queries to the replica profile when there is one.
+    """
+    primary: Optional[str] = None  # The active profile when None
+    replica: Optional[str] = None  # No routing when None
+    replica_retry_seconds: float = 60.0  # How long to read from the primary after the replica failed
+
+    @classmethod
+    def from_config(cls) -> "RoutingPolicy":
+        """The read_replica of the active profile of database.ini, if it sets one."""
+        return cls(replica=load_config().read_replica)
+
+# The ProfileWriteSession of the running code, if any
+_write_session: ContextVar[Optional["ProfileWriteSession"]] = ContextVar("write_session", default=None)
+
+class ProfileWriteSession:
+    """
+    Pins reads to the primary while a profile is written, so that the reads of
+    a scrape see its own writes instead of a lagging replica.
+
+    Example:
+        >>> with ProfileWriteSession():
+        ...     database_manager.execute_query("INSERT ...")
+        ...     database_manager.execute_query("SELECT ...", fetch="ALL")  # Primary
+    """
+    def __init__(self) -> None:
+        self._token = None
+
+    def __enter__(self) -> "ProfileWriteSession":
+        self._token = _write_session.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        _write_session.reset(self._token)
+
+    @staticmethod
+    def active() -> bool:
+        """Return True inside a ProfileWriteSession."""
+        return _write_session.get() is not None
+
 class DatabaseManager:
     """
     Database Manager provides functionality for managing database connections, 
@@ -31,15 +91,29 @@ class DatabaseManager:
 
     Attributes:
         conn: A psycopg2 connection object representing the database connection.
+        routing: The RoutingPolicy of the manager. Defaults to the read_replica
+            setting of the active profile.
+        replica_conn: Connection to the replica, opened by the first routed read.
 
     Methods:
         __init__(): Initializes a DatabaseManager instance and establishes a database connection.
         check_database_connection(): Checks the database connection 
             and re-establishes it if necessary.
+        read_connection(): Returns the connection for read-only queries.
+        iter_query(query, params=None, chunk_size=5000): Streams the rows of a
+            read-only query through a server-side cursor; iter_dataframes and
+            iter_record_arrays stream them as pandas or NumPy chunks.
         execute_query(query, params=None, fetch=None): Executes a SQL query with optional parameters
             and fetches the result based on the specified fetch mode.
+        transaction(operation): Opens a traced transaction on the primary, for bulk writes.
+        close(): Hands the connection back to the pool, or closes it.
     """
-    def __init__(self):
+    def __init__(self, routing: Optional[RoutingPolicy] = None):
+        self.routing = routing or RoutingPolicy.from_config()
+        self.replica_conn = None
+        self._replica_retry_at = 0.0
+        # Numbers the named cursors of iter_query
+        self._cursor_count = 0
         # Initialize connction to None
         self.conn = None
         # Establish connection with database
@@ -70,7 +144,7 @@ class DatabaseManager:
                 # If the database connection is closed or doesn't exist
                 if self.conn is None or self.conn.closed != 0:
                     # Re-establish the connection
-                    self.conn = connect()
+                    self.conn = connect(self.routing.primary)
                     logging.info("Database connection re-established.")
 
                 else:
@@ -109,6 +183,39 @@ class DatabaseManager:
         logging.critical("Maximum retries exceeded. Unable to establish database connection.")
         raise RuntimeError("Maximum retries exceeded. Unable to establish database connection.")
 
+    def read_connection(self):
+        """
+        Return the connection for read-only queries.
+
+        That is the replica of the routing policy, except inside a
+        ProfileWriteSession, without a replica, or for replica_retry_seconds
+        after the replica could not be reached; then it is the primary.
+
+        Returns:
+            psycopg2.extensions.connection: The replica or primary connection.
+        """
+        if (self.routing.replica is None or ProfileWriteSession.active()
+                or time.monotonic() < self._replica_retry_at):
+            return self.check_database_connection()
+
+        if self.replica_conn is None or self.replica_conn.closed != 0:
+            self.replica_conn = connect(self.routing.replica)
+            if self.replica_conn is None:
+                logging.warning(
+                    "Replica %s unreachable, reading from the primary for %s s",
+                    self.routing.replica, self.routing.replica_retry_seconds
+                )
+                self._replica_retry_at = time.monotonic() + self.routing.replica_retry_seconds
+                return self.check_database_connection()
+        return self.replica_conn
+
+    def close(self) -> None:
+        """Hand the connections back to the pool (see connect_to_db.open_pool), or close them."""
+        release(self.conn)
+        release(self.replica_conn)
+        self.conn = None
+        self.replica_conn = None
+
     def execute_query(self, query: str, params: Optional[Union[Tuple, None]] = None,
                       fetch: Optional[str] = None) -> Union[str, List, None]:
         """
@@ -120,6 +227,8 @@ class DatabaseManager:
                 Optional parameters to be passed with the query. Defaults to None.
             fetch (Optional[str]): 
                 Specify whether to fetch 'ALL' results or 'ONE' result. Defaults to None.
+                Read-only queries fetching 'ALL' go to read_connection(), the replica
+                when the routing policy has one.
         
         Returns:
             Union[str, list, None]: The fetched result based on the fetch parameter.
@@ -145,20 +254,24 @@ class DatabaseManager:
             >>> params = ("value",)
             >>> db_manager.execute_query(delete_query, params)
         """
+        # Read-only fetches may go to the replica, everything else to the primary
+        if fetch == 'ALL' and is_read_only_query(query):
+            conn = self.read_connection()
+        else:
+            conn = self.check_database_connection()
+        route = "replica" if conn is self.replica_conn else "primary"
+
         try:
             # Establish a database connection and create a cursor
-            with self.conn, self.conn.cursor() as cursor:
-                # Ensure the database connection is valid
-                self.check_database_connection()
+            with span("db.query", **{"db.system": "postgresql", "db.statement": query, "db.route": route}), \
+                    conn, conn.cursor() as cursor:
                 # Set encoding to UTF-8
                 cursor.execute("SET client_encoding = 'UTF8';")
                 # Execute the query with optional parameters
-                if params is None:
-                    cursor.execute(query)
                 cursor.execute(query, params)
                 # Log the executed query and parameters
                 logging_message = (
-                    f"Executed query: {query} with parameters: {params}"
+                    f"Executed query: {query} with parameters: {params} on the {route}"
                 )
                 logging.info(logging_message)
                 # Fetch the result depending on specified amount
@@ -170,7 +283,7 @@ class DatabaseManager:
                     result = None
 
                 # Commit the transaction
-                self.conn.commit()
+                conn.commit()
 
                 return result
 
@@ -182,7 +295,7 @@ class DatabaseManager:
             )
             logging.critical(error_message)
             # Roll back the transaction
-            self.conn.rollback()
+            conn.rollback()
             raise
         except Exception as error:
             # Log any other general errors
@@ -192,8 +305,142 @@ class DatabaseManager:
             )
             logging.critical(error_message)
             # Roll back the transaction
-            self.conn.rollback()
+            conn.rollback()
+            raise
+
+    @contextmanager
+    def transaction(self, operation: str) -> Iterator:
+        """
+        Open a cursor in a transaction on the primary, traced as a db.<operation> span.
+
+        The transaction commits when the block exits and rolls back if it
+        raises. Bulk writes (execute_values, COPY) use it instead of
+        execute_query, so they still show up in the trace.
+
+        Args:
+            operation (str): Name of the write, e.g. "copy_chunk".
+
+        Yields:
+            psycopg2.extensions.cursor: The cursor of the transaction.
+        """
+        with span(f"db.{operation}", **{"db.system": "postgresql", "db.operation": operation}), \
+                self.conn, self.conn.cursor() as cursor:
+            yield cursor
+
+    def iter_query(self, query: str, params: Optional[Tuple] = None,
+                   chunk_size: int = 5000) -> Iterator[Tuple[List[str], List[Tuple]]]:
+        """
+        Stream the rows of a read-only query in chunks, through a named
+        (server-side) cursor, so memory stays flat however many rows match.
+
+        The query runs on read_connection(). The cursor is WITH HOLD, so other
+        queries may commit on the same connection while the rows are consumed.
+
+        Args:
+            query (str): A SELECT (or WITH ... SELECT) query.
+            params (Optional[tuple]): Parameters of the query.
+            chunk_size (int): Rows fetched from the server per round-trip.
+
+        Yields:
+            tuple: The column names and a list of at most ``chunk_size`` rows.
+
+        Raises:
+            ValueError: If the query is not read-only.
+
+        Example:
+            >>> for columns, rows in db_manager.iter_query("SELECT * FROM work_experience"):
+            ...     process(rows)
+        """
+        if not is_read_only_query(query):
+            raise ValueError(f"iter_query only streams read-only queries, got: {query}")
+
+        conn = self.read_connection()
+        self._cursor_count += 1
+        cursor = conn.cursor(name=f"iter_query_{id(self)}_{self._cursor_count}", withhold=True)
+        try:
+            with span("db.iter_query", **{"db.system": "postgresql", "db.statement": query}):
+                cursor.itersize = chunk_size
+                cursor.execute(query, params)
+                columns = [column[0] for column in cursor.description]
+                while True:
+                    rows = cursor.fetchmany(chunk_size)
+                    if not rows:
+                        break
+                    yield columns, rows
+
+        except psycopg2.Error as pg_error:
+            logging.critical("Error streaming query: %s with parameters: %s. psycopg2 Error: %s",
+                             query, params, pg_error)
+            conn.rollback()
             raise
+        finally:
+            # Also runs when the consumer stops early
+            if not conn.closed:
+                try:
+                    cursor.close()
+                    conn.commit()
+                except psycopg2.Error:
+                    conn.rollback()
+
+    def iter_dataframes(self, query: str, params: Optional[Tuple] = None, chunk_size: int = 5000):
+        """
+        Stream a read-only query as pandas DataFrames of at most ``chunk_size`` rows.
+
+        Yields:
+            pandas.DataFrame: One chunk of rows, with the query's column names.
+        """
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
+        for columns, rows in self.iter_query(query, params, chunk_size):
+            yield pd.DataFrame.from_records(rows, columns=columns)
+
+    def iter_record_arrays(self, query: str, params: Optional[Tuple] = None, chunk_size: int = 5000,
+                           dtype=None):
+        """
+        Stream a read-only query as NumPy record arrays of at most ``chunk_size`` rows.
+
+        Args:
+            dtype: Optional NumPy dtype of the records, e.g.
+                [("user_id", "i4"), ("start_date", "M8[D]")]. Inferred per chunk when None.
+
+        Yields:
+            numpy.recarray: One chunk of rows, with fields named after the columns.
+        """
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        for columns, rows in self.iter_query(query, params, chunk_size):
+            if dtype is None:
+                yield np.rec.fromrecords(rows, names=columns)
+            else:
+                yield np.rec.fromrecords(rows, dtype=dtype)
+
+class SharedDatabaseManager:
+    """
+    Class attribute holding one database manager, created on first access.
+
+    A manager instantiated in a class body connects to the database as soon as
+    the module is imported. This descriptor defers the connection until the
+    attribute is first read, then shares the instance like a plain class attribute.
+
+    Usage:
+        >>> class LinkedInBot(BaseManager):
+        ...     database_manager = SharedDatabaseManager(DatabaseManager)
+    """
+    def __init__(self, manager_class: type) -> None:
+        self.manager_class = manager_class
+        self.instance = None
+
+    def __get__(self, obj, owner=None):
+        if self.instance is None:
+            self.instance = self.manager_class()
+        return self.instance
+
+class ContactInfo(NamedTuple):
+    """Contact details parsed from a profile's contact info overlay. Field names match users columns."""
+    phone_number: Optional[str] = None
+    email: Optional[str] = None
+    address: Optional[str] = None
+    website: Optional[str] = None
 
 class LinkedInDatabaseManager(DatabaseManager):
     def __init__(self):
@@ -308,9 +555,10 @@ class LinkedInDatabaseManager(DatabaseManager):
         for profile_url in profile_urls:
             # Check to see if the url already exists in the database
             query = (
-                "SELECT COUNT(*) FROM users WHERE profile_url = %s"
+                "SELECT (SELECT COUNT(*) FROM users WHERE profile_url = %s) + "
+                "(SELECT COUNT(*) FROM user_merges WHERE merged_profile_url = %s)"
             )
-            params = (profile_url,)
+            params = (profile_url, profile_url)
             fetch = "ONE"
             result = self.execute_query(
                 query=query,
@@ -321,7 +569,7 @@ class LinkedInDatabaseManager(DatabaseManager):
             if result == 0:
                 logging.info("Adding %s to the database", profile_url)
                 query = (
-                    "INSERT INTO users (profile_url) VALUES (%s)"
+                    "INSERT INTO users (profile_url, sources) VALUES (%s, ARRAY['linkedin'])"
                 )
                 params = (profile_url,)
                 self.execute_query(
@@ -332,6 +580,25 @@ class LinkedInDatabaseManager(DatabaseManager):
             else:
                 logging.warning("%s already in database. Moving to next profile", profile_url)
 
+    @staticmethod
+    def _date_columns(dates) -> Tuple:
+        """
+        Split a parsed date range into the date columns of work_experience and education.
+
+        Args:
+            dates (list): [start_date, end_date] from ExperienceManager.parse_date_range,
+                a shorter list when LinkedIn showed a single date, or None.
+
+        Returns:
+            tuple: (start_date, end_date, start_precision, end_precision, is_current).
+        """
+        # A single date is the end date, as in EducationManager._nullify_empty_dates
+        start_date, end_date = ([None, None] + list(dates or ())[:2])[-2:]
+        return (
+            start_date, end_date, getattr(dates, "start_precision", None),
+            getattr(dates, "end_precision", None), getattr(dates, "is_current", False)
+        )
+
     def update_experiences_in_database(
             self, user_id: str,
             zipped_list: Tuple[
@@ -350,7 +617,7 @@ class LinkedInDatabaseManager(DatabaseManager):
                 for i, job_title in enumerate(job_titles):
                     work_description = work_descriptions[i]
                     work_description = '' if work_description is None else work_description
-                    start_date, end_date = date_ranges[i]
+                    start_date, end_date, start_precision, end_precision, is_current = self._date_columns(date_ranges[i])
                     location = locations_of_work
                     # Check if the same experience already exists in the database for the given user_id
                     # Non-empty work_description
@@ -358,7 +625,7 @@ class LinkedInDatabaseManager(DatabaseManager):
                         query = (
                             "SELECT COUNT(*) FROM work_experience WHERE user_id = %s AND company = %s "
                             "AND job_title IS NOT DISTINCT FROM %s AND work_description IS NOT DISTINCT FROM %s "
-                            "AND start_date IS NOT DISTINCT FROM %s AND end_date IS NOT DISTINCT FROM %s"
+                            "AND start_date IS NOT DISTINCT FROM %s AND end_date IS NOT DISTINCT FROM %s "
                             "AND location_of_job IS NOT DISTINCT FROM %s"
                         )
                         params = (user_id, company, job_title, work_description, start_date, end_date, location)
@@ -374,10 +641,11 @@ class LinkedInDatabaseManager(DatabaseManager):
                         if count == 0:
                             query = (
                                 "INSERT INTO work_experience "
-                                "(user_id, company, job_title, work_description, start_date, end_date, location_of_job) "
-                                "VALUES (%s, %s, %s, %s, %s, %s, %s)"
+                                "(user_id, company, job_title, work_description, start_date, end_date, location_of_job, "
+                                "start_precision, end_precision, is_current) "
+                                "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"
                             )
-                            params = (user_id, company, job_title, work_description, start_date, end_date, location)
+                            params = (user_id, company, job_title, work_description, start_date, end_date, location, start_precision, end_precision, is_current)
                             logging.info("Attempting to execute the query: %s with params: %s ", query, params)
                             self.execute_query(
                                 query=query,
@@ -402,10 +670,11 @@ class LinkedInDatabaseManager(DatabaseManager):
                         if count == 0:
                             query = (
                                 "INSERT INTO work_experience "
-                                "(user_id, company, job_title, start_date, end_date, location_of_job) "
-                                "VALUES (%s, %s, %s, %s, %s, %s)"
+                                "(user_id, company, job_title, start_date, end_date, location_of_job, "
+                                "start_precision, end_precision, is_current) "
+                                "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)"
                             )
-                            params = (user_id, company, job_title, start_date, end_date, location)
+                            params = (user_id, company, job_title, start_date, end_date, location, start_precision, end_precision, is_current)
                             logging.info("Attempting to execute the query: %s with params: %s ", query, params)
                             self.execute_query(
                                 query=query,
@@ -419,7 +688,7 @@ class LinkedInDatabaseManager(DatabaseManager):
                 job_title = job_titles
                 work_description = work_descriptions if isinstance(work_descriptions, str) else None
                 work_description = '' if work_description is None else work_description
-                start_date, end_date = date_ranges if date_ranges is not None else (None, None)
+                start_date, end_date, start_precision, end_precision, is_current = self._date_columns(date_ranges)
                 location = locations_of_work
                 print(start_date, end_date)
                 # Check if the same experience already exists in the database for the given user_id
@@ -437,10 +706,11 @@ class LinkedInDatabaseManager(DatabaseManager):
                     if count == 0:
                         query = (
                             "INSERT INTO work_experience "
-                            "(user_id, company, job_title, work_description, start_date, end_date, location_of_job) "
-                            "VALUES (%s, %s, %s, %s, %s, %s, %s)"
+                            "(user_id, company, job_title, work_description, start_date, end_date, location_of_job, "
+                            "start_precision, end_precision, is_current) "
+                            "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"
                         )
-                        params = (user_id, company, job_title, work_description, start_date, end_date, location)
+                        params = (user_id, company, job_title, work_description, start_date, end_date, location, start_precision, end_precision, is_current)
                         logging.info("Attempting to execute the query: %s with params: %s ", query, params)
                         self.execute_query(
                             query=query,
@@ -463,10 +733,11 @@ class LinkedInDatabaseManager(DatabaseManager):
                     count = self.execute_query(query=query, params=params, fetch=fetch)[0]
                     if count == 0:
                         query = (
-                            "INSERT INTO work_experience (user_id, company, job_title, start_date, end_date, location_of_job) "
-                            "VALUES (%s, %s, %s, %s, %s, %s)"
+                            "INSERT INTO work_experience (user_id, company, job_title, start_date, end_date, location_of_job, "
+                            "start_precision, end_precision, is_current) "
+                            "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)"
                         )
-                        params = (user_id, company, job_title, start_date, end_date, location)
+                        params = (user_id, company, job_title, start_date, end_date, location, start_precision, end_precision, is_current)
                         logging.info("Attempting to execute the query: %s with params: %s ", query, params)
                         self.execute_query(
                             query=query,
@@ -490,8 +761,7 @@ class LinkedInDatabaseManager(DatabaseManager):
         # Check if the education already exists in the database
         for school_name, degree, dates, grade, description_of_education, activities_and_societies in education_zip:
             print("School name: %s. Degree: %s. Dates: %s. Grade: %s. Description of education: %s. Activities and societies: %s" % (school_name, degree, dates, grade, description_of_education, activities_and_societies))
-            start_date = dates[0]
-            end_date = dates[1]
+            start_date, end_date, start_precision, end_precision, is_current = self._date_columns(dates)
 
             print("DATES: ", start_date, end_date)
             logging.debug(f"Checking education for school: {school_name}, degree: {degree}, user_id: {user_id}")
@@ -506,10 +776,11 @@ class LinkedInDatabaseManager(DatabaseManager):
             logging.debug(f"Education count: {count}")
             if count == 0:
                 query = (
-                    "INSERT INTO education (user_id, degree, school_name, start_date, end_date, description_of_education, activities_and_societies, grade) "
-                    "VALUES (%s, %s, %s, %s, %s, %s, %s, %s)"
+                    "INSERT INTO education (user_id, degree, school_name, start_date, end_date, description_of_education, activities_and_societies, grade, "
+                    "start_precision, end_precision, is_current) "
+                    "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"
                 )
-                params = (user_id, degree, school_name, start_date, end_date, description_of_education, activities_and_societies, grade)
+                params = (user_id, degree, school_name, start_date, end_date, description_of_education, activities_and_societies, grade, start_precision, end_precision, is_current)
                 logging.info("Attempting to execute the query: %s with params: %s ", query, params)
                 self.execute_query(
                     query=query,
@@ -518,6 +789,43 @@ class LinkedInDatabaseManager(DatabaseManager):
             else:
                 logging.info("Education already exists for user_id: %s, degree: %s, school_name: %s. Moving on to the next query.", user_id, degree, school_name)
 
+    def update_contact_info(self, contact_info: ContactInfo, user_id: int) -> List[str]:
+        """
+        Write a user's contact info, touching only the columns that changed.
+
+        The current row is read once and compared with the parsed contact
+        info; at most one UPDATE is issued.
+
+        Args:
+            contact_info (ContactInfo): The freshly parsed contact info.
+            user_id (int): The unique identifier of the user.
+
+        Returns:
+            list: The names of the updated columns.
+        """
+        query = (
+            f"SELECT {', '.join(ContactInfo._fields)} FROM users WHERE user_id = %s"
+        )
+        current_row = self.execute_query(query=query, params=(user_id,), fetch="ONE")
+        if current_row is None:
+            logging.warning("No user with user_id %s, contact info not saved", user_id)
+            return []
+
+        changed_columns = {
+            column: value
+            for column, value, current_value in zip(ContactInfo._fields, contact_info, current_row)
+            if value != current_value
+        }
+        if not changed_columns:
+            logging.info("Contact info of user %s is unchanged", user_id)
+            return []
+
+        assignments = ", ".join(f"{column} = %s" for column in changed_columns)
+        query = f"UPDATE users SET {assignments} WHERE user_id = %s"
+        params = (*changed_columns.values(), user_id)
+        self.execute_query(query=query, params=params)
+        return list(changed_columns)
+
     def update_phone_in_datebase(self, phone_number, user_id):
         # Check if the phone number already exists for the user_id
         query = (
@@ -626,6 +934,150 @@ class LinkedInDatabaseManager(DatabaseManager):
                 params=params
             )
 
+    def search_work_experience(self, search_text: str, limit: int = 50) -> List[Tuple]:
+        """
+        Ranked full-text search over job titles, companies and work descriptions.
+
+        Matches in the job title rank above matches in the company name, which
+        rank above matches in the description.
+
+        Args:
+            search_text (str): Web-search style query, e.g. '"data engineer" -intern'.
+            limit (int): Maximum number of rows to return.
+
+        Returns:
+            list: (user_id, users_name, job_title, company, rank) tuples, best match first.
+        """
+        query = (
+            "SELECT w.user_id, u.users_name, w.job_title, w.company, "
+            "ts_rank_cd(w.search_vector, q) AS rank "
+            "FROM work_experience w "
+            "JOIN users u ON u.user_id = w.user_id, "
+            "websearch_to_tsquery('english', %s) q "
+            "WHERE w.search_vector @@ q "
+            "ORDER BY rank DESC LIMIT %s"
+        )
+        return self.execute_query(query=query, params=(search_text, limit), fetch="ALL")
+
+    def search_education(self, search_text: str, limit: int = 50) -> List[Tuple]:
+        """
+        Ranked full-text search over degrees, schools, descriptions and activities.
+
+        Args:
+            search_text (str): Web-search style query.
+            limit (int): Maximum number of rows to return.
+
+        Returns:
+            list: (user_id, users_name, degree, school_name, rank) tuples, best match first.
+        """
+        query = (
+            "SELECT e.user_id, u.users_name, e.degree, e.school_name, "
+            "ts_rank_cd(e.search_vector, q) AS rank "
+            "FROM education e "
+            "JOIN users u ON u.user_id = e.user_id, "
+            "websearch_to_tsquery('english', %s) q "
+            "WHERE e.search_vector @@ q "
+            "ORDER BY rank DESC LIMIT %s"
+        )
+        return self.execute_query(query=query, params=(search_text, limit), fetch="ALL")
+
+    def search_profiles(self, search_text: str, limit: int = 50) -> List[Tuple]:
+        """
+        Rank users by how well their work experience and education match a query.
+
+        Args:
+            search_text (str): Web-search style query.
+            limit (int): Maximum number of users to return.
+
+        Returns:
+            list: (user_id, users_name, rank) tuples, best match first.
+        """
+        query = (
+            "WITH q AS (SELECT websearch_to_tsquery('english', %s) AS query), "
+            "matches AS ("
+            "    SELECT w.user_id, ts_rank_cd(w.search_vector, q.query) AS rank "
+            "    FROM work_experience w, q WHERE w.search_vector @@ q.query "
+            "    UNION ALL "
+            "    SELECT e.user_id, ts_rank_cd(e.search_vector, q.query) AS rank "
+            "    FROM education e, q WHERE e.search_vector @@ q.query"
+            ") "
+            "SELECT m.user_id, u.users_name, SUM(m.rank) AS rank "
+            "FROM matches m JOIN users u ON u.user_id = m.user_id "
+            "GROUP BY m.user_id, u.users_name "
+            "ORDER BY rank DESC LIMIT %s"
+        )
+        return self.execute_query(query=query, params=(search_text, limit), fetch="ALL")
+
+    def find_similar_companies(
+            self, company_name: str, limit: int = 10,
+            similarity_threshold: float = 0.3) -> List[Tuple[str, float]]:
+        """
+        Fuzzy company-name lookup backed by the trigram index.
+
+        Args:
+            company_name (str): The (possibly misspelled) company name.
+            limit (int): Maximum number of companies to return.
+            similarity_threshold (float): Minimum trigram similarity, between 0 and 1.
+
+        Returns:
+            list: (company, similarity) tuples, most similar first.
+        """
+        # The % operator uses the index and filters on pg_trgm.similarity_threshold
+        query = (
+            f"SET LOCAL pg_trgm.similarity_threshold = {float(similarity_threshold)}; "
+            "SELECT company, MAX(similarity(company, %s)) AS score "
+            "FROM work_experience WHERE company %% %s "
+            "GROUP BY company ORDER BY score DESC LIMIT %s"
+        )
+        params = (company_name, company_name, limit)
+        return self.execute_query(query=query, params=params, fetch="ALL")
+
+    def find_employees_during(self, company_id: int, start_date: str,
+                              end_date: Optional[str] = None) -> List[Tuple]:
+        """
+        Who worked at a company at any time between two dates, e.g. during 2018.
+
+        An overlap lookup on the period ranges (migrations/0008_employment_periods.sql),
+        served by the (company_id, period) GiST index. A position shown as "2017 - 2018"
+        covers the whole of 2018, and a current position runs on indefinitely.
+
+        Args:
+            company_id (int): The canonical company (companies.company_id).
+            start_date (str): First day of the window, YYYY-MM-DD or a date.
+            end_date (str): Last day of the window, included. None for no end.
+
+        Returns:
+            list: (user_id, users_name, job_title, start_date, end_date, is_current) tuples,
+                earliest start first.
+        """
+        query = (
+            "SELECT w.user_id, u.users_name, w.job_title, w.start_date, w.end_date, w.is_current "
+            "FROM work_experience w JOIN users u ON u.user_id = w.user_id "
+            "WHERE w.company_id = %s AND w.period && daterange(%s, %s, '[]') "
+            "ORDER BY w.start_date, w.experience_id"
+        )
+        return self.execute_query(query=query, params=(company_id, start_date, end_date), fetch="ALL")
+
+    def find_students_during(self, school_name: str, start_date: str,
+                             end_date: Optional[str] = None) -> List[Tuple]:
+        """
+        Who attended a school at any time between two dates.
+
+        Args:
+            school_name (str): The school, as scraped.
+            start_date (str): First day of the window, YYYY-MM-DD or a date.
+            end_date (str): Last day of the window, included. None for no end.
+
+        Returns:
+            list: (user_id, users_name, degree, start_date, end_date) tuples, earliest start first.
+        """
+        query = (
+            "SELECT e.user_id, u.users_name, e.degree, e.start_date, e.end_date "
+            "FROM education e JOIN users u ON u.user_id = e.user_id "
+            "WHERE e.school_name = %s AND e.period && daterange(%s, %s, '[]') "
+            "ORDER BY e.start_date, e.education_id"
+        )
+        return self.execute_query(query=query, params=(school_name, start_date, end_date), fetch="ALL")
 
 
 class BotCredentialsDatabaseManager(DatabaseManager):
@@ -678,6 +1130,7 @@ class BotCredentialsDatabaseManager(DatabaseManager):
 
 
     def xlsx(self):
+        import pandas as pd  # pylint: disable=import-outside-toplevel
 
         cursor = self.conn.cursor()
         cursor.execute("SELECT tablename FROM pg_catalog.pg_tables WHERE schemaname='public';")
@@ -707,6 +1160,135 @@ class BotCredentialsDatabaseManager(DatabaseManager):
                 params=params
             )
         
+class SkillsDatabaseManager(DatabaseManager):
+    def __init__(self):
+        super().__init__()
+
+    def get_distinct_skill_names(self) -> List[str]:
+        """Return every distinct skill name in the skills table."""
+        query = (
+            "SELECT DISTINCT skill_name FROM skills WHERE skill_name IS NOT NULL"
+        )
+        result = self.execute_query(query=query, fetch="ALL")
+        return [row[0] for row in result]
+
+    def get_skill_user_pairs(self) -> List[Tuple[str, int]]:
+        """Return (skill_name, user_id) pairs used to build a skill -> users index."""
+        query = (
+            "SELECT DISTINCT skill_name, user_id FROM skills WHERE skill_name IS NOT NULL"
+        )
+        return self.execute_query(query=query, fetch="ALL")
+
+class CompanyDatabaseManager(DatabaseManager):
+    def __init__(self):
+        super().__init__()
+
+    def get_company_ids(self) -> Dict[str, int]:
+        """Return a canonical_name -> company_id map of every known company."""
+        query = "SELECT canonical_name, company_id FROM companies"
+        return dict(self.execute_query(query=query, fetch="ALL"))
+
+    def get_company_aliases(self) -> Dict[str, int]:
+        """Return an alias -> company_id map of every company alias."""
+        query = "SELECT alias, company_id FROM company_aliases"
+        return dict(self.execute_query(query=query, fetch="ALL"))
+
+    def add_company_alias(self, alias: str, company_id: int) -> None:
+        query = (
+            "INSERT INTO company_aliases (alias, company_id) VALUES (%s, %s) "
+            "ON CONFLICT (alias) DO UPDATE SET company_id = EXCLUDED.company_id"
+        )
+        self.execute_query(query=query, params=(alias, company_id))
+
+    def get_unlinked_company_names(self) -> List[Tuple[str, int]]:
+        """Return (company, row count) for raw company names that have no company_id yet."""
+        query = (
+            "SELECT company, COUNT(*) FROM work_experience "
+            "WHERE company_id IS NULL AND company IS NOT NULL "
+            "GROUP BY company"
+        )
+        return self.execute_query(query=query, fetch="ALL")
+
+    def insert_companies(self, companies: List[Tuple[str, str]]) -> Dict[str, int]:
+        """
+        Insert companies in a single statement.
+
+        Args:
+            companies (list): (canonical_name, display_name) tuples.
+
+        Returns:
+            dict: canonical_name -> company_id of the inserted (or already existing) companies.
+        """
+        if not companies:
+            return {}
+
+        query = (
+            "INSERT INTO companies (canonical_name, display_name) VALUES %s "
+            "ON CONFLICT (canonical_name) DO UPDATE SET canonical_name = EXCLUDED.canonical_name "
+            "RETURNING canonical_name, company_id"
+        )
+        with self.transaction("insert_companies") as cursor:
+            rows = execute_values(cursor, query, companies, fetch=True)
+        return dict(rows)
+
+    def link_work_experience(self, company_ids: List[Tuple[str, int]]) -> int:
+        """
+        Set work_experience.company_id for every row with one of the given raw names.
+
+        Args:
+            company_ids (list): (raw company name, company_id) tuples.
+
+        Returns:
+            int: Number of updated work_experience rows.
+        """
+        if not company_ids:
+            return 0
+
+        query = (
+            "UPDATE work_experience w SET company_id = v.company_id "
+            "FROM (VALUES %s) AS v(company, company_id) "
+            "WHERE w.company = v.company AND w.company_id IS NULL"
+        )
+        with self.transaction("link_work_experience") as cursor:
+            execute_values(cursor, query, company_ids, page_size=len(company_ids))
+            return cursor.rowcount
+
+class TitleDatabaseManager(DatabaseManager):
+    def __init__(self):
+        super().__init__()
+
+    def get_unnormalized_titles(self) -> List[str]:
+        """Return the distinct raw job titles that have not been normalized yet."""
+        query = (
+            "SELECT DISTINCT job_title FROM work_experience "
+            "WHERE normalized_title IS NULL AND job_title IS NOT NULL"
+        )
+        result = self.execute_query(query=query, fetch="ALL")
+        return [row[0] for row in result]
+
+    def update_normalized_titles(self, normalized_titles: List[Tuple[str, str, str, str]]) -> int:
+        """
+        Write normalized titles for every row with one of the given raw titles.
+
+        Args:
+            normalized_titles (list): (job_title, normalized_title, seniority, role_family) tuples.
+
+        Returns:
+            int: Number of updated work_experience rows.
+        """
+        if not normalized_titles:
+            return 0
+
+        query = (
+            "UPDATE work_experience w SET normalized_title = v.normalized_title, "
+            "seniority = v.seniority, role_family = v.role_family "
+            "FROM (VALUES %s) AS v(job_title, normalized_title, seniority, role_family) "
+            "WHERE w.job_title = v.job_title AND w.normalized_title IS NULL"
+        )
+        with self.transaction("update_normalized_titles") as cursor:
+            execute_values(cursor, query, normalized_titles, page_size=len(normalized_titles))
+            return cursor.rowcount
+
 class CookieManager(DatabaseManager):
     def __init__(self):
         super().__init__()
@@ -742,20 +1324,101 @@ class CookieManager(DatabaseManager):
         return cookie
     
 class SalaryDatabaseManager(DatabaseManager):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, routing: Optional[RoutingPolicy] = None):
+        super().__init__(routing)
 
-    def get_search_params(self):
+    def get_search_params(self, chunk_size: int = 5000) -> Iterator[Tuple[str, str]]:
+        """Yield the distinct (title, company) pairs without estimated earnings, streamed from the server."""
+        # Normalized titles collapse spelling variants into far fewer salary lookups
         query = (
-            "SELECT job_title, company FROM work_experience WHERE estimated_net_earnings IS NULL"
+            "SELECT DISTINCT COALESCE(NULLIF(normalized_title, ''), job_title), company "
+            "FROM work_experience WHERE estimated_net_earnings IS NULL"
         )
-        fetch = "ALL"
-        result = self.execute_query(
-            query=query,
-            fetch=fetch
+        for _, rows in self.iter_query(query, chunk_size=chunk_size):
+            yield from rows
+
+    def get_median_salaries(self) -> Dict[str, float]:
+        """Return the median scraped salary of every job title, keyed by the lowercased title."""
+        query = (
+            "SELECT lower(job_title), percentile_cont(0.5) WITHIN GROUP (ORDER BY salary) "
+            "FROM salaries WHERE job_title IS NOT NULL AND salary IS NOT NULL "
+            "GROUP BY lower(job_title)"
         )
-        return result
-    
+        return {title: float(salary) for title, salary in self.execute_query(query=query, fetch="ALL")}
+
+    def get_unestimated_experiences(self, chunk_size: int = 10_000) -> Iterator[List[Tuple]]:
+        """
+        Stream the work experiences without estimated earnings, in chunks.
+
+        Yields:
+            list: (experience_id, lowercased title, start_date, end_date) tuples.
+        """
+        query = (
+            "SELECT experience_id, lower(COALESCE(NULLIF(normalized_title, ''), job_title)), start_date, end_date "
+            "FROM work_experience "
+            "WHERE estimated_net_earnings IS NULL AND start_date IS NOT NULL AND job_title IS NOT NULL"
+        )
+        for _, rows in self.iter_query(query, chunk_size=chunk_size):
+            yield rows
+
+    def update_estimated_earnings(self, estimates: List[Tuple[int, float]]) -> int:
+        """
+        Write the estimated earnings of each work experience.
+
+        Args:
+            estimates (list): (experience_id, estimated_net_earnings) tuples.
+
+        Returns:
+            int: Number of updated work_experience rows.
+        """
+        if not estimates:
+            return 0
+
+        query = (
+            "UPDATE work_experience w SET estimated_net_earnings = v.earnings "
+            "FROM (VALUES %s) AS v(experience_id, earnings) "
+            "WHERE w.experience_id = v.experience_id"
+        )
+        with self.transaction("update_estimated_earnings") as cursor:
+            execute_values(cursor, query, estimates, page_size=len(estimates))
+            return cursor.rowcount
+
+class LocationDatabaseManager(DatabaseManager):
+    def __init__(self, routing: Optional[RoutingPolicy] = None):
+        super().__init__(routing)
+
+    def get_distinct_locations(self) -> List[str]:
+        """Return every distinct location of a user or a job."""
+        query = (
+            "SELECT location_of_user FROM users WHERE location_of_user IS NOT NULL "
+            "UNION SELECT location_of_job FROM work_experience WHERE location_of_job IS NOT NULL"
+        )
+        return [row[0] for row in self.execute_query(query=query, fetch="ALL")]
+
+    def update_locations(self, formatted_locations: List[Tuple[str, str]]) -> int:
+        """
+        Replace raw locations of users and jobs with their formatted form.
+
+        Args:
+            formatted_locations (list): (raw location, formatted location) tuples.
+
+        Returns:
+            int: Number of updated users and work_experience rows.
+        """
+        if not formatted_locations:
+            return 0
+
+        updated_rows = 0
+        with self.transaction("update_locations") as cursor:
+            for table, column in (("users", "location_of_user"), ("work_experience", "location_of_job")):
+                query = (
+                    f"UPDATE {table} t SET {column} = v.formatted "
+                    f"FROM (VALUES %s) AS v(raw, formatted) WHERE t.{column} = v.raw"
+                )
+                execute_values(cursor, query, formatted_locations, page_size=len(formatted_locations))
+                updated_rows += cursor.rowcount
+        return updated_rows
+
 class DukeDatabaseManager(DatabaseManager):
     def __init__(self):
         super().__init__()
@@ -771,10 +1434,12 @@ class DukeDatabaseManager(DatabaseManager):
 
             print("ENTERING QUERY ", alumni_url, email, phone, linkedin_url, name)
 
+            # Alumni that were merged into another user keep their url in user_merges
             query = (
-                "SELECT COUNT(*) FROM users WHERE alumni_url = %s"
+                "SELECT (SELECT COUNT(*) FROM users WHERE alumni_url = %s) + "
+                "(SELECT COUNT(*) FROM user_merges WHERE merged_alumni_url = %s)"
             )
-            params = (alumni_url,)
+            params = (alumni_url, alumni_url)
             fetch="ONE"
             count = self.execute_query(
                 query=query,
@@ -787,8 +1452,8 @@ class DukeDatabaseManager(DatabaseManager):
             # If the entry doesn't exist, add the information
             if count == 0:
                 query = (
-                    "INSERT INTO users (alumni_url, email, phone_number, profile_url, users_name) "
-                    "VALUES (%s, %s, %s, %s, %s)"
+                    "INSERT INTO users (alumni_url, email, phone_number, profile_url, users_name, sources) "
+                    "VALUES (%s, %s, %s, %s, %s, ARRAY['duke_alumni'])"
                 )
                 params = (alumni_url, email, phone, linkedin_url, name)
                 self.execute_query(
@@ -797,4 +1462,536 @@ class DukeDatabaseManager(DatabaseManager):
                 )
 
             else:
-                print("Data already exists for the alumni url: ", alumni_url)
\ No newline at end of file
+                print("Data already exists for the alumni url: ", alumni_url)
+
+class FreshnessDatabaseManager(DatabaseManager):
+    def __init__(self):
+        super().__init__()
+
+    def get_section_hashes(self, user_id: int) -> Dict[str, str]:
+        """Return a section -> content_hash map of the last scrape of a user."""
+        query = "SELECT section, content_hash FROM profile_section_hashes WHERE user_id = %s"
+        return dict(self.execute_query(query=query, params=(user_id,), fetch="ALL"))
+
+    def record_section_hashes(self, user_id: int, section_hashes: List[Tuple[str, str]]) -> None:
+        """
+        Record that sections of a profile were seen, counting the ones whose hash changed.
+
+        Args:
+            user_id (int): The scraped user.
+            section_hashes (list): (section, content_hash) tuples.
+        """
+        if not section_hashes:
+            return
+
+        query = (
+            "INSERT INTO profile_section_hashes AS h (user_id, section, content_hash) "
+            "VALUES %s "
+            "ON CONFLICT (user_id, section) DO UPDATE SET "
+            "content_hash = EXCLUDED.content_hash, "
+            "last_seen_at = now(), "
+            "seen_count = h.seen_count + 1, "
+            "last_changed_at = CASE WHEN h.content_hash = EXCLUDED.content_hash "
+            "    THEN h.last_changed_at ELSE now() END, "
+            "change_count = h.change_count + "
+            "    CASE WHEN h.content_hash = EXCLUDED.content_hash THEN 0 ELSE 1 END"
+        )
+        rows = [(user_id, section, content_hash) for section, content_hash in section_hashes]
+        with self.transaction("record_section_hashes") as cursor:
+            execute_values(cursor, query, rows)
+
+    def count_refreshed_today(self) -> int:
+        """Return how many previously scraped profiles were scraped again today."""
+        query = (
+            "SELECT COUNT(*) FROM profile_section_hashes "
+            "WHERE section = 'main' AND last_seen_at >= date_trunc('day', now()) "
+            "AND first_seen_at < date_trunc('day', now())"
+        )
+        return self.execute_query(query=query, fetch="ONE")[0]
+
+    def get_refresh_candidates(self, limit: int, min_age_days: int,
+                               partition: int = 0, partitions: int = 1) -> List[Tuple[int, str]]:
+        """
+        Return the scraped profiles that most need a refresh.
+
+        Profiles are ordered by days since they were last seen times their
+        smoothed past change rate, (changes + 1) / (scrapes + 2), so a profile
+        that never changes is refreshed rarely and one that changes often is
+        refreshed as soon as it is stale. Profiles scraped before hashes were
+        recorded have no history and come first.
+
+        Args:
+            limit (int): Maximum number of profiles to return.
+            min_age_days (int): Profiles seen more recently than this are skipped.
+            partition (int): This bot's partition of the users table.
+            partitions (int): Number of bots sharing the refresh.
+
+        Returns:
+            list: (user_id, profile_url) tuples, most urgent first.
+        """
+        query = (
+            "SELECT u.user_id, u.profile_url "
+            "FROM users u LEFT JOIN profile_section_hashes h ON h.user_id = u.user_id "
+            "WHERE u.users_name IS NOT NULL AND u.profile_url IS NOT NULL "
+            "AND u.user_id %% %s = %s "
+            "GROUP BY u.user_id, u.profile_url "
+            "HAVING COALESCE(MAX(h.last_seen_at), 'epoch') < now() - make_interval(days => %s) "
+            "ORDER BY "
+            "EXTRACT(EPOCH FROM now() - COALESCE(MAX(h.last_seen_at), 'epoch')) "
+            "* (COALESCE(SUM(h.change_count), 0) + 1)::float "
+            "/ (COALESCE(SUM(h.seen_count), 0) + 2) DESC "
+            "LIMIT %s"
+        )
+        params = (partitions, partition, min_age_days, limit)
+        return self.execute_query(query=query, params=params, fetch="ALL")
+
+class DeduplicationDatabaseManager(DatabaseManager):
+    """
+    Reads users for entity resolution and merges duplicates into one row.
+
+    A merge moves the child rows of the duplicates to the surviving user, fills
+    the survivor's empty columns from the duplicates, unions their sources and
+    records every merged row in user_merges.
+    """
+    # Tables whose rows belong to a user and move with a merge
+    user_tables = ("work_experience", "education", "skills")
+
+    # users columns filled from the duplicates when the survivor has no value
+    merge_columns = (
+        "users_name", "email", "location_of_user", "profile_url", "estimated_net_worth",
+        "estimated_age", "phone_number", "address", "approved", "website", "alumni_url",
+    )
+
+    def __init__(self):
+        super().__init__()
+
+    def get_resolution_candidates(self) -> List[Tuple]:
+        """
+        Return every named user.
+
+        Returns:
+            list: (user_id, users_name, location_of_user, email, phone_number,
+                profile_url, alumni_url, sources) tuples.
+        """
+        query = (
+            "SELECT user_id, users_name, location_of_user, email, phone_number, "
+            "profile_url, alumni_url, sources "
+            "FROM users WHERE users_name IS NOT NULL"
+        )
+        return self.execute_query(query=query, fetch="ALL")
+
+    def merge_users(self, surviving_user_id: int, merged_user_ids: List[int],
+                    match_score: float) -> None:
+        """
+        Merge duplicate users into one row in a single transaction.
+
+        Args:
+            surviving_user_id (int): The user that is kept.
+            merged_user_ids (list): The duplicates folded into it and deleted.
+            match_score (float): The score that linked the duplicates.
+        """
+        merged_user_ids = list(merged_user_ids)
+        coalesced = ", ".join(
+            f"(array_agg({column} ORDER BY user_id) "
+            f"FILTER (WHERE {column} IS NOT NULL))[1] AS {column}"
+            for column in self.merge_columns
+        )
+        assignments = ", ".join(
+            f"{column} = COALESCE(s.{column}, m.{column})" for column in self.merge_columns
+        )
+
+        with self.transaction("merge_users") as cursor:
+            cursor.execute(
+                "INSERT INTO user_merges (surviving_user_id, merged_user_id, "
+                "merged_profile_url, merged_alumni_url, match_score) "
+                "SELECT %s, user_id, profile_url, alumni_url, %s "
+                "FROM users WHERE user_id = ANY(%s)",
+                (surviving_user_id, match_score, merged_user_ids)
+            )
+            cursor.execute(
+                "UPDATE user_merges SET surviving_user_id = %s WHERE surviving_user_id = ANY(%s)",
+                (surviving_user_id, merged_user_ids)
+            )
+            for table in self.user_tables:
+                cursor.execute(
+                    f"UPDATE {table} SET user_id = %s WHERE user_id = ANY(%s)",
+                    (surviving_user_id, merged_user_ids)
+                )
+            # The duplicates are deleted first so alumni_url stays unique
+            cursor.execute(
+                "WITH merged AS ("
+                "    DELETE FROM users WHERE user_id = ANY(%s) RETURNING *"
+                "), m AS ("
+                f"    SELECT {coalesced}, "
+                "    array_agg(user_id ORDER BY user_id) AS user_ids, "
+                "    ARRAY(SELECT unnest(merged_from) FROM merged) AS merged_from, "
+                "    ARRAY(SELECT unnest(sources) FROM merged) AS sources "
+                "    FROM merged"
+                ") "
+                f"UPDATE users s SET {assignments}, "
+                "sources = ARRAY(SELECT DISTINCT unnest(s.sources || m.sources)), "
+                "merged_from = s.merged_from || m.user_ids || m.merged_from "
+                "FROM m WHERE s.user_id = %s",
+                (merged_user_ids, surviving_user_id)
+            )
+        logging.info("Merged users %s into user %s", merged_user_ids, surviving_user_id)
+
+class ExportDatabaseManager(DatabaseManager):
+    """
+    Exports one denormalized record per user.
+
+    Every row comes from the ``user_profiles`` view
+    (``migrations/0001_user_profiles_view.sql``), which aggregates
+    work_experience, education and skills once per user in SQL. The rows are
+    read through a server-side cursor and written out chunk by chunk, so the
+    export never holds the whole table in memory.
+
+    Methods:
+        stream_user_profiles(chunk_size): Yields chunks of profile rows.
+        export_user_profiles(output_path, chunk_size): Writes the profiles to a .csv or .xlsx file.
+    """
+    def __init__(self, routing: Optional[RoutingPolicy] = None):
+        super().__init__(routing)
+
+    def stream_user_profiles(self, chunk_size: int = 5000) -> Iterator[Tuple[List[str], List[Tuple]]]:
+        """
+        Stream the rows of the user_profiles view.
+
+        Args:
+            chunk_size (int): Number of rows fetched from the server per round-trip.
+
+        Yields:
+            tuple: The column names and a list of at most ``chunk_size`` rows.
+        """
+        query = "SELECT * FROM user_profiles ORDER BY user_id"
+        # Exports only read, so they stream from the replica when there is one
+        yield from self.iter_query(query, chunk_size=chunk_size)
+
+    def export_user_profiles(self, output_path: str = "user_profiles.xlsx", chunk_size: int = 5000) -> int:
+        """
+        Export every user as a single wide row.
+
+        Args:
+            output_path (str): Destination file. The extension picks the format (.csv or .xlsx).
+            chunk_size (int): Number of rows fetched and written per chunk.
+
+        Returns:
+            int: The number of exported users.
+
+        Raises:
+            ValueError: If the output file extension is not supported.
+        """
+        if output_path.endswith(".csv"):
+            output_file = open(output_path, mode="w", newline="", encoding="utf-8")
+            writer = csv.writer(output_file)
+            write_row = writer.writerow
+        elif output_path.endswith(".xlsx"):
+            from openpyxl import Workbook  # pylint: disable=import-outside-toplevel
+
+            # Write-only workbooks stream rows to disk instead of keeping them in memory
+            workbook = Workbook(write_only=True)
+            worksheet = workbook.create_sheet("user_profiles")
+            write_row = worksheet.append
+        else:
+            raise ValueError(f"Unsupported export format: {output_path}")
+
+        row_count = 0
+        try:
+            for columns, rows in self.stream_user_profiles(chunk_size=chunk_size):
+                if row_count == 0:
+                    write_row(columns)
+                for row in rows:
+                    write_row([self._serialize_export_value(value) for value in row])
+                row_count += len(rows)
+                logging.info("Exported %s user profiles", row_count)
+        finally:
+            if output_path.endswith(".csv"):
+                output_file.close()
+            else:
+                workbook.save(output_path)
+
+        return row_count
+
+    @staticmethod
+    def _serialize_export_value(value):
+        """Flatten the aggregated json columns so they fit in a single cell."""
+        if isinstance(value, (list, dict)):
+            return json.dumps(value, default=str)
+        return value
+
+class ReportsDatabaseManager(DatabaseManager):
+    """
+    Reads and refreshes the materialized summary views
+    (``migrations/0002_summary_views.sql``).
+
+    Reports read from the views through their indexes instead of aggregating
+    work_experience, skills and users on every request. The views are brought
+    up to date with ``refresh_summary_views``.
+
+    Methods:
+        refresh_summary_views(concurrently): Refreshes every summary view.
+        get_top_skills(limit): Most common skills.
+        get_company_headcount(company): Headcount per year for one company.
+        get_location_distribution(limit): Most common user locations.
+        get_tenure_distribution(): Number of positions per tenure bucket.
+    """
+    summary_views = (
+        "skills_frequency",
+        "company_headcount_by_year",
+        "location_distribution",
+        "tenure_distribution",
+    )
+
+    def __init__(self):
+        super().__init__()
+
+    def refresh_summary_views(self, concurrently: bool = True) -> None:
+        """
+        Refresh every summary view.
+
+        Args:
+            concurrently (bool):
+                Use REFRESH MATERIALIZED VIEW CONCURRENTLY so readers are not
+                blocked while the view is rebuilt. Defaults to True.
+        """
+        for view in self.summary_views:
+            start = time.time()
+            if concurrently:
+                query = f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view};"
+            else:
+                query = f"REFRESH MATERIALIZED VIEW {view};"
+            self.execute_query(query=query)
+            logging.info("Refreshed %s in %.2f seconds", view, time.time() - start)
+
+    def get_top_skills(self, limit: int = 25) -> List[Tuple[str, int]]:
+        """Return the most common skills and how many users list them."""
+        query = (
+            "SELECT skill_name, user_count FROM skills_frequency "
+            "ORDER BY user_count DESC LIMIT %s"
+        )
+        return self.execute_query(query=query, params=(limit,), fetch="ALL")
+
+    def get_company_headcount(self, company: str) -> List[Tuple[int, int]]:
+        """Return (year, headcount) pairs for the given company."""
+        query = (
+            "SELECT year, headcount FROM company_headcount_by_year "
+            "WHERE company = %s ORDER BY year"
+        )
+        return self.execute_query(query=query, params=(company,), fetch="ALL")
+
+    def get_location_distribution(self, limit: int = 25) -> List[Tuple[str, int]]:
+        """Return the most common user locations and their user counts."""
+        query = (
+            "SELECT location, user_count FROM location_distribution "
+            "ORDER BY user_count DESC LIMIT %s"
+        )
+        return self.execute_query(query=query, params=(limit,), fetch="ALL")
+
+    def get_tenure_distribution(self) -> List[Tuple[str, int]]:
+        """Return the number of positions in each tenure bucket."""
+        query = "SELECT tenure_bucket, position_count FROM tenure_distribution"
+        return self.execute_query(query=query, fetch="ALL")
+
+class CoworkerGraphDatabaseManager(DatabaseManager):
+    """
+    Reads the work experience periods and writes coworker_edges
+    (``scripts/coworker_graph.py``, ``migrations/0009_coworker_edges.sql``).
+
+    Methods:
+        get_company_periods(until, chunk_size): Streams the periods in company order.
+        replace_edges(company_ids, edges): Replaces the edges of some companies.
+        prune_edges(): Deletes the edges of companies without positions.
+        get_coworkers(user_id, min_overlap_days): Co-workers of one user.
+    """
+    def __init__(self, routing: Optional[RoutingPolicy] = None):
+        super().__init__(routing)
+
+    def get_company_periods(self, until, chunk_size: int = 10_000) -> Iterator[List[Tuple]]:
+        """
+        Stream the period of every linked work experience, ordered by company.
+
+        Args:
+            until (date): Exclusive end of the current positions; later periods are cut there.
+            chunk_size (int): Rows fetched from the server at a time.
+
+        Yields:
+            list: (company_id, user_id, start, end) tuples, end exclusive.
+        """
+        # LEAST skips the NULL upper bound of a current position
+        query = (
+            "SELECT company_id, user_id, lower(period), LEAST(upper(period), %s) "
+            "FROM work_experience "
+            "WHERE company_id IS NOT NULL AND period IS NOT NULL AND lower(period) < %s "
+            "ORDER BY company_id"
+        )
+        for _, rows in self.iter_query(query, params=(until, until), chunk_size=chunk_size):
+            yield rows
+
+    def replace_edges(self, company_ids: List[int], edges: List[Tuple[int, int, int, int]]) -> None:
+        """
+        Replace the edges of some companies in one transaction.
+
+        Args:
+            company_ids (list): The companies to replace, including those left without edges.
+            edges (list): Their (user_a, user_b, company_id, overlap_days) edges.
+        """
+        buffer = io.StringIO()
+        buffer.writelines("\t".join(map(str, edge)) + "\n" for edge in edges)
+        buffer.seek(0)
+
+        self.check_database_connection()
+        try:
+            with self.transaction("replace_edges") as cursor:
+                cursor.execute("DELETE FROM coworker_edges WHERE company_id = ANY(%s)", (list(company_ids),))
+                cursor.copy_expert(
+                    "COPY coworker_edges (user_a, user_b, company_id, overlap_days) FROM STDIN", buffer
+                )
+
+        except psycopg2.Error as pg_error:
+            logging.critical("Error writing co-worker edges. psycopg2 Error: %s", pg_error)
+            raise
+
+    def prune_edges(self) -> int:
+        """Delete the edges of companies that no longer have a dated position, returning their count."""
+        query = (
+            "WITH pruned AS ("
+            "    DELETE FROM coworker_edges e WHERE NOT EXISTS ("
+            "        SELECT 1 FROM work_experience w "
+            "        WHERE w.company_id = e.company_id AND w.period IS NOT NULL) "
+            "    RETURNING 1) "
+            "SELECT COUNT(*) FROM pruned"
+        )
+        return self.execute_query(query=query, fetch="ONE")[0]
+
+    def get_coworkers(self, user_id: int, min_overlap_days: int = 1) -> List[Tuple]:
+        """
+        Return the co-workers of a user, longest overlap first.
+
+        Returns:
+            list: (user_id, users_name, company, overlap_days) tuples.
+        """
+        query = (
+            "SELECT u.user_id, u.users_name, COALESCE(c.display_name, c.canonical_name), e.overlap_days "
+            "FROM coworker_edges e "
+            "JOIN users u ON u.user_id = CASE WHEN e.user_a = %s THEN e.user_b ELSE e.user_a END "
+            "JOIN companies c ON c.company_id = e.company_id "
+            "WHERE (e.user_a = %s OR e.user_b = %s) AND e.overlap_days >= %s "
+            "ORDER BY e.overlap_days DESC"
+        )
+        params = (user_id, user_id, user_id, min_overlap_days)
+        return self.execute_query(query=query, params=params, fetch="ALL")
+
+class SyntheticDataDatabaseManager(DatabaseManager):
+    """
+    Bulk-loads generated profiles for scale testing (``scripts/synthetic_data.py``).
+
+    Rows arrive as tab-separated COPY text with their primary keys already
+    assigned, so users and their work_experience, education and skills rows
+    are loaded with one COPY per table and chunk, without a round-trip per row.
+
+    Methods:
+        get_next_ids(): First free primary key of every profile table.
+        truncate_profiles(): Empties the profile tables.
+        copy_chunk(buffers): Loads one chunk of every table in a single transaction.
+        reset_sequences(): Moves the serial sequences past the loaded keys.
+        analyze(): Refreshes the planner statistics of the profile tables.
+    """
+    id_columns = {
+        "users": "user_id",
+        "work_experience": "experience_id",
+        "education": "education_id",
+        "skills": "skill_id",
+    }
+
+    def __init__(self):
+        super().__init__()
+
+    def get_next_ids(self) -> Dict[str, int]:
+        """Return the first unused primary key of every profile table."""
+        query = "SELECT " + ", ".join(
+            f"(SELECT COALESCE(MAX({column}), 0) + 1 FROM {table})"
+            for table, column in self.id_columns.items()
+        )
+        return dict(zip(self.id_columns, self.execute_query(query=query, fetch="ONE")))
+
+    def truncate_profiles(self) -> None:
+        """Delete every user and the rows that reference them."""
+        tables = ", ".join(self.id_columns)
+        self.execute_query(query=f"TRUNCATE {tables} RESTART IDENTITY CASCADE")
+
+    def copy_chunk(self, buffers: List[Tuple[str, Tuple[str, ...], io.StringIO]]) -> None:
+        """
+        COPY one chunk of rows into each table, all or nothing.
+
+        Args:
+            buffers (list): (table, columns, buffer) tuples, with the buffer
+                holding COPY text rows. Parent tables must come first.
+        """
+        self.check_database_connection()
+        try:
+            with self.transaction("copy_chunk") as cursor:
+                for table, columns, buffer in buffers:
+                    buffer.seek(0)
+                    cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", buffer)
+
+        except psycopg2.Error as pg_error:
+            logging.critical("Error copying synthetic rows. psycopg2 Error: %s", pg_error)
+            raise
+
+    def reset_sequences(self) -> None:
+        """Point every serial sequence at the highest loaded key."""
+        for table, column in self.id_columns.items():
+            query = (
+                f"SELECT setval(pg_get_serial_sequence('{table}', '{column}'), "
+                f"(SELECT COALESCE(MAX({column}), 1) FROM {table}))"
+            )
+            self.execute_query(query=query)
+
+    def analyze(self) -> None:
+        for table in self.id_columns:
+            self.execute_query(query=f"ANALYZE {table}")
+
+class MigrationDatabaseManager(DatabaseManager):
+    """
+    Applies the SQL files of scrapers/src/database/migrations and records
+    each applied version in schema_migrations.
+    """
+    def __init__(self, routing: Optional[RoutingPolicy] = None):
+        super().__init__(routing)
+
+    def get_applied_versions(self) -> Dict[str, str]:
+        """Return applied migration versions and their file names, creating schema_migrations if needed."""
+        self.execute_query(
+            query=(
+                "CREATE TABLE IF NOT EXISTS schema_migrations("
+                "version VARCHAR(20) PRIMARY KEY, "
+                "name VARCHAR(255) NOT NULL, "
+                "applied_at TIMESTAMPTZ NOT NULL DEFAULT now())"
+            )
+        )
+        result = self.execute_query(query="SELECT version, name FROM schema_migrations", fetch="ALL")
+        return dict(result)
+
+    def apply_migration(self, version: str, name: str, sql: str, record_only: bool = False) -> None:
+        """
+        Run one migration and record it, in a single transaction.
+
+        Args:
+            version (str): Numeric prefix of the migration file.
+            name (str): File name of the migration.
+            sql (str): Contents of the migration file.
+            record_only (bool): Only record the migration, for databases where
+                it was applied by hand.
+        """
+        self.check_database_connection()
+        try:
+            with self.transaction("apply_migration") as cursor:
+                if not record_only:
+                    cursor.execute(sql)
+                cursor.execute(
+                    "INSERT INTO schema_migrations (version, name) VALUES (%s, %s)", (version, name)
+                )
+
+        except psycopg2.Error as pg_error:
+            logging.critical("Error applying migration %s. psycopg2 Error: %s", name, pg_error)
+            raise
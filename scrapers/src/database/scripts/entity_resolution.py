@@ -0,0 +1,356 @@
+"""
+Finds users that were scraped more than once and merges them into one row.
+
+The same person can exist as a LinkedIn-sourced user and as a Duke alumni
+record with a different form of the profile URL. Comparing every pair of users
+is quadratic, so candidates are first grouped into blocks that share a key:
+
+    - the normalized profile URL or email address
+    - the normalized name plus the city
+    - the normalized name plus the email domain, unless it is a webmail domain
+
+Only pairs inside a block are scored, which keeps a nightly run over the full
+users table near-linear. Pairs above the threshold are clustered with a
+union-find that refuses to join two different LinkedIn profiles or alumni
+records, and each cluster is merged into its most complete row.
+
+Usage:
+    >>> job = DeduplicationJob(threshold=0.8)
+    >>> job.run(dry_run=True)
+
+    $ python -m scrapers.src.database.scripts.entity_resolution --dry-run
+"""
+import argparse
+import logging
+import re
+import unicodedata
+from collections import defaultdict
+from difflib import SequenceMatcher
+from functools import lru_cache
+from itertools import combinations
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from .database_manager import DeduplicationDatabaseManager
+
+logging.basicConfig(level=logging.INFO, filename="log.log", filemode="w",
+                    format="%(asctime)s - %(levelname)s - %(message)s")
+
+# Words that are dropped from names before they are compared
+NAME_AFFIXES = {
+    "mr", "mrs", "ms", "dr", "prof", "jr", "sr", "ii", "iii", "iv",
+    "phd", "mba", "md", "jd", "cpa", "cfa", "pmp", "pe", "esq", "msc", "bsc",
+}
+
+# Webmail providers: sharing one says nothing about being the same person
+PUBLIC_EMAIL_DOMAINS = {
+    "gmail.com", "googlemail.com", "yahoo.com", "ymail.com", "hotmail.com", "outlook.com",
+    "live.com", "msn.com", "aol.com", "icloud.com", "me.com", "mac.com", "comcast.net",
+    "verizon.net", "att.net", "protonmail.com", "proton.me", "gmx.com", "mail.com",
+}
+
+class UserRecord(NamedTuple):
+    user_id: int
+    users_name: str
+    location_of_user: Optional[str]
+    email: Optional[str]
+    phone_number: Optional[str]
+    profile_url: Optional[str]
+    alumni_url: Optional[str]
+    sources: List[str]
+
+@lru_cache(maxsize=None)
+def normalize_name(name: str) -> str:
+    """
+    Fold a name for comparison, e.g. "Dr. José Álvarez-Ruiz, MBA" -> "jose alvarez ruiz".
+    """
+    # Credentials usually follow a comma: "Jane Doe, PMP"
+    name = name.split(",")[0]
+    name = unicodedata.normalize("NFKD", name)
+    name = "".join(char for char in name if not unicodedata.combining(char))
+    words = re.sub(r"[^\w\s]", " ", name.casefold()).split()
+    return " ".join(word for word in words if word not in NAME_AFFIXES)
+
+def name_key(name: str) -> str:
+    """Return the first and last word of a normalized name, ignoring middle names."""
+    words = normalize_name(name).split()
+    if len(words) < 2:
+        return " ".join(words)
+    return f"{words[0]} {words[-1]}"
+
+def normalize_profile_url(url: Optional[str]) -> Optional[str]:
+    """
+    Fold a LinkedIn URL so every form of it compares equal.
+
+    "https://www.linkedin.com/in/jane-doe/?trk=x" -> "linkedin.com/in/jane-doe"
+    """
+    if not url:
+        return None
+    url = url.strip().casefold()
+    url = re.sub(r"^https?://", "", url)
+    url = re.sub(r"^([a-z]{2,3}|www)\.linkedin\.com", "linkedin.com", url)
+    url = re.split(r"[?#]", url)[0]
+    return url.rstrip("/") or None
+
+def normalize_email(email: Optional[str]) -> Optional[str]:
+    if not email or "@" not in email:
+        return None
+    return email.strip().casefold()
+
+def email_domain(email: Optional[str]) -> Optional[str]:
+    email = normalize_email(email)
+    return email.rsplit("@", 1)[1] if email else None
+
+def organization_domain(email: Optional[str]) -> Optional[str]:
+    """Return the domain of an email address, unless it is a public webmail domain."""
+    domain = email_domain(email)
+    return domain if domain not in PUBLIC_EMAIL_DOMAINS else None
+
+def normalize_phone(phone: Optional[str]) -> Optional[str]:
+    """Return the last ten digits of a phone number, dropping country codes and formatting."""
+    if not phone:
+        return None
+    digits = re.sub(r"\D", "", phone)
+    return digits[-10:] if len(digits) >= 7 else None
+
+def normalize_city(location: Optional[str]) -> Optional[str]:
+    """Return the city of a LinkedIn location, e.g. "Durham, North Carolina" -> "durham"."""
+    if not location:
+        return None
+    city = location.split(",")[0].casefold()
+    city = re.sub(r"\b(greater|metropolitan|area|metro)\b", " ", city)
+    return " ".join(city.split()) or None
+
+class EntityResolver:
+    """
+    Blocks, scores and clusters duplicate users.
+
+    Args:
+        threshold (float): Minimum score for two users to be considered the same person.
+        max_block_size (int): Blocks larger than this are skipped; a very common
+            name in a large city says little and would make the run quadratic.
+    """
+    def __init__(self, threshold: float = 0.8, max_block_size: int = 50) -> None:
+        self.threshold = threshold
+        self.max_block_size = max_block_size
+
+    @staticmethod
+    def blocking_keys(record: UserRecord) -> Iterator[Tuple[str, str]]:
+        """Yield the blocking keys of a user."""
+        profile_url = normalize_profile_url(record.profile_url)
+        if profile_url:
+            yield "profile_url", profile_url
+
+        email = normalize_email(record.email)
+        if email:
+            yield "email", email
+
+        key = name_key(record.users_name)
+        if not key:
+            return
+
+        city = normalize_city(record.location_of_user)
+        if city:
+            yield "name_city", f"{key}|{city}"
+
+        domain = organization_domain(record.email)
+        if domain:
+            yield "name_domain", f"{key}|{domain}"
+
+    def candidate_pairs(self, records: List[UserRecord]) -> Set[Tuple[int, int]]:
+        """
+        Return the index pairs of users that share at least one blocking key.
+
+        Args:
+            records (list): The users to resolve.
+
+        Returns:
+            set: (index, index) pairs into records, lowest index first.
+        """
+        blocks: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+        for index, record in enumerate(records):
+            for key in self.blocking_keys(record):
+                blocks[key].append(index)
+
+        pairs = set()
+        skipped_blocks = 0
+        for members in blocks.values():
+            if len(members) < 2:
+                continue
+            if len(members) > self.max_block_size:
+                skipped_blocks += 1
+                continue
+            pairs.update(combinations(members, 2))
+
+        logging.info(
+            "%s blocks produced %s candidate pairs (%s oversized blocks skipped)",
+            len(blocks), len(pairs), skipped_blocks
+        )
+        return pairs
+
+    @staticmethod
+    def score(left: UserRecord, right: UserRecord) -> float:
+        """
+        Score how likely two users are the same person.
+
+        Args:
+            left (UserRecord): A user.
+            right (UserRecord): Another user.
+
+        Returns:
+            float: A score between 0 and 1.
+        """
+        left_url = normalize_profile_url(left.profile_url)
+        right_url = normalize_profile_url(right.profile_url)
+        if left_url and right_url:
+            # Two different LinkedIn profiles are two different people
+            return 1.0 if left_url == right_url else 0.0
+        if left.alumni_url and right.alumni_url and left.alumni_url != right.alumni_url:
+            return 0.0
+
+        score = 0.5 * SequenceMatcher(
+            None, normalize_name(left.users_name), normalize_name(right.users_name)
+        ).ratio()
+
+        left_email, right_email = normalize_email(left.email), normalize_email(right.email)
+        if left_email and left_email == right_email:
+            score += 0.4
+        elif left_email and right_email:
+            # Two addresses at the same employer may be one person's; anything else
+            # (two different gmail.com addresses in particular) counts against a match
+            left_domain = organization_domain(left_email)
+            if not left_domain or left_domain != organization_domain(right_email):
+                score -= 0.2
+
+        left_phone, right_phone = normalize_phone(left.phone_number), normalize_phone(right.phone_number)
+        if left_phone and left_phone == right_phone:
+            score += 0.3
+
+        left_city = normalize_city(left.location_of_user)
+        if left_city and left_city == normalize_city(right.location_of_user):
+            score += 0.2
+
+        return min(max(score, 0.0), 1.0)
+
+    def resolve(self, records: List[UserRecord]) -> List[Tuple[List[UserRecord], float]]:
+        """
+        Group users into clusters of the same person.
+
+        Args:
+            records (list): The users to resolve.
+
+        Returns:
+            list: (cluster, lowest linking score) tuples for every cluster of two or more users.
+        """
+        parent = list(range(len(records)))
+        # Distinct profile and alumni URLs of each cluster, kept on its root
+        identities = [
+            {url for url in (normalize_profile_url(record.profile_url), record.alumni_url) if url}
+            for record in records
+        ]
+        min_scores: Dict[int, float] = {}
+
+        def find(index: int) -> int:
+            while parent[index] != index:
+                parent[index] = parent[parent[index]]
+                index = parent[index]
+            return index
+
+        scored_pairs = []
+        for left, right in self.candidate_pairs(records):
+            score = self.score(records[left], records[right])
+            if score >= self.threshold:
+                scored_pairs.append((score, left, right))
+
+        # Strongest links first, so a weak link cannot block a strong one
+        for score, left, right in sorted(scored_pairs, reverse=True):
+            left_root, right_root = find(left), find(right)
+            if left_root == right_root:
+                continue
+            left_urls, right_urls = identities[left_root], identities[right_root]
+            left_profiles = {url for url in left_urls if url.startswith("linkedin.com")}
+            right_profiles = {url for url in right_urls if url.startswith("linkedin.com")}
+            if (len(left_profiles | right_profiles) > 1
+                    or len((left_urls - left_profiles) | (right_urls - right_profiles)) > 1):
+                continue
+            parent[right_root] = left_root
+            identities[left_root] = left_urls | right_urls
+            min_scores[left_root] = min(
+                score, min_scores.get(left_root, 1.0), min_scores.pop(right_root, 1.0)
+            )
+
+        clusters: Dict[int, List[UserRecord]] = defaultdict(list)
+        for index, record in enumerate(records):
+            clusters[find(index)].append(record)
+
+        return [
+            (cluster, min_scores[root])
+            for root, cluster in clusters.items() if len(cluster) > 1
+        ]
+
+    @staticmethod
+    def choose_survivor(cluster: List[UserRecord]) -> UserRecord:
+        """Keep the LinkedIn-sourced user with the most filled columns, oldest first."""
+        return max(cluster, key=lambda record: (
+            record.profile_url is not None and "linkedin" in (record.sources or []),
+            sum(value is not None for value in record),
+            -record.user_id,
+        ))
+
+class DeduplicationJob:
+    """
+    Resolves the full users table and merges every cluster of duplicates.
+    """
+    def __init__(self, threshold: float = 0.8, max_block_size: int = 50,
+                 dedup_db_manager: Optional[DeduplicationDatabaseManager] = None) -> None:
+        self.resolver = EntityResolver(threshold, max_block_size)
+        self.dedup_db_manager = dedup_db_manager or DeduplicationDatabaseManager()
+
+    def run(self, dry_run: bool = False) -> int:
+        """
+        Run the deduplication.
+
+        Args:
+            dry_run (bool): Log the merges without writing them.
+
+        Returns:
+            int: Number of users merged into another user.
+        """
+        records = [
+            UserRecord(*row) for row in self.dedup_db_manager.get_resolution_candidates()
+        ]
+        merged_users = 0
+        for cluster, score in self.resolver.resolve(records):
+            survivor = self.resolver.choose_survivor(cluster)
+            merged_ids = [record.user_id for record in cluster if record is not survivor]
+            logging.info(
+                "Merging users %s into user %s (score %.2f)", merged_ids, survivor.user_id, score
+            )
+            if not dry_run:
+                self.dedup_db_manager.merge_users(survivor.user_id, merged_ids, score)
+            merged_users += len(merged_ids)
+
+        logging.info("Resolved %s users, merged %s duplicates", len(records), merged_users)
+        return merged_users
+
+def main():
+    parser = argparse.ArgumentParser(description="Find and merge duplicate users.")
+    parser.add_argument(
+        "--threshold", type=float, default=0.8,
+        help="Minimum match score for two users to be merged."
+    )
+    parser.add_argument(
+        "--max-block-size", type=int, default=50,
+        help="Skip blocking keys shared by more users than this."
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true",
+        help="Log the merges without writing them."
+    )
+    args = parser.parse_args()
+
+    merged_users = DeduplicationJob(args.threshold, args.max_block_size).run(args.dry_run)
+    action = "Would merge" if args.dry_run else "Merged"
+    print(f"{action} {merged_users} duplicate users")
+
+if __name__ == "__main__":
+    main()
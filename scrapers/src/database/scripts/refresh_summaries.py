@@ -0,0 +1,25 @@
+"""
+Refresh the materialized summary views used by the reports.
+
+Usage:
+    $ python -m scrapers.src.database.scripts.refresh_summaries
+    $ python -m scrapers.src.database.scripts.refresh_summaries --blocking
+"""
+import argparse
+
+from .database_manager import ReportsDatabaseManager
+
+def main():
+    parser = argparse.ArgumentParser(description="Refresh the materialized summary views.")
+    parser.add_argument(
+        "--blocking", action="store_true",
+        help="Use a plain REFRESH instead of REFRESH ... CONCURRENTLY."
+    )
+    args = parser.parse_args()
+
+    reports_manager = ReportsDatabaseManager()
+    reports_manager.refresh_summary_views(concurrently=not args.blocking)
+    print("Summary views refreshed")
+
+if __name__ == "__main__":
+    main()
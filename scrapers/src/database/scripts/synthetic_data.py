@@ -0,0 +1,468 @@
+"""
+Generates synthetic users, work_experience, education and skills rows for scale testing.
+
+The real dump (users_table_dump.sql) is far too small to judge query plans,
+index sizes or export memory. This script fills the profile tables with
+10k, 100k or 1M made-up users that look like production data:
+
+    - Most users are only scouted: like in the dump, about 70% have nothing
+      but a profile URL. Only scraped users have experiences, education and skills.
+    - Companies, skills, schools and cities follow Zipf distributions, so a
+      few values are very common and the long tail is long. A share of the
+      company names are spelling variants ("Booz Allen Hamilton Inc.") for
+      the canonicalizer.
+    - Optional columns are NULL at the rates in NULL_RATES.
+
+Primary keys are assigned here, starting after the current maximum, so every
+table is loaded with COPY in chunks and no row needs a round-trip. The
+generator is seeded, so the same scale and seed always produce the same rows.
+
+Usage:
+    $ python -m scrapers.src.database.scripts.synthetic_data --scale 100k
+    $ python -m scrapers.src.database.scripts.synthetic_data --scale 1m --truncate --seed 7
+"""
+import argparse
+import io
+import logging
+import random
+import time
+from datetime import date, timedelta
+from itertools import accumulate
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .database_manager import SyntheticDataDatabaseManager
+
+logging.basicConfig(level=logging.INFO, filename="log.log", filemode="w",
+                    format="%(asctime)s - %(levelname)s - %(message)s")
+
+SCALES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+# Share of scouted users that were also scraped (users_name is NULL for 70% of the dump)
+SCRAPED_RATE = 0.30
+
+# Probability that a column is NULL, for scraped users and their rows
+NULL_RATES = {
+    "users.location_of_user": 0.05,
+    "users.email": 0.98,
+    "users.phone_number": 0.99,
+    "users.address": 0.99,
+    "users.website": 0.77,
+    "work_experience.work_description": 0.45,
+    "work_experience.location_of_job": 0.25,
+    "education.degree": 0.15,
+    "education.grade": 0.85,
+    "education.activities_and_societies": 0.75,
+    "education.description_of_education": 0.85,
+}
+
+DUKE_ALUMNI_RATE = 0.05
+
+COLUMNS = {
+    "users": (
+        "user_id", "users_name", "email", "location_of_user", "profile_url",
+        "phone_number", "address", "website", "alumni_url", "sources",
+    ),
+    "work_experience": (
+        "experience_id", "user_id", "job_title", "company", "location_of_job",
+        "start_date", "end_date", "work_description", "start_precision", "end_precision", "is_current",
+    ),
+    "education": (
+        "education_id", "user_id", "school_name", "degree", "grade", "start_date",
+        "end_date", "description_of_education", "activities_and_societies", "start_precision",
+        "end_precision", "is_current",
+    ),
+    "skills": ("skill_id", "user_id", "skill_name"),
+}
+
+FIRST_NAMES = [
+    "James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda", "David",
+    "Elizabeth", "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica", "Thomas", "Sarah",
+    "Christopher", "Karen", "Charles", "Lisa", "Daniel", "Nancy", "Matthew", "Betty", "Anthony",
+    "Sandra", "Mark", "Margaret", "Donald", "Ashley", "Steven", "Kimberly", "Andrew", "Emily",
+    "Paul", "Donna", "Joshua", "Michelle", "Kenneth", "Carol", "Kevin", "Amanda", "Brian",
+    "Melissa", "George", "Deborah", "Timothy", "Stephanie", "Ronald", "Rebecca", "Jason", "Laura",
+    "Priya", "Wei", "Mohammed", "Sofia", "Carlos", "Aisha", "Hiroshi", "Olga", "Jose", "Mei",
+]
+
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez",
+    "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas", "Taylor",
+    "Moore", "Jackson", "Martin", "Lee", "Perez", "Thompson", "White", "Harris", "Sanchez",
+    "Clark", "Ramirez", "Lewis", "Robinson", "Walker", "Young", "Allen", "King", "Wright",
+    "Scott", "Torres", "Nguyen", "Hill", "Flores", "Green", "Adams", "Nelson", "Baker", "Hall",
+    "Rivera", "Campbell", "Mitchell", "Carter", "Roberts", "Patel", "Chen", "Kim", "Singh",
+]
+
+# Most common first, as they are drawn with a Zipf distribution
+CITIES = [
+    ("Houston", "TX", "Texas"), ("Washington", "DC", "District of Columbia"),
+    ("Baltimore", "MD", "Maryland"), ("New York", "NY", "New York"),
+    ("Arlington", "VA", "Virginia"), ("San Francisco", "CA", "California"),
+    ("Philadelphia", "PA", "Pennsylvania"), ("Durham", "NC", "North Carolina"),
+    ("Chicago", "IL", "Illinois"), ("Boston", "MA", "Massachusetts"),
+    ("Austin", "TX", "Texas"), ("Seattle", "WA", "Washington"), ("Atlanta", "GA", "Georgia"),
+    ("Denver", "CO", "Colorado"), ("Dallas", "TX", "Texas"), ("Raleigh", "NC", "North Carolina"),
+    ("Reston", "VA", "Virginia"), ("Bethesda", "MD", "Maryland"), ("Pittsburgh", "PA", "Pennsylvania"),
+    ("Los Angeles", "CA", "California"), ("Miami", "FL", "Florida"), ("Nashville", "TN", "Tennessee"),
+    ("Columbia", "MD", "Maryland"), ("Kemah", "TX", "Texas"), ("Las Vegas", "NV", "Nevada"),
+    ("Gates Mills", "OH", "Ohio"), ("Lebanon", "TN", "Tennessee"), ("Gloucester", "MA", "Massachusetts"),
+]
+
+COMPANIES = [
+    "Booz Allen Hamilton", "Deloitte", "Accenture", "Amazon", "Microsoft", "Google",
+    "Lockheed Martin", "Northrop Grumman", "Leidos", "SAIC", "General Dynamics", "Raytheon",
+    "IBM", "Capital One", "JPMorgan Chase & Co.", "Chevron", "ExxonMobil", "Shell",
+    "Duke University", "Johns Hopkins University", "Duke Energy", "Bank of America",
+    "Wells Fargo", "KPMG", "PwC", "EY", "McKinsey & Company", "Boston Consulting Group",
+    "CACI International", "ManTech", "Peraton", "Oracle", "Salesforce", "Meta", "Apple",
+    "U.S. Department of Defense", "U.S. Army", "U.S. Navy", "NASA", "Federal Reserve Board",
+    "Halliburton", "Schlumberger", "Baker Hughes", "ConocoPhillips", "Phillips 66",
+    "Houston Methodist", "MD Anderson Cancer Center", "Kaiser Permanente", "UnitedHealth Group",
+    "Marriott International", "Under Armour", "T. Rowe Price", "Freddie Mac", "Fannie Mae",
+]
+
+# Spelling variants of a company name as they show up on LinkedIn
+COMPANY_VARIANT_SUFFIXES = [" Inc.", ", Inc.", " LLC", " Corporation", " Corp.", " Co.", " (Contract)"]
+COMPANY_VARIANT_RATE = 0.08
+
+COMPANY_WORDS = [
+    "Apex", "Summit", "Blue", "Harbor", "Liberty", "Pioneer", "Granite", "Atlas", "Beacon",
+    "Keystone", "Cedar", "Potomac", "Chesapeake", "Lone Star", "Bayou", "Capitol", "Meridian",
+    "Vector", "Signal", "Northstar", "Red Oak", "Iron", "Silver", "Coastal", "Frontier",
+]
+COMPANY_NOUNS = [
+    "Solutions", "Analytics", "Systems", "Consulting", "Technologies", "Partners", "Energy",
+    "Health", "Logistics", "Capital", "Labs", "Group", "Engineering", "Data", "Software",
+]
+
+SENIORITIES = ["", "Senior", "Lead", "Principal", "Junior", "Staff", "Associate", "Chief"]
+SENIORITY_WEIGHTS = [45, 22, 8, 4, 6, 3, 9, 1]
+ROLES = [
+    "Software Engineer", "Data Scientist", "Data Analyst", "Project Manager", "Consultant",
+    "Business Analyst", "Program Manager", "Accountant", "Engineer", "Product Manager",
+    "Research Assistant", "Sales Representative", "Marketing Manager", "Director of Operations",
+    "Vice President", "Systems Administrator", "Financial Analyst", "Nurse", "Teacher",
+    "Intern", "Recruiter", "Attorney", "Geologist", "Petroleum Engineer", "Founder",
+]
+
+SKILLS = [
+    "Microsoft Excel", "Leadership", "Project Management", "Management", "Microsoft Office",
+    "Customer Service", "Public Speaking", "Strategic Planning", "Python", "SQL", "Data Analysis",
+    "Team Building", "Research", "Communication", "Microsoft PowerPoint", "Sales", "Marketing",
+    "Program Management", "Negotiation", "Business Strategy", "Java", "JavaScript", "Agile Methodologies",
+    "Machine Learning", "Tableau", "Budgeting", "Training", "Consulting", "Analytics", "Statistics",
+    "Social Media", "Event Planning", "Healthcare", "Oil & Gas", "Government", "Security Clearance",
+    "Amazon Web Services (AWS)", "Docker", "Kubernetes", "Git", "Linux", "R", "Pandas", "Spark",
+    "PostgreSQL", "Financial Analysis", "Risk Management", "Process Improvement", "Six Sigma",
+    "Change Management", "Cross-functional Team Leadership", "Requirements Analysis", "Salesforce.com",
+    "Digital Marketing", "Data Visualization", "Forecasting", "Engineering", "AutoCAD", "MATLAB",
+    "C++", "Petrel", "Geology", "Drilling", "Nursing", "Teaching", "Curriculum Development",
+    "Litigation", "Contract Negotiation", "Recruiting", "Human Resources", "Payroll",
+]
+
+SKILL_QUALIFIERS = ["Administration", "Development", "Design", "Testing", "Architecture", "Compliance"]
+
+SCHOOLS = [
+    "Duke University", "University of Maryland", "University of Houston", "Texas A&M University",
+    "The University of Texas at Austin", "Georgetown University", "Johns Hopkins University",
+    "George Washington University", "Rice University", "University of North Carolina at Chapel Hill",
+    "Virginia Tech", "Penn State University", "Harvard University", "Stanford University",
+    "Massachusetts Institute of Technology", "Howard University", "Towson University",
+    "George Mason University", "North Carolina State University", "University of Virginia",
+    "Coursera", "University of Phoenix", "Houston Community College", "Montgomery College",
+]
+
+DEGREES = [
+    "Bachelor of Science - BS", "Bachelor of Arts - BA", "Master of Science - MS",
+    "Master of Business Administration - MBA", "Doctor of Philosophy - PhD", "Juris Doctor - JD",
+    "Associate of Arts - AA", "High School Diploma", "Certificate",
+]
+DEGREE_WEIGHTS = [40, 22, 15, 10, 4, 2, 3, 2, 2]
+FIELDS_OF_STUDY = [
+    "Computer Science", "Economics", "Mechanical Engineering", "Business Administration",
+    "Mathematics", "Political Science", "Biology", "Accounting", "Psychology", "Statistics",
+    "Petroleum Engineering", "Finance", "Nursing", "History", "Electrical Engineering",
+]
+
+DESCRIPTION_SENTENCES = [
+    "Led a team of {n} engineers delivering {thing}.",
+    "Built dashboards in Tableau for executive reporting.",
+    "Managed a portfolio of {n} client accounts.",
+    "Reduced processing time by {n}% through automation.",
+    "Designed and maintained {thing} on AWS.",
+    "Supported federal clients with data migration and reporting.",
+    "Coordinated cross-functional projects with budgets over ${n}M.",
+    "Mentored junior staff and ran weekly training sessions.",
+    "Analyzed well logs and seismic data for {thing}.",
+]
+DESCRIPTION_THINGS = ["a claims pipeline", "the reporting platform", "customer analytics",
+                      "a billing system", "exploration projects", "the data warehouse"]
+
+ACTIVITIES = ["Varsity Soccer", "Student Government", "ACM", "Debate Team", "Habitat for Humanity",
+              "Marching Band", "Investment Club", "Engineers Without Borders", "Greek Life"]
+
+class ZipfChoice:
+    """
+    Draws values with probability proportional to 1 / rank ** exponent.
+
+    Args:
+        values (list): The values, most common first.
+        exponent (float): Skew of the distribution; 0 is uniform.
+    """
+    def __init__(self, values: Sequence, exponent: float = 1.1) -> None:
+        self.values = list(values)
+        self.cum_weights = list(accumulate(1 / rank ** exponent for rank in range(1, len(self.values) + 1)))
+
+    def draw(self, rng: random.Random, k: int = 1) -> List:
+        return rng.choices(self.values, cum_weights=self.cum_weights, k=k)
+
+    def one(self, rng: random.Random):
+        return rng.choices(self.values, cum_weights=self.cum_weights)[0]
+
+def company_vocabulary(size: int) -> List[str]:
+    """Return the real company names followed by generated long-tail companies."""
+    combinations = [f"{word} {noun}" for noun in COMPANY_NOUNS for word in COMPANY_WORDS]
+    tail = [
+        combinations[index % len(combinations)]
+        + (f" {index // len(combinations) + 1}" if index >= len(combinations) else "")
+        for index in range(max(0, size - len(COMPANIES)))
+    ]
+    return COMPANIES + tail
+
+def skill_vocabulary(size: int) -> List[str]:
+    """Return the common skills followed by generated niche skills."""
+    combinations = [f"{skill} {qualifier}" for qualifier in SKILL_QUALIFIERS for skill in SKILLS]
+    tail = [
+        combinations[index % len(combinations)]
+        + (f" {index // len(combinations) + 1}" if index >= len(combinations) else "")
+        for index in range(max(0, size - len(SKILLS)))
+    ]
+    return SKILLS + tail
+
+def copy_value(value) -> str:
+    """Format a value for COPY's text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, list):
+        return "{" + ",".join(value) + "}"
+    return (str(value).replace("\\", "\\\\").replace("\t", "\\t")
+            .replace("\n", "\\n").replace("\r", "\\r"))
+
+def copy_line(row: Tuple) -> str:
+    return "\t".join(copy_value(value) for value in row) + "\n"
+
+class SyntheticProfileGenerator:
+    """
+    Generates profile rows with preassigned primary keys.
+
+    Args:
+        user_count (int): Number of users to generate.
+        first_ids (dict): First primary key to use per table, e.g. from get_next_ids().
+        seed (int): Seed of the random generator.
+        today (date): Date the current positions run up to, fixed for reproducible output.
+    """
+    def __init__(self, user_count: int, first_ids: Dict[str, int], seed: int = 0,
+                 today: Optional[date] = None) -> None:
+        self.user_count = user_count
+        self.next_ids = dict(first_ids)
+        self.rng = random.Random(seed)
+        self.today = today or date(2024, 6, 1)
+
+        # Vocabularies grow with the data like they do in production
+        self.companies = ZipfChoice(company_vocabulary(max(500, user_count // 20)), exponent=1.05)
+        self.skills = ZipfChoice(skill_vocabulary(max(300, user_count // 200)), exponent=1.2)
+        self.cities = ZipfChoice(CITIES, exponent=1.3)
+        self.schools = ZipfChoice(SCHOOLS, exponent=1.0)
+        self.first_names = ZipfChoice(FIRST_NAMES, exponent=0.6)
+        self.last_names = ZipfChoice(LAST_NAMES, exponent=0.6)
+        self.roles = ZipfChoice(ROLES, exponent=0.9)
+
+    def _take_id(self, table: str) -> int:
+        next_id = self.next_ids[table]
+        self.next_ids[table] = next_id + 1
+        return next_id
+
+    def _maybe(self, column: str, value):
+        return None if self.rng.random() < NULL_RATES[column] else value
+
+    def _company(self) -> str:
+        company = self.companies.one(self.rng)
+        if self.rng.random() < COMPANY_VARIANT_RATE:
+            company += self.rng.choice(COMPANY_VARIANT_SUFFIXES)
+        return company
+
+    def _description(self) -> str:
+        sentences = self.rng.sample(DESCRIPTION_SENTENCES, self.rng.randint(1, 3))
+        return " ".join(
+            sentence.format(n=self.rng.randint(2, 40), thing=self.rng.choice(DESCRIPTION_THINGS))
+            for sentence in sentences
+        )
+
+    def _user(self, user_id: int) -> Tuple[Tuple, bool]:
+        rng = self.rng
+        first, last = self.first_names.one(rng), self.last_names.one(rng)
+        profile_url = f"https://www.linkedin.com/in/{first.lower()}-{last.lower()}-{user_id:x}{rng.getrandbits(16):04x}"
+        is_alumnus = rng.random() < DUKE_ALUMNI_RATE
+        alumni_url = f"https://alumni.duke.edu/profile/{user_id}" if is_alumnus else None
+        sources = ["linkedin", "duke_alumni"] if is_alumnus else ["linkedin"]
+
+        scraped = is_alumnus or rng.random() < SCRAPED_RATE
+        if not scraped:
+            return (user_id, None, None, None, profile_url, None, None, None, alumni_url, sources), False
+
+        city, state, _ = self.cities.one(rng)
+        # The alumni database lists email and phone; LinkedIn rarely shows them
+        email = f"{first.lower()}.{last.lower()}{user_id}@example.com"
+        phone_number = f"({rng.randint(201, 989)}) 555-{rng.randint(0, 9999):04d}"
+        if not is_alumnus:
+            email = self._maybe("users.email", email)
+            phone_number = self._maybe("users.phone_number", phone_number)
+        row = (
+            user_id,
+            f"{first} {last}",
+            email,
+            self._maybe("users.location_of_user", f"{city}, {state}"),
+            profile_url,
+            phone_number,
+            self._maybe("users.address", f"{rng.randint(1, 9999)} Main St, {city}, {state}"),
+            self._maybe("users.website", f"{last.lower()}{user_id}.example.com"),
+            alumni_url,
+            sources,
+        )
+        return row, True
+
+    def _experiences(self, user_id: int) -> Iterator[Tuple]:
+        rng = self.rng
+        position_count = rng.choices(range(1, 9), weights=[18, 22, 20, 14, 10, 7, 5, 4])[0]
+        # Walk back in time from the most recent position. Like parse_date_range(),
+        # dates are the first of a month and current positions have no end date.
+        is_current = rng.random() < 0.7
+        end = self.today if is_current else self.today - timedelta(days=rng.randint(30, 900))
+        for _ in range(position_count):
+            start = end - timedelta(days=rng.randint(120, 2400))
+            city, state, state_name = self.cities.one(rng)
+            seniority = rng.choices(SENIORITIES, weights=SENIORITY_WEIGHTS)[0]
+            yield (
+                self._take_id("work_experience"),
+                user_id,
+                f"{seniority} {self.roles.one(rng)}".strip(),
+                self._company(),
+                self._maybe("work_experience.location_of_job", f"{city}, {state_name}, United States"),
+                start.replace(day=1),
+                None if is_current else end.replace(day=1),
+                self._maybe("work_experience.work_description", self._description()),
+                "month",
+                None if is_current else "month",
+                is_current,
+            )
+            end = start - timedelta(days=rng.randint(0, 180))
+            is_current = False
+
+    def _education(self, user_id: int) -> Iterator[Tuple]:
+        rng = self.rng
+        count = rng.choices(range(4), weights=[10, 55, 28, 7])[0]
+        year = rng.randint(1975, 2022)
+        for _ in range(count):
+            degree = rng.choices(DEGREES, weights=DEGREE_WEIGHTS)[0]
+            years = rng.choice((1, 2, 4, 4, 4, 5))
+            yield (
+                self._take_id("education"),
+                user_id,
+                self.schools.one(rng),
+                self._maybe("education.degree", f"{degree}, {rng.choice(FIELDS_OF_STUDY)}"),
+                self._maybe("education.grade", f"{rng.uniform(2.5, 4.0):.2f}"),
+                date(year - years, 1, 1),
+                date(year, 1, 1),
+                self._maybe("education.description_of_education", self._description()),
+                self._maybe(
+                    "education.activities_and_societies", ", ".join(rng.sample(ACTIVITIES, rng.randint(1, 3)))
+                ),
+                "year",
+                "year",
+                False,
+            )
+            year -= years
+
+    def _skills(self, user_id: int) -> Iterator[Tuple]:
+        # LinkedIn caps skills at 50; most profiles list far fewer
+        skill_count = min(50, int(self.rng.paretovariate(1.3) * 4))
+        for skill_name in sorted(set(self.skills.draw(self.rng, skill_count))):
+            yield (self._take_id("skills"), user_id, skill_name)
+
+    def chunks(self, chunk_size: int) -> Iterator[Dict[str, List[Tuple]]]:
+        """
+        Yield the rows of chunk_size users at a time.
+
+        Yields:
+            dict: Table name -> rows, for users and the rows referencing them.
+        """
+        for chunk_start in range(0, self.user_count, chunk_size):
+            rows: Dict[str, List[Tuple]] = {table: [] for table in COLUMNS}
+            for _ in range(min(chunk_size, self.user_count - chunk_start)):
+                user_id = self._take_id("users")
+                user_row, scraped = self._user(user_id)
+                rows["users"].append(user_row)
+                if scraped:
+                    rows["work_experience"].extend(self._experiences(user_id))
+                    rows["education"].extend(self._education(user_id))
+                    rows["skills"].extend(self._skills(user_id))
+            yield rows
+
+def to_copy_buffers(rows: Dict[str, List[Tuple]]) -> List[Tuple[str, Tuple[str, ...], io.StringIO]]:
+    """Turn a chunk of rows into COPY text buffers, parent tables first."""
+    buffers = []
+    for table, columns in COLUMNS.items():
+        buffer = io.StringIO()
+        buffer.writelines(copy_line(row) for row in rows[table])
+        buffers.append((table, columns, buffer))
+    return buffers
+
+def load(user_count: int, seed: int = 0, chunk_size: int = 20_000, truncate: bool = False) -> Dict[str, int]:
+    """
+    Generate and COPY synthetic profiles into the database.
+
+    Args:
+        user_count (int): Number of users to generate.
+        seed (int): Seed of the random generator.
+        chunk_size (int): Users generated and loaded per transaction.
+        truncate (bool): Empty the profile tables first.
+
+    Returns:
+        dict: Number of loaded rows per table.
+    """
+    database_manager = SyntheticDataDatabaseManager()
+    if truncate:
+        database_manager.truncate_profiles()
+
+    generator = SyntheticProfileGenerator(user_count, database_manager.get_next_ids(), seed=seed)
+    row_counts = {table: 0 for table in COLUMNS}
+    start = time.perf_counter()
+    for rows in generator.chunks(chunk_size):
+        database_manager.copy_chunk(to_copy_buffers(rows))
+        for table, table_rows in rows.items():
+            row_counts[table] += len(table_rows)
+        logging.info("Loaded %s synthetic users in %.1f s", row_counts["users"], time.perf_counter() - start)
+
+    database_manager.reset_sequences()
+    database_manager.analyze()
+    return row_counts
+
+def main():
+    parser = argparse.ArgumentParser(description="Load synthetic profiles for scale testing.")
+    parser.add_argument("--scale", choices=SCALES, default="10k", help="Number of users to generate.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random generator.")
+    parser.add_argument("--chunk-size", type=int, default=20_000, help="Users loaded per transaction.")
+    parser.add_argument(
+        "--truncate", action="store_true",
+        help="Delete every user, experience, education and skill row first."
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    row_counts = load(SCALES[args.scale], seed=args.seed, chunk_size=args.chunk_size, truncate=args.truncate)
+    print(", ".join(f"{count} {table}" for table, count in row_counts.items()),
+          f"loaded in {time.perf_counter() - start:.1f} s")
+    print("Run refresh_summaries to bring the summary views up to date.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""
+Lightweight span tracing for the scraping pipeline.
+
+Spans are opened with the span() context manager or the traced() decorator
+and nest through a context variable, so a profile scrape, the stages it runs
+and the database calls they make end up in one trace. Finished spans are
+written as one JSON object per line using OpenTelemetry's span field names
+(traceId, spanId, parentSpanId, startTimeUnixNano, ...), so the file can be
+replayed into an OpenTelemetry collector later. The file is appended to, so
+every span also carries the runId of the process that wrote it, and a report
+can be limited to one run.
+
+Tracing is off until a file is configured, either with configure_tracing()
+or the PPDB_TRACE_FILE environment variable. While it is off, span() and
+traced() only cost a function call.
+
+Usage:
+    >>> configure_tracing("traces.jsonl")
+    >>> with span("profile", user_id=42):
+    ...     scrape()
+
+    >>> @traced("stage.skills")
+    ... def skills_wrapper(self, user_id, profile_url): ...
+
+    Summarize a trace file, time per stage and the slowest profiles, for
+    every run or the last one:
+
+    $ python -m scrapers.src.monitoring.tracing traces.jsonl --top 10
+    $ python -m scrapers.src.monitoring.tracing traces.jsonl --last-run
+"""
+import argparse
+import atexit
+import contextvars
+import functools
+import json
+import logging
+import os
+import secrets
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logging.basicConfig(level=logging.INFO, filename="log.log", filemode="w",
+                    format="%(asctime)s - %(levelname)s - %(message)s")
+
+TRACE_FILE_ENV = "PPDB_TRACE_FILE"
+
+class Span:
+    """A timed operation. Field names follow the OpenTelemetry span model."""
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_span_id",
+        "start_time_unix_nano", "end_time_unix_nano", "attributes", "status",
+    )
+
+    def __init__(self, name: str, parent: Optional["Span"], attributes: Dict[str, Any]) -> None:
+        self.name = name
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent_span_id = parent.span_id if parent else None
+        self.start_time_unix_nano = time.time_ns()
+        self.end_time_unix_nano: Optional[int] = None
+        self.attributes = attributes
+        self.status = "OK"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_span_id,
+            "name": self.name,
+            "startTimeUnixNano": self.start_time_unix_nano,
+            "endTimeUnixNano": self.end_time_unix_nano,
+            "attributes": self.attributes,
+            "status": {"code": self.status},
+        }
+
+class JsonlFileExporter:
+    """Appends finished spans to a file, one JSON object per line, tagged with its run_id."""
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.run_id = secrets.token_hex(8)
+        self.file = open(path, mode="a", encoding="utf-8")  # pylint: disable=consider-using-with
+        atexit.register(self.shutdown)
+
+    def export(self, finished_span: Span) -> None:
+        record = finished_span.to_dict()
+        record["runId"] = self.run_id
+        self.file.write(json.dumps(record, default=str) + "\n")
+        if finished_span.parent_span_id is None:
+            # A whole trace is done; make it visible to readers
+            self.file.flush()
+
+    def shutdown(self) -> None:
+        if not self.file.closed:
+            self.file.close()
+
+_exporter: Optional[JsonlFileExporter] = None
+_current_span: contextvars.ContextVar = contextvars.ContextVar("current_span", default=None)
+
+def configure_tracing(path: Optional[str]) -> None:
+    """
+    Send finished spans to a file, or turn tracing off.
+
+    Args:
+        path (str): Path of the JSONL trace file. None disables tracing.
+    """
+    global _exporter  # pylint: disable=global-statement
+    if _exporter is not None:
+        _exporter.shutdown()
+    _exporter = JsonlFileExporter(path) if path else None
+    if path:
+        logging.info("Writing trace spans to %s", path)
+
+def tracing_enabled() -> bool:
+    return _exporter is not None
+
+def current_run_id() -> Optional[str]:
+    """Return the runId written on the spans of this process, or None while tracing is off."""
+    return _exporter.run_id if _exporter is not None else None
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """
+    Time the enclosed block as a child of the current span.
+
+    Args:
+        name (str): The span name, e.g. "stage.skills".
+        **attributes: Attributes recorded on the span.
+
+    Yields:
+        Span: The open span, or None while tracing is off.
+    """
+    if _exporter is None:
+        yield None
+        return
+
+    new_span = Span(name, _current_span.get(), attributes)
+    token = _current_span.set(new_span)
+    try:
+        yield new_span
+    except BaseException as error:
+        new_span.status = "ERROR"
+        new_span.attributes["exception.type"] = type(error).__name__
+        new_span.attributes["exception.message"] = str(error)
+        raise
+    finally:
+        new_span.end_time_unix_nano = time.time_ns()
+        _current_span.reset(token)
+        if _exporter is not None:
+            _exporter.export(new_span)
+
+def traced(name: Optional[str] = None) -> Callable:
+    """
+    Decorate a function so every call is recorded as a span.
+
+    Args:
+        name (str): The span name. Defaults to the function's qualified name.
+    """
+    def decorator(function: Callable) -> Callable:
+        span_name = name or function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if _exporter is None:
+                return function(*args, **kwargs)
+            with span(span_name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def load_spans(path: str, run_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Read the spans of a trace file.
+
+    Args:
+        path (str): The JSONL trace file.
+        run_id (str): Only keep the spans of this run. Defaults to every run.
+
+    Returns:
+        list: The span records, in the order they were written.
+    """
+    with open(path, mode="r", encoding="utf-8") as trace_file:
+        spans = [json.loads(line) for line in trace_file if line.strip()]
+    if run_id is not None:
+        spans = [span_record for span_record in spans if span_record.get("runId") == run_id]
+    return spans
+
+def _duration_ms(span_record: Dict[str, Any]) -> float:
+    return (span_record["endTimeUnixNano"] - span_record["startTimeUnixNano"]) / 1e6
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+def summarize(spans: List[Dict[str, Any]], top: int = 10) -> str:
+    """
+    Build a report of time per span name and the slowest root spans.
+
+    Args:
+        spans (list): Span records as written by JsonlFileExporter.
+        top (int): Number of slowest root spans (e.g. profiles) to list.
+
+    Returns:
+        str: The formatted report.
+    """
+    durations: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    for span_record in spans:
+        durations[span_record["name"]].append(_duration_ms(span_record))
+        if span_record["status"]["code"] == "ERROR":
+            errors[span_record["name"]] += 1
+
+    lines = [
+        f"{'span':<40} {'count':>7} {'total s':>9} {'mean ms':>9} "
+        f"{'p50 ms':>9} {'p95 ms':>9} {'max ms':>9} {'errors':>7}"
+    ]
+    for name, values in sorted(durations.items(), key=lambda item: -sum(item[1])):
+        values.sort()
+        lines.append(
+            f"{name:<40} {len(values):>7} {sum(values) / 1000:>9.2f} "
+            f"{sum(values) / len(values):>9.1f} {_percentile(values, 0.5):>9.1f} "
+            f"{_percentile(values, 0.95):>9.1f} {values[-1]:>9.1f} {errors[name]:>7}"
+        )
+
+    roots = sorted(
+        (span_record for span_record in spans if span_record["parentSpanId"] is None),
+        key=_duration_ms, reverse=True
+    )
+    if roots:
+        lines.append("")
+        lines.append(f"Slowest {min(top, len(roots))} of {len(roots)} traces:")
+        for root in roots[:top]:
+            attributes = " ".join(f"{key}={value}" for key, value in root["attributes"].items())
+            lines.append(f"  {_duration_ms(root) / 1000:>8.2f} s  {root['name']}  {attributes}")
+
+    return "\n".join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize a trace file.")
+    parser.add_argument("path", help="JSONL trace file written by the tracing exporter.")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest traces to list.")
+    runs = parser.add_mutually_exclusive_group()
+    runs.add_argument("--run", help="Only summarize the spans of this runId.")
+    runs.add_argument("--last-run", action="store_true", help="Only summarize the last run in the file.")
+    args = parser.parse_args()
+
+    spans = load_spans(args.path, run_id=args.run)
+    if args.last_run and spans:
+        spans = [span_record for span_record in spans if span_record.get("runId") == spans[-1].get("runId")]
+    print(summarize(spans, top=args.top))
+
+configure_tracing(os.environ.get(TRACE_FILE_ENV))
+
+if __name__ == "__main__":
+    main()
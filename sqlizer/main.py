@@ -1,12 +1,62 @@
+import os
 import time
-from .scripts.document_parser import DocumentParser
+import argparse
+
+def print_matches(filepath, skills, top_users):
+    print(f"{filepath}:")
+    for skill_name, count in skills.most_common():
+        print(f"    {skill_name}: {count}")
+    for user_id, overlap in top_users:
+        print(f"    user {user_id}: {overlap} matching skills")
 
 def main():
+    parser = argparse.ArgumentParser(description="Match job description documents against the skills table.")
+    parser.add_argument(
+        "path", nargs="?", default=os.path.join("sqlizer", "files", "sample-job-description.pdf"),
+        help="A PDF/DOCX file, or a directory of them."
+    )
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--n-process", type=int, default=1)
+    parser.add_argument("--top-users", type=int, default=10)
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="Text extraction processes (defaults to every core)."
+    )
+    args = parser.parse_args()
+
+    match_documents(args.path, batch_size=args.batch_size, n_process=args.n_process,
+                    top_users=args.top_users, workers=args.workers)
+
+def match_documents(path, batch_size=16, n_process=1, top_users=10, workers=None):
+    """
+    Parse a document, or every document of a directory, and print its skills and best matching users.
+
+    Args:
+        path (str): A PDF/DOCX file, or a directory of them.
+        batch_size (int): Documents per spaCy batch.
+        n_process (int): spaCy processes.
+        top_users (int): Users listed per document.
+        workers (int): Text extraction processes, every core when None.
+    """
+    # spaCy takes seconds to load, keep it out of --help and argument errors
+    from .scripts.document_parser import DocumentParser  # pylint: disable=import-outside-toplevel
+    from .scripts.skill_matcher import SkillMatcher  # pylint: disable=import-outside-toplevel
+
     start = time.time()
-    doc_parser = DocumentParser()
-    doc_parser.parse_document("C://Users//Doug Brown//Desktop//Dannys Stuff//Job//PreferredPartnerDB//files//sample-job-description.pdf")
+    doc_parser = DocumentParser(
+        batch_size=batch_size, n_process=n_process, extraction_workers=workers
+    )
+    skill_matcher = SkillMatcher()
+    if os.path.isdir(path):
+        parsed = doc_parser.parse_directory(path)
+    else:
+        parsed = [(path, doc_parser.parse_document(path))]
+
+    for filepath, doc in parsed:
+        skills, matched_users = skill_matcher.match_job_description(doc, limit=top_users)
+        print_matches(filepath, skills, matched_users)
     end = time.time()
     print("Execution time: ", end - start)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
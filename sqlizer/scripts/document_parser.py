@@ -1,50 +1,127 @@
 import os
+import time
+import logging
+from typing import Iterable, Iterator, Tuple
+
 import spacy
-from PyPDF2 import PdfReader  #pylint disable=import-error
+from spacy.tokens import Doc
+
+from .text_extraction import (
+    DEFAULT_CACHE_DIR, ExtractionPool, iter_pdf_pages, iter_docx_paragraphs)
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx')
+
+# Named entities and lemmas are not used by the parser, so skip computing them
+DISABLED_COMPONENTS = ["ner", "lemmatizer"]
+
+_nlp = None
+
+def get_nlp():
+    """
+    Return the shared spaCy pipeline, loading it on first use.
+
+    Loading en_core_web_sm takes far longer than processing a single job
+    description, so the model is loaded once per process and reused.
+    """
+    global _nlp  # pylint: disable=global-statement
+    if _nlp is None:
+        _nlp = spacy.load("en_core_web_sm", disable=DISABLED_COMPONENTS)
+    return _nlp
 
 class DocumentParser:
-    def __init__(self) -> None:
+    def __init__(
+            self, batch_size: int = 16, n_process: int = 1,
+            extraction_workers: int = None, cache_dir: str = DEFAULT_CACHE_DIR) -> None:
         self.filepath = None
-    
-    def parse_document(self, filepath):
+        self.batch_size = batch_size
+        self.n_process = n_process
+        self.extraction_pool = ExtractionPool(max_workers=extraction_workers, cache_dir=cache_dir)
+
+    def parse_document(self, filepath) -> Doc:
         self.filepath = filepath
-        ext = os.path.splitext(filepath)[1]
+        text = self.extract_text(filepath)
+        return get_nlp()(text)
+
+    def extract_text(self, filepath) -> str:
+        ext = os.path.splitext(filepath)[1].lower()
         if ext == '.pdf':
-            self._parse_pdf()
-        elif ext == '.docx':
-            self._parse_word()
-        else:
-            raise ValueError("Invalid filetype")
+            return PDFParser(filepath=filepath).extract_text()
+        if ext == '.docx':
+            return WordParser(filepath=filepath).extract_text()
+        raise ValueError("Invalid filetype")
+
+    def parse_documents(self, filepaths: Iterable[str]) -> Iterator[Tuple[str, Doc]]:
+        """
+        Parse many documents through a single nlp.pipe call.
+
+        Text is extracted by the process pool while spaCy works on the
+        documents that are already extracted.
+
+        Args:
+            filepaths (Iterable[str]): Paths of the PDF/DOCX files to parse.
 
-    def _parse_pdf(self):
-        pdf_parser = PDFParser(filepath=self.filepath)
-        text = pdf_parser.extract_text()
-        pdf_parser.extract_desired_skills(text)
+        Yields:
+            tuple: The file path and its processed spaCy Doc.
+        """
+        texts = (
+            (text, filepath) for filepath, text in self.extraction_pool.extract(filepaths)
+        )
+        docs = get_nlp().pipe(
+            texts, as_tuples=True, batch_size=self.batch_size, n_process=self.n_process
+        )
+        for doc, filepath in docs:
+            yield filepath, doc
 
-    def _parse_word(self):
-        pass
+    def parse_directory(self, directory: str) -> Iterator[Tuple[str, Doc]]:
+        """
+        Parse every PDF and DOCX file in a directory and report the throughput
+        once every document was consumed. Documents are yielded as they are
+        parsed, so the reported time includes the consumer's work.
+
+        Args:
+            directory (str): The folder containing the documents.
+
+        Yields:
+            tuple: The file path and its processed spaCy Doc.
+        """
+        filepaths = sorted(
+            os.path.join(directory, filename)
+            for filename in os.listdir(directory)
+            if os.path.splitext(filename)[1].lower() in SUPPORTED_EXTENSIONS
+        )
+
+        start = time.time()
+        document_count = 0
+        token_count = 0
+        for filepath, doc in self.parse_documents(filepaths):
+            document_count += 1
+            token_count += len(doc)
+            yield filepath, doc
+        elapsed = time.time() - start
+
+        docs_per_second = document_count / elapsed if elapsed else float("inf")
+        report = (
+            f"Parsed {document_count} documents ({token_count} tokens) in {elapsed:.2f} seconds "
+            f"({docs_per_second:.2f} documents/second)"
+        )
+        logging.info(report)
+        print(report)
+
+    @staticmethod
+    def print_tokens(doc: Doc) -> None:
+        for token in doc:
+            print(token.text, token.pos_, token.dep_, token.head.text)
 
 class PDFParser:
     def __init__(self, filepath) -> None:
         self.filepath = filepath
 
-    def _parse_pdf(self):
-        pass
-
     def extract_text(self):
-        text = ""
-        with open(self.filepath, "rb") as file:
-            reader = PdfReader(file)
-            for page in reader.pages:
-                text += page.extract_text()
-        return text
-    
-    def extract_desired_skills(self, job_description):
-        # Load the English language model
-        nlp = spacy.load("en_core_web_sm")
-
-        # Process the job description text
-        doc = nlp(job_description)
+        return "\n".join(iter_pdf_pages(self.filepath))
 
-        for token in doc:
-            print(token.text, token.pos_, token.dep_, token.head.text)
\ No newline at end of file
+class WordParser:
+    def __init__(self, filepath) -> None:
+        self.filepath = filepath
+
+    def extract_text(self):
+        return "\n".join(iter_docx_paragraphs(self.filepath))
@@ -0,0 +1,109 @@
+"""
+Match job descriptions against the skills stored in the database.
+
+The PhraseMatcher and the skill -> user_ids index are built once from the
+skills table. Matching a description is then a single linear scan of its
+tokens, and ranking users only touches the posting lists of the skills that
+were actually found.
+
+Usage:
+    >>> skill_matcher = SkillMatcher()
+    >>> skills = skill_matcher.extract_skills(job_description)
+    >>> top_users = skill_matcher.rank_users(skills, limit=10)
+"""
+import logging
+import time
+from collections import Counter, defaultdict
+from typing import Dict, List, Tuple, Union
+
+from spacy.matcher import PhraseMatcher
+from spacy.tokens import Doc
+
+from scrapers.src.database.scripts.database_manager import SkillsDatabaseManager
+from .document_parser import get_nlp
+
+class SkillMatcher:
+    def __init__(self, skills_db_manager: SkillsDatabaseManager = None) -> None:
+        self.skills_db_manager = skills_db_manager or SkillsDatabaseManager()
+        self.nlp = get_nlp()
+        self.matcher = PhraseMatcher(self.nlp.vocab, attr="LOWER")
+        # Normalized skill key -> display name as stored in the database
+        self.skill_names: Dict[str, str] = {}
+        self.skill_keys: Dict[str, str] = {}
+        # Normalized skill key -> ids of the users that list the skill
+        self.skill_index: Dict[str, frozenset] = {}
+        self._build()
+
+    @staticmethod
+    def _normalize(doc: Doc) -> str:
+        return " ".join(token.lower_ for token in doc)
+
+    def _build(self) -> None:
+        """Build the phrase matcher and the inverted index from the skills table."""
+        start = time.time()
+        skill_names = self.skills_db_manager.get_distinct_skill_names()
+
+        # Only the tokenizer is needed to build phrase patterns
+        keys_by_name = {}
+        for skill_name, pattern in zip(skill_names, self.nlp.tokenizer.pipe(skill_names)):
+            key = self._normalize(pattern)
+            keys_by_name[skill_name] = key
+            if key and key not in self.skill_names:
+                self.skill_names[key] = pattern.text
+                self.skill_keys[pattern.text] = key
+                self.matcher.add(key, [pattern])
+
+        users_by_skill = defaultdict(set)
+        for skill_name, user_id in self.skills_db_manager.get_skill_user_pairs():
+            key = keys_by_name.get(skill_name)
+            if key:
+                users_by_skill[key].add(user_id)
+        self.skill_index = {key: frozenset(user_ids) for key, user_ids in users_by_skill.items()}
+
+        logging.info(
+            "Built skill matcher with %s skills in %.2f seconds",
+            len(self.skill_names), time.time() - start
+        )
+
+    def extract_skills(self, job_description: Union[str, Doc]) -> Counter:
+        """
+        Find the known skills mentioned in a job description.
+
+        Args:
+            job_description (str | Doc): Raw text or an already processed Doc.
+
+        Returns:
+            Counter: Skill display name -> number of mentions.
+        """
+        if isinstance(job_description, str):
+            job_description = self.nlp.make_doc(job_description)
+
+        skills = Counter()
+        for match_id, _, _ in self.matcher(job_description):
+            key = self.nlp.vocab.strings[match_id]
+            skills[self.skill_names[key]] += 1
+
+        return skills
+
+    def rank_users(self, skills: Counter, limit: int = 25) -> List[Tuple[int, int]]:
+        """
+        Rank users by how many of the matched skills they have.
+
+        Args:
+            skills (Counter): Output of extract_skills.
+            limit (int): Number of users to return.
+
+        Returns:
+            list: (user_id, number of overlapping skills), best match first.
+        """
+        overlap = Counter()
+        for skill_name in skills:
+            key = self.skill_keys[skill_name]
+            overlap.update(self.skill_index.get(key, ()))
+
+        return overlap.most_common(limit)
+
+    def match_job_description(self, job_description: Union[str, Doc], limit: int = 25):
+        """Return the matched skills and the ranked users for a job description."""
+        skills = self.extract_skills(job_description)
+        return skills, self.rank_users(skills, limit=limit)
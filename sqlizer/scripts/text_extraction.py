@@ -0,0 +1,196 @@
+"""
+Parallel text extraction for PDF and DOCX documents.
+
+Extraction runs in a process pool so large batches use every core. Each
+worker streams a document page by page (paragraph by paragraph for DOCX)
+straight into an on-disk cache keyed by the SHA-256 of the file, so a
+document is never held twice in a worker and files that were already
+extracted are skipped entirely. Results are handed to the NLP stage through
+a bounded queue, which stops the pool from running far ahead of spaCy. When
+the consumer stops early, the documents that have not started are cancelled.
+
+Usage:
+    >>> pool = ExtractionPool(max_workers=8)
+    >>> for filepath, text in pool.extract(filepaths):
+    ...     process(text)
+"""
+import os
+import hashlib
+import logging
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, Optional, Tuple
+
+from PyPDF2 import PdfReader  #pylint disable=import-error
+from docx import Document  #pylint disable=import-error
+
+DEFAULT_CACHE_DIR = os.path.join("sqlizer", "cache")
+
+_DONE = object()
+
+# How often a feeder blocked on a full queue checks whether the consumer left
+_PUT_TIMEOUT_SECONDS = 0.5
+
+def iter_pdf_pages(filepath: str) -> Iterator[str]:
+    """Yield the text of a PDF one page at a time."""
+    with open(filepath, "rb") as file:
+        reader = PdfReader(file)
+        for page in reader.pages:
+            yield page.extract_text() or ""
+
+def iter_docx_paragraphs(filepath: str) -> Iterator[str]:
+    """Yield the text of a DOCX one paragraph at a time."""
+    document = Document(filepath)
+    for paragraph in document.paragraphs:
+        yield paragraph.text
+
+def iter_document_text(filepath: str) -> Iterator[str]:
+    """Yield the text of a PDF or DOCX in pieces."""
+    ext = os.path.splitext(filepath)[1].lower()
+    if ext == '.pdf':
+        return iter_pdf_pages(filepath)
+    if ext == '.docx':
+        return iter_docx_paragraphs(filepath)
+    raise ValueError("Invalid filetype")
+
+def file_hash(filepath: str, block_size: int = 1 << 20) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as file:
+        for block in iter(lambda: file.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+class TextCache:
+    """Extracted text stored on disk, one file per document hash."""
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR) -> None:
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def path(self, digest: str) -> str:
+        return os.path.join(self.cache_dir, f"{digest}.txt")
+
+    def contains(self, digest: str) -> bool:
+        return os.path.exists(self.path(digest))
+
+    def read(self, digest: str) -> str:
+        with open(self.path(digest), mode="r", encoding="utf-8") as cache_file:
+            return cache_file.read()
+
+    def write_pieces(self, digest: str, pieces: Iterable[str]) -> str:
+        """Write text pieces to the cache as they are produced and return the cache path."""
+        path = self.path(digest)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, mode="w", encoding="utf-8") as cache_file:
+            for piece in pieces:
+                cache_file.write(piece)
+                cache_file.write("\n")
+        # Atomic so a concurrent reader never sees a half-written file
+        os.replace(temporary_path, path)
+        return path
+
+def extract_document(filepath: str, cache_dir: str = DEFAULT_CACHE_DIR) -> Tuple[str, str, bool]:
+    """
+    Extract one document into the text cache. Runs inside a pool worker.
+
+    Returns:
+        tuple: The file path, its content hash and whether it was already cached.
+    """
+    cache = TextCache(cache_dir)
+    digest = file_hash(filepath)
+    if cache.contains(digest):
+        return filepath, digest, True
+
+    cache.write_pieces(digest, iter_document_text(filepath))
+    return filepath, digest, False
+
+class ExtractionPool:
+    """
+    Extracts documents in a process pool and hands the text over through a bounded queue.
+
+    Args:
+        max_workers (int): Number of extraction processes. Defaults to every core.
+        queue_size (int): Maximum number of extracted documents waiting for the consumer.
+        cache_dir (str): Directory of the on-disk text cache.
+    """
+    def __init__(
+            self, max_workers: Optional[int] = None,
+            queue_size: Optional[int] = None, cache_dir: str = DEFAULT_CACHE_DIR) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.queue_size = queue_size or 2 * self.max_workers
+        self.cache = TextCache(cache_dir)
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @staticmethod
+    def _put(results: queue.Queue, item, stop: threading.Event) -> bool:
+        """Put an item on the queue, waiting while it is full. Returns False once stop is set."""
+        while not stop.is_set():
+            try:
+                results.put(item, timeout=_PUT_TIMEOUT_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _feed(self, filepaths: Iterable[str], results: queue.Queue, stop: threading.Event) -> None:
+        """Submit documents to the pool, keeping at most queue_size of them in flight."""
+        try:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                in_flight = deque()
+                for filepath in filepaths:
+                    in_flight.append(
+                        (filepath, executor.submit(extract_document, filepath, self.cache.cache_dir))
+                    )
+                    # Blocks while the consumer is behind
+                    if len(in_flight) >= self.queue_size and not self._put(results, in_flight.popleft(), stop):
+                        break
+                while in_flight and self._put(results, in_flight.popleft(), stop):
+                    pass
+                if stop.is_set():
+                    executor.shutdown(cancel_futures=True)
+        finally:
+            self._put(results, _DONE, stop)
+
+    def extract(self, filepaths: Iterable[str]) -> Iterator[Tuple[str, str]]:
+        """
+        Extract documents in parallel.
+
+        Args:
+            filepaths (Iterable[str]): Paths of the PDF/DOCX files.
+
+        Yields:
+            tuple: The file path and its extracted text, in input order.
+        """
+        results = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        feeder = threading.Thread(target=self._feed, args=(filepaths, results, stop), daemon=True)
+        feeder.start()
+
+        try:
+            while True:
+                item = results.get()
+                if item is _DONE:
+                    break
+                filepath, future = item
+                try:
+                    _, digest, cached = future.result()
+                except Exception:  # pylint: disable=broad-except
+                    logging.error("Failed to extract text from %s", filepath, exc_info=True)
+                    continue
+
+                if cached:
+                    self.cache_hits += 1
+                else:
+                    self.cache_misses += 1
+                yield filepath, self.cache.read(digest)
+        finally:
+            # Also runs when the consumer stops early: unblock the feeder and let it cancel the rest
+            stop.set()
+            feeder.join()
+        logging.info(
+            "Text extraction finished: %s cached, %s extracted",
+            self.cache_hits, self.cache_misses
+        )
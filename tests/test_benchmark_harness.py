@@ -0,0 +1,20 @@
+"""
+Selection of the results file that benchmarks.compare compares with the baseline.
+"""
+import os
+
+from benchmarks.harness import latest_results_file
+
+def test_latest_results_file_is_the_newest_and_never_the_baseline(tmp_path):
+    run = tmp_path / "20261019-120000.json"
+    baseline = tmp_path / "baseline.json"
+    run.write_text("{}")
+    baseline.write_text("{}")
+    os.utime(run, (1_000, 1_000))
+    os.utime(baseline, (2_000, 2_000))
+
+    assert latest_results_file(str(tmp_path), exclude=str(baseline)) == str(run)
+
+    newer_run = tmp_path / "20261019-130000.json"
+    newer_run.write_text("{}")
+    assert latest_results_file(str(tmp_path), exclude=str(baseline)) == str(newer_run)
@@ -0,0 +1,53 @@
+"""
+The execute_values backfills report every row they updated, not only the last page.
+"""
+from types import SimpleNamespace
+
+from scrapers.src.database.scripts.database_manager import CompanyDatabaseManager, TitleDatabaseManager
+
+class StubCursor:
+    """Counts the VALUES rows of each statement as the rows it updated."""
+    connection = SimpleNamespace(encoding="UTF8")
+
+    def __init__(self):
+        self.statements = 0
+        self.rowcount = -1
+
+    def mogrify(self, template, args):
+        return b"(" + b", ".join(repr(arg).encode() for arg in args) + b")"
+
+    def execute(self, sql):
+        self.statements += 1
+        self.rowcount = sql.count(b"),(") + 1
+
+    def fetchall(self):
+        return []
+
+class StubTransaction:
+    def __init__(self, cursor):
+        self.cursor = cursor
+
+    def __enter__(self):
+        return self.cursor
+
+    def __exit__(self, *exc_info):
+        return False
+
+def manager_with(manager_class, cursor):
+    manager = manager_class.__new__(manager_class)
+    manager.transaction = lambda operation: StubTransaction(cursor)
+    return manager
+
+def test_link_work_experience_counts_every_page():
+    cursor = StubCursor()
+    company_ids = [(f"company {i}", i) for i in range(2500)]
+
+    assert manager_with(CompanyDatabaseManager, cursor).link_work_experience(company_ids) == 2500
+    assert cursor.statements == 1
+
+def test_update_normalized_titles_counts_every_page():
+    cursor = StubCursor()
+    normalized_titles = [(f"title {i}", f"title {i}", None, None) for i in range(2500)]
+
+    assert manager_with(TitleDatabaseManager, cursor).update_normalized_titles(normalized_titles) == 2500
+    assert cursor.statements == 1
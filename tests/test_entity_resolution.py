@@ -0,0 +1,31 @@
+"""
+Scoring of user pairs by EntityResolver.
+"""
+from scrapers.src.database.scripts.entity_resolution import EntityResolver, UserRecord
+
+def user(user_id, email=None, phone_number=None, alumni_url=None, users_name="John Smith"):
+    return UserRecord(
+        user_id=user_id, users_name=users_name, location_of_user="Durham, North Carolina",
+        email=email, phone_number=phone_number, profile_url=None, alumni_url=alumni_url,
+        sources=["duke_alumni"],
+    )
+
+def test_namesakes_with_different_webmail_addresses_are_not_merged():
+    left = user(1, email="john.smith1984@gmail.com", alumni_url="https://alumni.duke.edu/1")
+    right = user(2, email="jsmith.nc@gmail.com")
+
+    assert EntityResolver.score(left, right) < 0.8
+    assert EntityResolver().resolve([left, right]) == []
+
+def test_same_email_is_merged():
+    left = user(1, email="John.Smith@reli.com", alumni_url="https://alumni.duke.edu/1")
+    right = user(2, email="john.smith@reli.com")
+
+    clusters = EntityResolver().resolve([left, right])
+    assert [[record.user_id for record in cluster] for cluster, _ in clusters] == [[1, 2]]
+
+def test_different_emails_with_the_same_phone_are_merged():
+    left = user(1, email="john.smith1984@gmail.com", phone_number="(919) 555-0100")
+    right = user(2, email="jsmith@reli.com", phone_number="+1 919 555 0100")
+
+    assert EntityResolver.score(left, right) >= 0.8
@@ -0,0 +1,55 @@
+"""
+The work_experience queries render to valid SQL for current positions, whose
+end date is NULL.
+"""
+import re
+
+import pytest
+from psycopg2.extensions import adapt
+
+from scrapers.src.bots.linkedin.utils.experience_text.experience_text import parse_date_range
+from scrapers.src.database.scripts.database_manager import LinkedInDatabaseManager
+
+def render(query, params):
+    """Substitute the parameters the way psycopg2 quotes them."""
+    return query % tuple(adapt(param).getquoted().decode() for param in params)
+
+@pytest.fixture
+def executed():
+    """A LinkedInDatabaseManager without a connection that records its queries."""
+    manager = LinkedInDatabaseManager.__new__(LinkedInDatabaseManager)
+    queries = []
+
+    def execute_query(query, params=None, fetch=None):
+        queries.append(render(query, params))
+        return (0,) if fetch == "ONE" else None
+
+    manager.execute_query = execute_query
+    return manager, queries
+
+@pytest.mark.parametrize("description", ["Led the platform team", None])
+def test_several_roles_at_one_company_with_a_current_role(executed, description):
+    manager, queries = executed
+    zipped_list = [(
+        "Reli", ["Staff Engineer", "Engineer"], [description, description],
+        [parse_date_range("Mar 2022 - Present"), parse_date_range("Jan 2018 - Feb 2022")],
+        "Durham, North Carolina",
+    )]
+
+    manager.update_experiences_in_database(user_id=7, zipped_list=zipped_list)
+
+    assert "end_date IS NOT DISTINCT FROM NULL AND location_of_job" in queries[0]
+    for query in queries:
+        assert not re.search(r"[^\s(]AND\b", query), query
+
+@pytest.mark.parametrize("description", ["Led the platform team", None])
+def test_a_single_current_role(executed, description):
+    manager, queries = executed
+    zipped_list = [
+        ("Reli", "Engineer", description, parse_date_range("Mar 2022 - Present"), "Durham, North Carolina")
+    ]
+
+    manager.update_experiences_in_database(user_id=7, zipped_list=zipped_list)
+
+    for query in queries:
+        assert not re.search(r"[^\s(]AND\b", query), query
@@ -0,0 +1,29 @@
+"""
+Date ranges parsed from LinkedIn keep the precision of each date by position.
+"""
+from scrapers.src.bots.linkedin.utils.experience_text.experience_text import DateRange, parse_date_range
+from scrapers.src.database.scripts.database_manager import LinkedInDatabaseManager
+
+def test_each_date_keeps_its_own_precision_when_both_are_the_same_day():
+    dates = parse_date_range("Jan 2018 - 2018 · 1 yr")
+
+    assert dates == ["2018-01-01", "2018-01-01"]
+    assert (dates.start_precision, dates.end_precision) == ("month", "year")
+    assert LinkedInDatabaseManager._date_columns(dates) == (
+        "2018-01-01", "2018-01-01", "month", "year", False
+    )
+
+def test_present_is_an_open_end():
+    dates = parse_date_range("Mar 2018 - Present · 6 yrs 2 mos")
+
+    assert LinkedInDatabaseManager._date_columns(dates) == ("2018-03-01", None, "month", None, True)
+
+def test_a_single_date_is_the_end_date():
+    dates = parse_date_range("2018").pair()
+
+    assert dates == [None, "2018-01-01"]
+    assert (dates.start_precision, dates.end_precision) == (None, "year")
+
+def test_plain_lists_have_no_precision():
+    assert LinkedInDatabaseManager._date_columns(["2018-01-01"]) == (None, "2018-01-01", None, None, False)
+    assert DateRange([None, None]).pair().precisions == [None, None]
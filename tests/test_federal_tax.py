@@ -0,0 +1,21 @@
+"""
+The federal tax table is cleaned into numbers, whatever dtype pandas reads the text as.
+"""
+import os
+
+import pandas as pd
+
+from scrapers.src.bots.linkedin.utils.salary_calculator.get_salary_estimate import FederalTaxCalculator
+
+FEDERAL_TAX_CSV = os.path.join(
+    "scrapers", "src", "bots", "linkedin", "utils", "salary_calculator", "federal_income_tax_date.csv"
+)
+
+def test_bracket_lookup_on_the_cleaned_table():
+    calculator = FederalTaxCalculator(100_000, "2015-01-01", "2023-01-01")
+    table = calculator.filter_by_year(calculator.clean_federal_tax_csv(pd.read_csv(FEDERAL_TAX_CSV)), 2023)
+
+    assert pd.api.types.is_float_dtype(table["Single Filer Salary"])
+    brackets = calculator.locate_tax_bracket(table, 50_000)
+    assert brackets["Married Filing Jointly"] == 0.12
+    assert brackets["Single Filer"] == 0.22
@@ -0,0 +1,35 @@
+"""
+PageLookupCache serves lookups until the page changes, including changes in place.
+"""
+import pytest
+
+from scrapers.src.bots.webdriver.fake_webdriver import FakeWebDriverManager
+
+PAGE = """<html><body>
+<ul><li><span aria-hidden="true">Python</span></li><li><span aria-hidden="true">SQL</span></li></ul>
+<a href="https://www.linkedin.com/in/a/">A</a>
+</body></html>"""
+
+SKILLS_XPATH = "//li/span[@aria-hidden='true']"
+
+@pytest.fixture
+def browser(tmp_path):
+    page = tmp_path / "skills.html"
+    page.write_text(PAGE, encoding="utf-8")
+    browser = FakeWebDriverManager({})
+    browser.driver.get(page.as_uri())
+    return browser
+
+def test_lookups_are_cached_on_an_unchanged_page(browser):
+    assert browser.page_cache.xpath_texts(SKILLS_XPATH) == ["Python", "SQL"]
+    assert browser.page_cache.xpath_texts(SKILLS_XPATH) == ["Python", "SQL"]
+    assert (browser.page_cache.hits, browser.page_cache.misses) == (1, 1)
+
+def test_content_changed_in_place_invalidates_the_cache(browser):
+    assert browser.page_cache.xpath_texts(SKILLS_XPATH) == ["Python", "SQL"]
+
+    # Same elements, new text, as when "see more" expands a section
+    browser.driver.document.root.xpath(SKILLS_XPATH)[1].text = "PostgreSQL"
+
+    assert browser.page_cache.xpath_texts(SKILLS_XPATH) == ["Python", "PostgreSQL"]
+    assert browser.page_cache.misses == 2
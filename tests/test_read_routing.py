@@ -0,0 +1,115 @@
+"""
+Routing of queries between the primary and the read replica.
+"""
+import pytest
+
+from scrapers.src.database.scripts import database_manager
+from scrapers.src.database.scripts.database_manager import (
+    DatabaseManager, ProfileWriteSession, RoutingPolicy, is_read_only_query
+)
+
+class StubConnection:
+    """A psycopg2 connection that records the queries run on it."""
+    def __init__(self, profile):
+        self.profile = profile
+        self.closed = 0
+        self.queries = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def cursor(self):
+        return self
+
+    def execute(self, query, params=None):
+        self.queries.append(query)
+
+    def fetchall(self):
+        return []
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+class StubConnector:
+    """Stands in for connect_to_db.connect; the replica can be made unreachable."""
+    def __init__(self):
+        self.replica_up = True
+        self.attempts = {"primary": 0, "replica": 0}
+
+    def __call__(self, profile=None):
+        self.attempts[profile] += 1
+        if profile == "replica" and not self.replica_up:
+            return None
+        return StubConnection(profile)
+
+@pytest.fixture
+def connector(monkeypatch):
+    stub = StubConnector()
+    monkeypatch.setattr(database_manager, "connect", stub)
+    return stub
+
+@pytest.fixture
+def manager(connector):
+    return DatabaseManager(routing=RoutingPolicy(primary="primary", replica="replica", replica_retry_seconds=60))
+
+@pytest.mark.parametrize("query", [
+    "SELECT * FROM users WHERE user_id = %s",
+    "  with recent AS (SELECT * FROM users) SELECT * FROM recent",
+])
+def test_read_only_queries(query):
+    assert is_read_only_query(query)
+
+def test_a_keyword_in_a_literal_errs_towards_the_primary():
+    assert not is_read_only_query("SELECT user_id FROM users WHERE users_name = 'Update Smith'")
+
+@pytest.mark.parametrize("query", [
+    "WITH inserted AS (INSERT INTO users (users_name) VALUES (%s) RETURNING user_id) SELECT * FROM inserted",
+    "WITH gone AS (DELETE FROM skills WHERE user_id = %s RETURNING *) SELECT count(*) FROM gone",
+    "SELECT * FROM bots WHERE bot_id = %s FOR UPDATE",
+    "SELECT * FROM bots FOR NO KEY UPDATE SKIP LOCKED",
+    "SELECT * FROM bots FOR SHARE",
+    "SELECT setval('users_user_id_seq', 42)",
+    "SELECT nextval('users_user_id_seq')",
+    "SET LOCAL statement_timeout = 0; SELECT * FROM users",
+    "INSERT INTO users (users_name) VALUES (%s)",
+])
+def test_queries_that_write_or_lock(query):
+    assert not is_read_only_query(query)
+
+def test_reads_go_to_the_replica_and_writes_to_the_primary(manager):
+    manager.execute_query("SELECT * FROM users", fetch="ALL")
+    manager.execute_query("UPDATE users SET users_name = %s", ("John Smith",))
+
+    assert manager.replica_conn.queries[-1] == "SELECT * FROM users"
+    assert manager.conn.queries[-1] == "UPDATE users SET users_name = %s"
+
+def test_reads_stay_on_the_primary_inside_a_profile_write_session(manager, connector):
+    with ProfileWriteSession():
+        assert ProfileWriteSession.active()
+        assert manager.read_connection() is manager.conn
+    assert not ProfileWriteSession.active()
+    assert connector.attempts["replica"] == 0
+
+    assert manager.read_connection() is manager.replica_conn
+    assert manager.replica_conn.profile == "replica"
+
+def test_unreachable_replica_falls_back_to_the_primary_for_the_retry_window(manager, connector, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(database_manager.time, "monotonic", lambda: now[0])
+    connector.replica_up = False
+
+    assert manager.read_connection() is manager.conn
+    now[0] += 59
+    assert manager.read_connection() is manager.conn
+    assert connector.attempts["replica"] == 1
+
+    connector.replica_up = True
+    now[0] += 2
+    assert manager.read_connection().profile == "replica"
+    assert connector.attempts["replica"] == 2
@@ -0,0 +1,65 @@
+"""
+A batch with a profile URL the browser rejects still completes, and so does
+the batch when it is resumed after a crash.
+"""
+from types import SimpleNamespace
+
+import pytest
+from selenium.common.exceptions import InvalidArgumentException
+
+from scrapers.src.bots.linkedin.scripts.linkedinbot import LinkedInBot
+from scrapers.src.bots.linkedin.utils.run_journal.run_journal import RunJournal
+from scrapers.src.bots.webdriver.wait_accounting import wait_accountant
+
+BAD_URL = "https://www.linkedin.com/in/not a url/"
+URLS = ["https://www.linkedin.com/in/a/", BAD_URL, "https://www.linkedin.com/in/b/"]
+
+class StubBot:
+    """The parts of LinkedInBot that _run_batch uses, without a browser or database."""
+    bot_id = 1
+
+    def __init__(self, crash_on=None):
+        self.sign_in_manager = SimpleNamespace(sign_in_wrapper=lambda bot_id: None)
+        self.profile_interactor = SimpleNamespace(get_profile_urls=lambda: list(URLS))
+        self.crash_on = crash_on
+        self.scraped = []
+
+    @staticmethod
+    def get_user_id(profile_url):
+        return URLS.index(profile_url) + 1
+
+    def scrape_profile(self, user_id, profile_url, stages, journal):
+        if all(journal.is_complete(profile_url, stage) for stage in stages):
+            return False
+        if profile_url == BAD_URL:
+            raise InvalidArgumentException("invalid argument")
+        if profile_url == self.crash_on:
+            raise KeyboardInterrupt
+        self.scraped.append(profile_url)
+        for stage in stages:
+            journal.mark_complete(profile_url, stage)
+        return True
+
+@pytest.fixture(autouse=True)
+def no_pacing(monkeypatch, tmp_path):
+    # RunJournal writes under ./scrapers/journals
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(wait_accountant, "pacing_sleeps", False)
+
+def test_invalid_url_does_not_abort_the_batch():
+    bot = StubBot()
+    LinkedInBot._run_batch(bot, run_name="test", stages=("main",))
+
+    assert bot.scraped == [URLS[0], URLS[2]]
+    assert RunJournal(bot_id=1, run_name="test").resume() is None
+
+def test_resumed_batch_skips_the_failed_url_and_completes():
+    crashed = StubBot(crash_on=URLS[2])
+    with pytest.raises(KeyboardInterrupt):
+        LinkedInBot._run_batch(crashed, run_name="test", stages=("main",))
+
+    resumed = StubBot()
+    LinkedInBot._run_batch(resumed, run_name="test", stages=("main",))
+
+    assert resumed.scraped == [URLS[2]]
+    assert RunJournal(bot_id=1, run_name="test").resume() is None
@@ -0,0 +1,17 @@
+"""
+Normalization of raw job titles.
+"""
+import pytest
+
+from scrapers.src.bots.linkedin.utils.title_normalizer.title_normalizer import NormalizedTitle, TitleNormalizer
+
+def test_abbreviations_and_levels():
+    assert TitleNormalizer.normalize("Sr. SWE") == NormalizedTitle("software engineer", "senior", "engineering")
+    assert TitleNormalizer.normalize("Software Engineer II") == NormalizedTitle("software engineer", "mid", "engineering")
+
+@pytest.mark.parametrize("job_title, seniority", [
+    ("Intern", "intern"), ("Senior", "senior"), ("Sr.", "senior"), ("Lead", "lead"),
+])
+def test_a_title_that_is_only_a_level_has_no_normalized_title(job_title, seniority):
+    # None rather than '', so COALESCE(normalized_title, job_title) keeps the raw title
+    assert TitleNormalizer.normalize(job_title) == NormalizedTitle(None, seniority, None)
@@ -0,0 +1,53 @@
+"""
+Spans of one run can be told apart from earlier runs in the same trace file,
+and bulk writes are traced.
+"""
+import pytest
+
+from scrapers.src.database.scripts.database_manager import DatabaseManager
+from scrapers.src.monitoring import tracing
+
+class StubConnection:
+    """A psycopg2 connection as far as DatabaseManager.transaction uses it."""
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def cursor(self):
+        return self
+
+@pytest.fixture
+def trace_file(tmp_path):
+    path = str(tmp_path / "traces.jsonl")
+    yield path
+    tracing.configure_tracing(None)
+
+def test_load_spans_keeps_only_the_current_run(trace_file):
+    tracing.configure_tracing(trace_file)
+    with tracing.span("profile", user_id=1):
+        pass
+    earlier_run = tracing.current_run_id()
+
+    tracing.configure_tracing(trace_file)
+    with tracing.span("profile", user_id=2):
+        with tracing.span("stage.skills"):
+            pass
+    tracing.configure_tracing(trace_file)  # Flushes and closes the file
+
+    assert len(tracing.load_spans(trace_file)) == 3
+    assert [record["attributes"] for record in tracing.load_spans(trace_file, run_id=earlier_run)] == [
+        {"user_id": 1}
+    ]
+
+def test_bulk_writes_are_traced(trace_file):
+    tracing.configure_tracing(trace_file)
+    manager = DatabaseManager.__new__(DatabaseManager)
+    manager.conn = StubConnection()
+    with manager.transaction("copy_chunk"):
+        pass
+    run_id = tracing.current_run_id()
+    tracing.configure_tracing(None)
+
+    assert [record["name"] for record in tracing.load_spans(trace_file, run_id=run_id)] == ["db.copy_chunk"]
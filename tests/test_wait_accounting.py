@@ -0,0 +1,36 @@
+"""
+AccountedWebDriverWait counts timeouts, and only timeouts, against the stage.
+"""
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+
+from scrapers.src.bots.webdriver.wait_accounting import AccountedWebDriverWait, WaitAccountant, wait_stage
+
+def stale(driver):
+    raise StaleElementReferenceException("stale element")
+
+@pytest.fixture
+def accountant():
+    return WaitAccountant(pacing_sleeps=False)
+
+def test_a_timeout_is_counted(accountant):
+    wait = AccountedWebDriverWait(None, 0.05, poll_frequency=0.01, accountant=accountant)
+    with wait_stage("skills"), pytest.raises(TimeoutException):
+        wait.until(lambda driver: False)
+
+    assert accountant.timeouts["skills"] == 1
+    assert accountant.condition_counts["skills"] == 1
+
+def test_other_errors_are_not_timeouts(accountant):
+    wait = AccountedWebDriverWait(None, 0.05, poll_frequency=0.01, accountant=accountant)
+    with wait_stage("skills"), pytest.raises(StaleElementReferenceException):
+        wait.until(stale)
+
+    assert accountant.timeouts["skills"] == 0
+    assert accountant.condition_counts["skills"] == 1
+
+def test_pace_records_without_sleeping(accountant):
+    with wait_stage("search"):
+        accountant.pace(30)
+
+    assert accountant.pacing_seconds["search"] == 30